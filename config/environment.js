@@ -112,6 +112,15 @@ class EnvironmentManager {
         return null; // PathManager 기본 경로 사용
     }
 
+    /**
+     * 시즌 연도 - KBO_SEASON 우선, 없으면 KST 기준 올해 (크롤러의 current_season()과 같은 규칙)
+     */
+    getSeason() {
+        const season = this.getNumber('KBO_SEASON', 0);
+        if (season) return season;
+        return new Date(Date.now() + 9 * 60 * 60 * 1000).getUTCFullYear();
+    }
+
     /**
      * 크롤링 설정
      */
@@ -124,13 +124,18 @@ class PathManager {
     }
 
     /**
-     * 현재 연도의 시즌 데이터 파일을 찾습니다
+     * 시즌별 data 파일 경로를 반환합니다 (예: 2025-season-games.json, 기본: 현재 시즌)
+     */
+    getSeasonDataFile(filename, year = environment.getSeason()) {
+        return this.getDataFile(`${year}-${filename}`);
+    }
+
+    /**
+     * 현재 시즌의 시즌 데이터 파일을 찾습니다
      */
     findSeasonDataFile() {
-        const currentYear = new Date().getFullYear();
         const possibleFiles = [
-            this.getDataFile(`${currentYear}-season-data-clean.txt`),
-            this.getDataFile('2025-season-data-clean.txt'),
+            this.getSeasonDataFile('season-data-clean.txt'),
             this.getDataFile('season-data-clean.txt'),
             this.getDataFile('clean.txt')
         ];
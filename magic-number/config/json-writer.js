@@ -0,0 +1,110 @@
+/**
+ * 생성 데이터 JSON 공용 저장기
+ * - 기본은 공백 없는(minified) JSON, KBO_JSON_DEBUG=true면 들여쓰기 2칸
+ * - 내용이 기존 파일과 같으면 쓰지 않음 (mtime 유지), 쓸 때는 임시 파일 → rename
+ * - 내용이 바뀌었거나 없을 때만 .gz/.br 사전 압축본 기록 (KBO_JSON_PRECOMPRESS=false로 끔)
+ * - KBO_JSON_COMPACT=true면 스키마 압축본(.compact.json, kbo-compact/1)도 기록
+ */
+
+const fs = require('fs');
+const path = require('path');
+const zlib = require('zlib');
+const JsonCompact = require('../scripts/util-json-compact');
+
+const COMPRESSORS = {
+    '.gz': buffer => zlib.gzipSync(buffer, { level: zlib.constants.Z_BEST_COMPRESSION }),
+    '.br': buffer => zlib.brotliCompressSync(buffer, {
+        params: {
+            [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+            [zlib.constants.BROTLI_PARAM_MODE]: zlib.constants.BROTLI_MODE_TEXT,
+            [zlib.constants.BROTLI_PARAM_SIZE_HINT]: buffer.length
+        }
+    })
+};
+
+function envFlag(name, fallback) {
+    const value = process.env[name];
+    if (value === undefined || value === '') {
+        return fallback;
+    }
+    return ['1', 'true', 'yes', 'on'].includes(value.toLowerCase());
+}
+
+/**
+ * foo.json → foo.compact.json
+ */
+function compactPathFor(filePath) {
+    return filePath.replace(/(\.json)?$/, '.compact.json');
+}
+
+/**
+ * 내용이 같으면 false, 다르거나 없으면 임시 파일에 쓴 뒤 rename하고 true
+ */
+function writeIfChanged(filePath, buffer) {
+    try {
+        const existing = fs.readFileSync(filePath);
+        if (existing.equals(buffer)) {
+            return false;
+        }
+    } catch (error) {
+        if (error.code !== 'ENOENT') {
+            throw error;
+        }
+    }
+
+    fs.mkdirSync(path.dirname(filePath), { recursive: true });
+    const tmpPath = path.join(path.dirname(filePath), `.${path.basename(filePath)}.${process.pid}.tmp`);
+    fs.writeFileSync(tmpPath, buffer);
+    fs.renameSync(tmpPath, filePath);
+    return true;
+}
+
+/**
+ * 본문이 바뀌었거나 압축본이 없을 때만 .gz/.br 기록
+ */
+function writeCompressed(filePath, buffer, changed) {
+    for (const [extension, compress] of Object.entries(COMPRESSORS)) {
+        const target = filePath + extension;
+        if (changed || !fs.existsSync(target)) {
+            writeIfChanged(target, compress(buffer));
+        }
+    }
+}
+
+function writeEncoded(filePath, text, compress) {
+    const buffer = Buffer.from(text, 'utf8');
+    const changed = writeIfChanged(filePath, buffer);
+    if (compress) {
+        writeCompressed(filePath, buffer, changed);
+    }
+    return { changed, bytes: buffer.length };
+}
+
+/**
+ * 생성 데이터 저장 - { changed, bytes } 반환
+ *
+ * options.pretty   - 들여쓰기 출력 (기본: KBO_JSON_DEBUG)
+ * options.compress - .gz/.br 사전 압축본 기록 (기본: KBO_JSON_PRECOMPRESS, 켜짐)
+ * options.compact  - .compact.json 스키마 압축본 기록 (기본: KBO_JSON_COMPACT, 꺼짐)
+ */
+function writeJson(filePath, data, options = {}) {
+    const pretty = options.pretty !== undefined ? options.pretty : envFlag('KBO_JSON_DEBUG', false);
+    const compress = options.compress !== undefined ? options.compress : envFlag('KBO_JSON_PRECOMPRESS', true);
+    const compact = options.compact !== undefined ? options.compact : envFlag('KBO_JSON_COMPACT', false);
+
+    const text = pretty ? JSON.stringify(data, null, 2) : JSON.stringify(data);
+    const result = writeEncoded(filePath, text, compress);
+
+    if (compact) {
+        // 직렬화 결과를 다시 읽어 인코딩 - undefined/toJSON 등이 원본 JSON과 똑같이 정리됨
+        const encoded = JsonCompact.encode(JSON.parse(text));
+        const compactText = pretty ? JSON.stringify(encoded, null, 2) : JSON.stringify(encoded);
+        result.compact = writeEncoded(compactPathFor(filePath), compactText, compress);
+    }
+    return result;
+}
+
+module.exports = {
+    writeJson,
+    compactPathFor
+};
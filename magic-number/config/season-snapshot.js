@@ -0,0 +1,109 @@
+/**
+ * KBO 시즌 데이터 컬럼형 스냅샷(.snap) 리더
+ * 크롤러(kbo_season_snapshot.py)가 시즌 텍스트 파일 옆에 기록한 스냅샷을
+ * 텍스트 파싱 없이 TypedArray 뷰로 읽음 - 원본 해시가 다르면(stale) null 반환
+ */
+
+const crypto = require('crypto');
+const fs = require('fs');
+const os = require('os');
+
+const SNAPSHOT_MAGIC = 'KBOSNAP1';
+const SNAPSHOT_VERSION = 1;
+const TYPED_ARRAYS = { uint32: Uint32Array, uint16: Uint16Array, int16: Int16Array };
+
+/**
+ * 2025-season-data-clean.txt → 2025-season-data-clean.snap
+ */
+function snapshotPathFor(seasonFile) {
+    return seasonFile.replace(/\.txt$/, '') + '.snap';
+}
+
+function fileSha256(filePath) {
+    return crypto.createHash('sha256').update(fs.readFileSync(filePath)).digest('hex');
+}
+
+class SeasonSnapshot {
+    constructor(buffer, meta) {
+        this.buffer = buffer;
+        this.meta = meta;
+        this.rows = meta.rows;
+        this.strings = meta.strings;
+        this.columnsByName = {};
+        for (const column of meta.columns) {
+            this.columnsByName[column.name] = column;
+        }
+    }
+
+    /**
+     * 컬럼 배열 (파일 버퍼를 그대로 가리키는 TypedArray, 복사 없음)
+     */
+    column(name) {
+        const { dtype, offset } = this.columnsByName[name];
+        const ArrayType = TYPED_ARRAYS[dtype];
+        return new ArrayType(this.buffer.buffer, this.buffer.byteOffset + offset, this.rows);
+    }
+
+    /**
+     * 문자열 컬럼 값 (사전 인덱스 → 문자열)
+     */
+    stringColumn(name) {
+        return Array.from(this.column(name), idx => this.strings[idx]);
+    }
+
+    /**
+     * { date, parts } 순회 - parts는 텍스트 줄을 공백으로 나눈 결과와 같은 토큰 배열
+     * (시간 상태 구장 홈팀 어웨이팀 점수 방송사... 구분)
+     */
+    *entries() {
+        const dates = this.column('date');
+        const [time, state, stadium, homeTeam, awayTeam, score, tv, sort] =
+            ['time', 'state', 'stadium', 'home_team', 'away_team', 'score', 'tv', 'sort'].map(name => this.stringColumn(name));
+        const split = value => value.split(/\s+/).filter(Boolean);
+
+        for (let i = 0; i < this.rows; i++) {
+            const ymd = String(dates[i]);
+            yield {
+                date: `${ymd.slice(0, 4)}-${ymd.slice(4, 6)}-${ymd.slice(6, 8)}`,
+                parts: [time[i], state[i], stadium[i], homeTeam[i], awayTeam[i], score[i], ...split(tv[i]), ...split(sort[i])]
+            };
+        }
+    }
+}
+
+/**
+ * 시즌 파일의 스냅샷 로드 - 없거나, 형식/버전이 다르거나, 원본 내용과 다르면 null
+ */
+function loadSeasonSnapshot(seasonFile) {
+    const snapshotFile = snapshotPathFor(seasonFile);
+    if (os.endianness() !== 'LE' || !fs.existsSync(snapshotFile)) {
+        return null;
+    }
+
+    try {
+        let buffer = fs.readFileSync(snapshotFile);
+        if (buffer.toString('latin1', 0, 8) !== SNAPSHOT_MAGIC) {
+            return null;
+        }
+        // TypedArray 뷰는 정렬된 offset이 필요 - 풀 버퍼에서 어긋난 경우만 복사
+        if (buffer.byteOffset % 8 !== 0) {
+            const aligned = new Uint8Array(buffer.length);
+            aligned.set(buffer);
+            buffer = Buffer.from(aligned.buffer);
+        }
+        const headerLength = buffer.readUInt32LE(8);
+        const meta = JSON.parse(buffer.toString('utf8', 12, 12 + headerLength));
+        if (meta.version !== SNAPSHOT_VERSION || meta.source_sha256 !== fileSha256(seasonFile)) {
+            return null;
+        }
+        return new SeasonSnapshot(buffer, meta);
+    } catch (error) {
+        return null;
+    }
+}
+
+module.exports = {
+    SeasonSnapshot,
+    loadSeasonSnapshot,
+    snapshotPathFor
+};
@@ -0,0 +1,45 @@
+/**
+ * KBO 순위/상대전적 증분 상태 리더
+ * 크롤러(kbo_standings_engine.py)가 저장 단계의 변경분만 반영해 기록한
+ * {year}-standings-state.json을 읽음 - 원본 해시가 다르면(stale) null 반환
+ */
+
+const crypto = require('crypto');
+const fs = require('fs');
+
+const STATE_VERSION = 1;
+
+/**
+ * 2025-season-data-clean.txt → 2025-standings-state.json
+ */
+function standingsStatePathFor(seasonFile) {
+    return seasonFile.replace(/-season-data-clean\.txt$/, '-standings-state.json');
+}
+
+/**
+ * 시즌 파일의 순위 상태 로드 - 없거나, 버전이 다르거나, 원본 내용과 다르면 null
+ *
+ * { teams: {팀: {games, wins, ...}}, headToHead: {팀: {상대: {...}}}, results: {팀: [[날짜, 시간, '승'|'패'|'무']]}, gameCount }
+ */
+function loadStandingsState(seasonFile) {
+    const stateFile = standingsStatePathFor(seasonFile);
+    if (stateFile === seasonFile || !fs.existsSync(stateFile)) {
+        return null;
+    }
+
+    try {
+        const state = JSON.parse(fs.readFileSync(stateFile, 'utf8'));
+        const sourceSha = crypto.createHash('sha256').update(fs.readFileSync(seasonFile)).digest('hex');
+        if (state.version !== STATE_VERSION || state.source_sha256 !== sourceSha) {
+            return null;
+        }
+        return state;
+    } catch (error) {
+        return null;
+    }
+}
+
+module.exports = {
+    loadStandingsState,
+    standingsStatePathFor
+};
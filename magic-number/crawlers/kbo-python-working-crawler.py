@@ -8,70 +8,362 @@ from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 import re
 import subprocess
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 import sys
 from pathlib import Path
 import calendar
+import argparse
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # PathManager 추가 - config 디렉토리를 Python path에 추가
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'config'))
 from paths import get_path_manager
 
+# 크롤러 보조 모듈 (같은 디렉토리)
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from kbo_metrics import KST, RunMetrics, current_season
+from kbo_month_fingerprints import MonthFingerprints, MonthNotModified, plan_months, rows_fingerprint
+from kbo_parsers import Bs4ScheduleParser, get_parser, iter_dated_rows
+from kbo_season_snapshot import load_snapshot, write_snapshot
+from kbo_season_store import CANCELLED_STATES, FINISHED_STATES, GameRecord, SeasonCache, season_file_name
+from kbo_standings_engine import StandingsEngine, standings_state_path
+from kbo_game_states import (DedupAction, GameState, LIVE_INNING, PREGAME_STATES, SeasonDiff,
+                             classify_state, dedup_action, diff_games, game_key)
+
 
 def run_post_crawl_processing():
-    """크롤링 완료 후 자동으로 데이터 처리 및 분석 스크립트 실행"""
+    """크롤링 완료 후 자동으로 데이터 처리 및 분석 파이프라인 실행
+
+    util-pipeline.js가 처리/분석/사전계산 단계를 한 Node 프로세스 안에서
+    의존 순서대로 실행하고, 입력이 바뀌지 않은 단계는 건너뜀
+    """
     try:
         # 프로젝트 루트 디렉토리 찾기
         project_root = Path(__file__).resolve().parent.parent.parent
         os.chdir(project_root)
 
-        print("📊 1단계: 시즌 데이터 처리...")
-        result = subprocess.run(['npm', 'run', 'process'], capture_output=True, text=True)
+        print("📊 후처리 파이프라인 실행 (시즌 데이터 처리 → 분석 → 매직넘버 → UI 사전계산)...")
+        result = subprocess.run(['node', 'magic-number/scripts/util-pipeline.js'])
         if result.returncode == 0:
-            print("✅ 시즌 데이터 처리 완료")
+            print("🎉 모든 후처리 작업 완료!")
         else:
-            print(f"❌ 시즌 데이터 처리 실패: {result.stderr}")
-            return
+            print(f"❌ 후처리 파이프라인 일부 단계 실패 (종료 코드 {result.returncode})")
+            print("💡 수동으로 다시 실행해주세요: npm run pipeline")
 
-        print("📈 2단계: 매직넘버 계산...")
-        result = subprocess.run(['npm', 'run', 'rank-matrix'], capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ 매직넘버 계산 완료")
-        else:
-            print(f"❌ 매직넘버 계산 실패: {result.stderr}")
+    except Exception as e:
+        print(f"❌ 후처리 작업 중 오류 발생: {e}")
+        print("💡 수동으로 다음 명령어를 실행해주세요:")
+        print("   npm run pipeline")
 
-        print("⚡ 3단계: UI 최적화 사전계산...")
-        result = subprocess.run(['npm', 'run', 'precompute-matrix'], capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ UI 사전계산 완료")
-        else:
-            print(f"❌ UI 사전계산 실패: {result.stderr}")
 
-        print("🔍 4단계: 전체 분석 데이터 생성...")
-        result = subprocess.run(['npm', 'run', 'analysis'], capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ 전체 분석 완료")
+SEASON_MONTHS = (3, 4, 5, 6, 7, 8, 9, 10)  # KBO 정규시즌: 3월~10월
+
+
+def season_months_to_crawl(year, now=None):
+    """시즌의 크롤링 대상 월 - 지난 시즌은 전체, 현재 시즌은 이번 달부터, 다음 시즌은 전체"""
+    now = now or datetime.now(KST)
+    if year == now.year:
+        return [month for month in SEASON_MONTHS if month >= now.month]
+    return list(SEASON_MONTHS)
+
+
+def month_fixture_filename(year, month):
+    """월별 HTML 기록/재생 파일명 (예: 202508.html)"""
+    return f"{year}{month:02d}.html"
+
+
+def has_schedule_rows(html):
+    """HTML에 tbody#scheduleList와 그 안의 tr 행이 있는지 빠르게 확인 (파싱 없이)"""
+    if not html:
+        return False
+    match = re.search(r'<tbody[^>]*\bid=["\']scheduleList["\']', html)
+    if not match:
+        return False
+    end = html.find('</tbody>', match.end())
+    body = html[match.end():end] if end != -1 else html[match.end():]
+    return '<tr' in body
+
+
+class HttpScheduleFetcher:
+    """브라우저 없이 requests 세션(연결 풀 재사용)으로 스케줄 HTML 가져오기"""
+
+    name = 'http'
+
+    def __init__(self, base_url, pool_size=4, timeout=None, validators=None):
+        self.base_url = base_url
+        self.timeout = timeout or float(os.getenv('KBO_CRAWLING_TIMEOUT', '30'))
+        # (year, month) → 조건부 요청 헤더, 응답의 ETag/Last-Modified는 last_validators에 보관
+        self.validators = validators
+        self.last_validators = {}
+
+        retry = Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size), max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': ('Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+                           '(KHTML, like Gecko) Chrome/124.0 Safari/537.36'),
+            'Accept-Language': 'ko-KR,ko;q=0.9',
+        })
+
+    def fetch_month_html(self, year, month):
+        """월별 스케줄 HTML 반환 - 서버 렌더링된 행이 없으면 None (Selenium 대체 필요)"""
+        headers = self.validators(year, month) if self.validators else {}
+        response = self.session.get(
+            self.base_url, params={'date': f"{year}{month:02d}"}, headers=headers, timeout=self.timeout
+        )
+        if response.status_code == 304:
+            raise MonthNotModified(f"{year}년 {month}월")
+        response.raise_for_status()
+        self.last_validators[(year, month)] = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        if not response.encoding or response.encoding.lower() == 'iso-8859-1':
+            response.encoding = 'utf-8'
+
+        html = response.text
+        return html if has_schedule_rows(html) else None
+
+    def close(self):
+        self.session.close()
+
+
+class FixtureScheduleFetcher:
+    """기록해 둔 월별 HTML 파일을 재생하는 오프라인 백엔드 (--record-html로 기록)"""
+
+    name = 'fixture'
+
+    def __init__(self, fixture_dir):
+        self.fixture_dir = Path(fixture_dir)
+
+    def fetch_month_html(self, year, month):
+        fixture_path = self.fixture_dir / month_fixture_filename(year, month)
+        if not fixture_path.exists():
+            return None
+        return fixture_path.read_text(encoding='utf-8')
+
+    def close(self):
+        pass
+
+
+def schedule_rows_stable(stable_for=0.5):
+    """#scheduleList 행 수가 stable_for초 동안 변하지 않으면 준비 완료로 보는 대기 조건"""
+    state = {'count': -1, 'since': 0.0}
+
+    def condition(driver):
+        count = driver.execute_script(
+            "var t = document.getElementById('scheduleList'); return t ? t.rows.length : 0;"
+        )
+        now = time.monotonic()
+        if count != state['count']:
+            state['count'], state['since'] = count, now
+            return False
+        return count if count > 0 and now - state['since'] >= stable_for else False
+
+    return condition
+
+
+def network_idle(idle_for=0.5):
+    """문서 로드 완료 후 리소스 요청 수가 idle_for초 동안 늘지 않으면 유휴로 보는 대기 조건"""
+    state = {'count': -1, 'since': 0.0}
+
+    def condition(driver):
+        ready_state, count = driver.execute_script(
+            "return [document.readyState, performance.getEntriesByType('resource').length];"
+        )
+        now = time.monotonic()
+        if ready_state != 'complete' or count != state['count']:
+            state['count'], state['since'] = count, now
+            return False
+        return now - state['since'] >= idle_for
+
+    return condition
+
+
+def scroll_height_changed(last_height):
+    """스크롤 후 문서 높이가 바뀌면 새 높이를 반환하는 대기 조건"""
+    def condition(driver):
+        height = driver.execute_script("return document.body.scrollHeight")
+        return height if height != last_height else False
+
+    return condition
+
+
+def live_phase(state):
+    """스케줄 상태 → 'final'(종료/취소) / 'pregame'(경기전) / 'live'(진행 중)
+
+    상태 칸이 비어 있으면 extract_games_from_table과 같이 종료로 본다.
+    """
+    state = state if state is not None else "종료"
+    if state in FINISHED_STATES or state in CANCELLED_STATES:
+        return 'final'
+    if state in PREGAME_STATES:
+        return 'pregame'
+    return 'live'
+
+
+class WebDriverPool:
+    """장시간 재사용되는 Chrome WebDriver 풀 - 월마다 브라우저를 새로 띄우지 않음"""
+
+    def __init__(self, crawler, size=2, headless=False):
+        self.crawler = crawler
+        self.size = max(1, size)
+        self.headless = headless
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+
+        # 스크린샷은 HTML 확보 후 별도 스레드에서 찍고, 끝나면 드라이버를 반납
+        self._screenshot_executor = None
+        if crawler.screenshots:
+            self._screenshot_executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix='kbo-shot')
+
+    def acquire(self):
+        """유휴 드라이버를 꺼내거나, 풀이 다 차지 않았으면 새로 생성"""
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+
+            with self._lock:
+                can_create = len(self._drivers) < self.size
+                if can_create:
+                    # 생성 중인 슬롯을 먼저 예약하여 동시 생성 초과 방지
+                    self._drivers.append(None)
+
+            if can_create:
+                break
+
+            # 다른 워커의 반납 대기 (생성 실패로 슬롯이 비면 다시 생성 시도)
+            try:
+                return self._idle.get(timeout=1)
+            except queue.Empty:
+                continue
+
+        driver = self.crawler.setup_driver(headless=self.headless)
+        with self._lock:
+            self._drivers.remove(None)
+            if driver:
+                self._drivers.append(driver)
+        if not driver:
+            raise RuntimeError("WebDriver 생성 실패")
+        return driver
+
+    def release(self, driver):
+        """정상 사용한 드라이버를 풀에 반납"""
+        self._idle.put(driver)
+
+    def discard(self, driver):
+        """오류가 난 드라이버는 종료하고 풀에서 제거 (다음 acquire에서 새로 생성)"""
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def fetch_month_html(self, year, month):
+        """풀의 드라이버 하나로 월별 HTML 가져오기 (워커 스레드에서 실행)"""
+        driver = self.acquire()
+        try:
+            html = self.crawler.fetch_month_html(driver, year, month)
+        except Exception:
+            self.discard(driver)
+            raise
+
+        if self._screenshot_executor:
+            # HTML은 바로 반환하여 파싱/저장을 진행하고, 스크린샷은 비동기로 처리
+            self._screenshot_executor.submit(self._screenshot_and_release, driver, year, month)
         else:
-            print(f"❌ 전체 분석 실패: {result.stderr}")
+            self.release(driver)
+        return html
 
-        print("🎉 모든 후처리 작업 완료!")
+    def _screenshot_and_release(self, driver, year, month):
+        """스크린샷 저장 후 드라이버 반납 - 실패해도 크롤링 결과에는 영향 없음"""
+        try:
+            self.crawler.capture_screenshot(driver, year, month)
+        except Exception as e:
+            print(f"⚠️ {month}월 스크린샷 실패: {e}")
+            self.discard(driver)
+            return
+        self.release(driver)
+
+    def close(self):
+        """남은 스크린샷 작업을 마친 뒤 풀의 모든 드라이버 종료"""
+        if self._screenshot_executor:
+            self._screenshot_executor.shutdown(wait=True)
+            self._screenshot_executor = None
+        with self._lock:
+            drivers = [d for d in self._drivers if d is not None]
+            self._drivers = []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        if drivers:
+            print(f"🔚 브라우저 {len(drivers)}개 종료")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
 
-    except Exception as e:
-        print(f"❌ 후처리 작업 중 오류 발생: {e}")
-        print("💡 수동으로 다음 명령어들을 실행해주세요:")
-        print("   npm run process && npm run rank-matrix && npm run precompute-matrix && npm run analysis")
 
 class KBOWorkingCrawler:
-    def __init__(self):
+    FETCH_BACKENDS = ('auto', 'http', 'selenium', 'fixture')
+
+    def __init__(self, backend=None, fixture_dir=None, record_dir=None, screenshots=None, parser=None):
         self.base_url = 'https://sports.daum.net/schedule/kbo'
 
+        # 가져오기 백엔드: auto(HTTP 우선, 실패 시 Selenium) / http / selenium / fixture
+        self.backend = backend or os.getenv('KBO_FETCH_BACKEND', 'auto')
+        if self.backend not in self.FETCH_BACKENDS:
+            raise ValueError(f"지원하지 않는 백엔드: {self.backend}")
+        self.fixture_dir = fixture_dir or os.getenv('KBO_FIXTURE_DIR')
+        if self.backend == 'fixture' and not self.fixture_dir:
+            raise ValueError("fixture 백엔드는 fixture_dir(KBO_FIXTURE_DIR)이 필요합니다")
+        self.record_dir = Path(record_dir) if record_dir else None
+
+        # 월별 전체 페이지 스크린샷 (선택) - magic-number/screenshots/kbo-schedule-YYYYMM.png
+        if screenshots is None:
+            screenshots = os.getenv('KBO_SCREENSHOTS', '').lower() in ('1', 'true', 'yes')
+        self.screenshots = screenshots
+
+        # 스케줄 HTML 파서 백엔드: auto(selectolax → lxml → bs4) / selectolax / lxml / bs4
+        self.parser = get_parser(parser)
+
+        # 준비 상태 대기 제한 시간 (초) - 고정 sleep 대신 실제 조건을 기다림
+        self.ready_timeout = float(os.getenv('KBO_READY_TIMEOUT', '10'))
+        self.idle_timeout = float(os.getenv('KBO_IDLE_TIMEOUT', '5'))
+        self.scroll_timeout = float(os.getenv('KBO_SCROLL_TIMEOUT', '1'))
+
+        # 라이브 모드 폴링 간격 (초): 경기 중 / 8회 이후 / 시작 전 최대 대기
+        self.live_interval_seconds = float(os.getenv('KBO_LIVE_INTERVAL', '60'))
+        self.live_fast_interval = float(os.getenv('KBO_LIVE_FAST_INTERVAL', '30'))
+        self.live_idle_max = float(os.getenv('KBO_LIVE_IDLE_MAX', '600'))
+
+        # 대기/단계별 소요 시간 기록
+        self.metrics = RunMetrics()
+
+        # 오늘 날짜(KST)와 기본 시즌은 실행마다 한 번만 계산 - 오늘 경기는 경기전 데이터도 새로 받은 값으로 교체
+        self.today = datetime.now(KST).strftime('%Y-%m-%d')
+        self.season_year = current_season()
+
         # PathManager 사용
         self.paths = get_path_manager()
         self.paths.setup_python_path()  # Python 모듈 import 경로 설정
@@ -87,103 +379,84 @@ class KBOWorkingCrawler:
             'SK': 'SSG', '기아': 'KIA'
         }
 
-        # 기존 경기 데이터 캐시 (중복 방지용)
-        self.existing_games_cache = None
+        # 연도별 시즌 데이터 저장소 (중복 체크/저장 공용, 처음 접근한 시즌만 파싱, 오래 안 쓴 시즌은 해제)
+        self.seasons = None
 
-        print(f"🏟️ KBO 실제 작동 크롤러 초기화 완료 - 데이터 경로: {self.paths.data_dir}")
-
-    def load_existing_games(self, year=2025):
-        """기존 경기 데이터를 로드하여 캐시에 저장 - 상태 정보 포함"""
-        if self.existing_games_cache is not None:
-            return self.existing_games_cache
-
-        main_clean_file = Path(self.paths.data_dir) / f'{year}-season-data-clean.txt'
-        existing_games = {}  # 딕셔너리로 변경하여 상태 정보 저장
-
-        if main_clean_file.exists():
-            with open(main_clean_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                current_date = None
-
-                for line in content.split('\n'):
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    # 날짜 라인인지 확인
-                    if re.match(r'^\d{4}-\d{2}-\d{2}', line):
-                        current_date = line.split()[0]  # 날짜만 추출
-                    elif current_date:
-                        # 경기 라인에서 중복 체크용 키와 상태 저장
-                        parts = line.split()
-                        if len(parts) >= 5:
-                            time = parts[0]
-                            state = parts[1]
-                            home_team = parts[3]
-                            away_team = parts[4]
-                            game_key = f"{current_date}_{time}_{home_team}_{away_team}"
-                            existing_games[game_key] = {
-                                'state': state,
-                                'line': line,
-                                'date': current_date
-                            }
-
-        self.existing_games_cache = existing_games
-        print(f"📚 기존 경기 데이터 캐시 로드: {len(existing_games)}개 경기")
-        return existing_games
-
-    def is_duplicate_game(self, game_date, game_time, home_team, away_team, new_state=None):
-        """경기 중복 여부 확인 - 오늘 날짜는 특별 처리"""
-        from datetime import datetime, timezone, timedelta
-
-        # 한국 시간으로 오늘 날짜 구하기
-        kst = timezone(timedelta(hours=9))
-        today = datetime.now(kst).strftime('%Y-%m-%d')
-
-        existing_games = self.load_existing_games()
-        game_key = f"{game_date}_{game_time}_{home_team}_{away_team}"
-
-        # 오늘 날짜 경기 처리
-        if game_date == today:
-            if game_key in existing_games:
-                existing_state = existing_games[game_key]['state']
-
-                # 오늘 날짜의 경기전/예정 경기는 삭제하고 새로 크롤링한 데이터로 대체
-                if existing_state in ["경기전", "예정"]:
-                    print(f"  🔄 오늘 경기 업데이트: {game_date} {game_time} {away_team} vs {home_team} ({existing_state} → {new_state})")
-                    self.mark_for_update(game_key, existing_games[game_key]['line'])
-                    return False  # 중복 아님 - 새 데이터로 대체
-
-                # 오늘 날짜의 완료/취소 경기는 그대로 유지
-                if existing_state in ["종료", "완료", "끝", "취소", "우천취소", "연기", "경기취소"]:
-                    print(f"  ✅ 오늘 완료/취소 경기 유지: {game_date} {game_time} {away_team} vs {home_team} [{existing_state}]")
-                    return True  # 중복으로 처리 - 기존 데이터 유지
-
-            # 오늘 날짜의 새로운 경기는 추가
-            return False
+        # 연도별 월 스케줄 변경 감지 기록 - 저장이 끝난 월만 commit_month_fingerprint로 확정
+        self.fingerprints = {}
+        self.pending_fingerprints = {}
 
-        # 오늘이 아닌 날짜는 기존 로직 유지
-        if game_key in existing_games:
-            existing_state = existing_games[game_key]['state']
+        # 연도별 순위/상대전적 증분 상태 - 저장 단계의 변경분만 반영
+        self.standings = {}
 
-            # 상태 업데이트인지 확인
-            if new_state and existing_state in ["경기전", "예정"]:
-                if new_state in ["종료", "완료", "끝", "취소", "우천취소", "연기", "경기취소"]:
-                    print(f"  🔄 경기 상태 업데이트 허용: {game_date} {game_time} {away_team} vs {home_team} ({existing_state} → {new_state})")
-                    # 기존 라인을 업데이트 표시하여 나중에 제거
-                    self.mark_for_update(game_key, existing_games[game_key]['line'])
-                    return False  # 중복이 아님 - 업데이트 허용
+        print(f"🏟️ KBO 실제 작동 크롤러 초기화 완료 - 데이터 경로: {self.paths.data_dir}")
 
-            # 동일한 상태이거나 이미 완료된 경기면 중복으로 처리
-            return True
+    def load_existing_games(self, year=None):
+        """시즌(기본: 현재 시즌) 경기 데이터를 SeasonStore로 한 번만 로드 - 중복 체크와 저장이 같은 인스턴스 공유"""
+        year = year or self.season_year
+        if self.seasons is None:
+            self.seasons = SeasonCache(self.paths.data_dir)
+        if year in self.seasons:
+            return self.seasons.get(year)
+
+        store = self.seasons.get(year)
+        print(f"📚 {year} 시즌 경기 데이터 캐시 로드: {len(store)}개 경기")
+        return store
+
+    def load_fingerprints(self, year=None):
+        """월별 변경 감지 기록 (data/{year}-month-fingerprints.json, 확인 시각은 logs/{year}-month-checks.json)"""
+        year = year or self.season_year
+        if year not in self.fingerprints:
+            self.fingerprints[year] = MonthFingerprints(
+                Path(self.paths.data_dir) / f'{year}-month-fingerprints.json',
+                checks_path=self.paths.get_log_file(f'{year}-month-checks.json'))
+        return self.fingerprints[year]
+
+    def load_standings(self, year=None):
+        """순위/상대전적 증분 상태 (data/{year}-standings-state.json) - 시즌 파일과 맞지 않으면 저장소에서 재계산"""
+        year = year or self.season_year
+        if year not in self.standings:
+            store = self.load_existing_games(year)
+            state_path = standings_state_path(self.paths.data_dir, year)
+            with self.metrics.timer('standings', phase='load') as event:
+                engine = StandingsEngine.load_for(store, state_path)
+                event['rebuilt'] = engine.dirty
+            if engine.dirty:
+                self.metrics.incr('standings_rebuilds')
+                print(f"📊 {year} 순위 상태 전체 재계산: {len(engine.games)}경기")
+            self.standings[year] = engine
+        return self.standings[year]
+
+    def save_standings(self, year=None):
+        """순위 상태가 바뀌었으면 상태 파일 기록 - 실행 끝/후처리 직전에 한 번 (실패해도 다음 실행에서 재계산)
+
+        월마다 쓰지 않음 - 중간에 중단돼도 상태 파일의 원본 sha256이 시즌 파일과 달라 다음 로드에서 재계산됨
+        """
+        year = year or self.season_year
+        engine = self.load_standings(year)
+        if not engine.dirty:
+            return None
+        try:
+            with self.metrics.timer('standings', phase='write'):
+                return engine.save(standings_state_path(self.paths.data_dir, year),
+                                   source=self.load_existing_games(year).path)
+        except OSError as e:
+            print(f"⚠️ 순위 상태 기록 실패 (다음 실행에서 다시 계산): {e}")
+            self.standings.pop(year, None)
+            return None
 
-        return False  # 새로운 경기
+    def commit_month_fingerprint(self, year, month):
+        """저장까지 끝난 월의 지문 확정 - 저장 실패 시 다음 실행에서 다시 처리되도록 이때만 기록"""
+        pending = self.pending_fingerprints.pop((year, month), None)
+        if pending is None:
+            return
+        fingerprints = self.load_fingerprints(year)
+        fingerprints.record(year, month, **pending)
+        fingerprints.save()
 
-    def mark_for_update(self, game_key, old_line):
-        """업데이트할 경기 표시"""
-        if not hasattr(self, 'lines_to_remove'):
-            self.lines_to_remove = set()
-        self.lines_to_remove.add(old_line)
+    def diff_games(self, games, year=None):
+        """경기 dict 목록을 저장된 시즌과 비교한 SeasonDiff (저장소는 바꾸지 않음)"""
+        return diff_games(self.load_existing_games(year), games, self.today)
 
     def setup_driver(self, headless=False):
         """Chrome WebDriver 설정"""
@@ -196,64 +469,106 @@ class KBOWorkingCrawler:
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--window-size=1920,1080')
         
-        try:
-            driver = webdriver.Chrome(options=options)
-            print("✅ WebDriver 설정 완료")
-            return driver
-        except Exception as e:
-            print(f"❌ WebDriver 설정 실패: {e}")
-            return None
+        with self.metrics.timer('driver_setup', headless=headless) as event:
+            try:
+                driver = webdriver.Chrome(options=options)
+                event['outcome'] = 'ready'
+                print("✅ WebDriver 설정 완료")
+                return driver
+            except Exception as e:
+                event['outcome'] = 'error'
+                self.metrics.incr('driver_setup_errors')
+                print(f"❌ WebDriver 설정 실패: {e}")
+                return None
+
+    def crawl_daum_kbo(self, year=None, month=None, driver=None):
+        """다음 스포츠에서 KBO 데이터 크롤링 (기본: 현재 시즌의 이번 달) - driver를 넘기면 해당 브라우저로만 가져옴"""
+        year = year or self.season_year
+        month = month or datetime.now(KST).month
+        if driver is None:
+            for _, games, error in self.iter_crawl_months(year, [month]):
+                if error:
+                    print(f"❌ 크롤링 오류: {error}")
+                    return []
+                return games
+            return []
 
-    def crawl_daum_kbo(self, year=2025, month=8):
-        """다음 스포츠에서 KBO 데이터 크롤링"""
         print(f"\n📡 {year}년 {month}월 KBO 데이터 크롤링 시작...")
-        
-        # GitHub Actions 환경 감지
-        import os
-        is_github_actions = os.getenv('GITHUB_ACTIONS') == 'true'
-        
-        driver = self.setup_driver(headless=is_github_actions)
-        if not driver:
-            return []
-        
         try:
-            # URL 접속
-            target_month = f"{year}{month:02d}"
-            url = f"{self.base_url}?date={target_month}"
-            print(f"🔗 접속: {url}")
-            
-            driver.get(url)
-            time.sleep(5)
-            
-            # 테이블이 로드될 때까지 대기
+            html = self.fetch_month_html(driver, year, month)
+            games = self.parse_month_html(html, year)
+            if self.screenshots:
+                self.capture_screenshot(driver, year, month)
+            return games
+
+        except Exception as e:
+            print(f"❌ 크롤링 오류: {e}")
+            import traceback
+            traceback.print_exc()
+            return []
+
+    def wait_for(self, driver, condition, phase, month, timeout=None):
+        """조건이 충족될 때까지 제한 시간 내 대기 - 소요 시간/결과를 메트릭으로 기록"""
+        timeout = self.ready_timeout if timeout is None else timeout
+        with self.metrics.timer('wait', phase=phase, month=month) as event:
             try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.ID, "scheduleList"))
-                )
-                print("✅ 스케줄 테이블 로드 완료")
-            except:
-                print("⚠️ 스케줄 테이블 로드 타임아웃")
-            
-            time.sleep(2)
-            
-            # 전체 페이지 스크린샷을 위한 설정
-            # 브라우저 창 크기 조정 및 스크롤
-            original_size = driver.get_window_size()
-            
-            # 페이지 끝까지 스크롤하여 모든 내용 로드
-            last_height = driver.execute_script("return document.body.scrollHeight")
-            while True:
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-                new_height = driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
-                    break
-                last_height = new_height
-            
+                result = WebDriverWait(driver, timeout, poll_frequency=0.1).until(condition)
+                event['outcome'] = 'ready'
+                return result
+            except TimeoutException:
+                event['outcome'] = 'timeout'
+                return None
+
+    def wait_for_paint(self, driver, phase, month):
+        """창 크기 변경 후 다음 두 프레임이 그려질 때까지 대기 (레이아웃 반영 확인)"""
+        with self.metrics.timer('wait', phase=phase, month=month) as event:
+            driver.execute_async_script(
+                "var done = arguments[arguments.length - 1];"
+                "requestAnimationFrame(function () { requestAnimationFrame(function () { done(true); }); });"
+            )
+            event['outcome'] = 'ready'
+
+    def fetch_month_html(self, driver, year, month):
+        """월별 스케줄 페이지를 열어 렌더링된 HTML 반환 (파싱은 하지 않음)"""
+        # URL 접속
+        target_month = f"{year}{month:02d}"
+        url = f"{self.base_url}?date={target_month}"
+        print(f"🔗 접속: {url}")
+
+        with self.metrics.timer('wait', phase='page_load', month=month) as event:
+            driver.get(url)
+            event['outcome'] = 'ready'
+
+        # 스케줄 행 수가 안정될 때까지 대기
+        row_count = self.wait_for(driver, schedule_rows_stable(), 'schedule_rows', month)
+        if row_count:
+            print(f"✅ 스케줄 테이블 로드 완료 ({row_count}개 행)")
+        else:
+            print("⚠️ 스케줄 테이블 로드 타임아웃")
+
+        # 남은 네트워크 요청이 끝날 때까지 대기
+        self.wait_for(driver, network_idle(), 'network_idle', month, timeout=self.idle_timeout)
+
+        # 페이지 끝까지 스크롤하여 모든 내용 로드 - 높이가 더 늘지 않으면 종료
+        last_height = driver.execute_script("return document.body.scrollHeight")
+        while True:
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            new_height = self.wait_for(
+                driver, scroll_height_changed(last_height), 'scroll', month, timeout=self.scroll_timeout
+            )
+            if not new_height:
+                break
+            last_height = new_height
+
+        return driver.page_source
+
+    def capture_screenshot(self, driver, year, month):
+        """월별 전체 페이지 스크린샷 저장 (HTML 확보 후 호출, 크롤링 결과와 무관)"""
+        with self.metrics.timer('screenshot', month=month) as event:
             # 페이지 상단으로 돌아가기
             driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
-            
+            original_size = driver.get_window_size()
+
             # 전체 페이지 높이에 맞춰 창 크기 조정
             total_height = driver.execute_script("""
                 return Math.max(
@@ -264,254 +579,372 @@ class KBOWorkingCrawler:
                     document.documentElement.offsetHeight
                 );
             """)
-            
+
             # 브라우저 창 크기를 전체 페이지에 맞게 조정
             driver.set_window_size(1920, total_height)
-            time.sleep(2)
-            
-            screenshot_path = Path(self.paths.crawlers_dir) / 'kbo-working-screenshot.png'
+            self.wait_for_paint(driver, 'resize', month)
+
+            screenshot_dir = self.paths.ensure_dir(Path(self.paths.screenshots_dir))
+            screenshot_path = screenshot_dir / f'kbo-schedule-{year}{month:02d}.png'
             driver.save_screenshot(str(screenshot_path))
-            print(f"📸 전체 페이지 스크린샷 저장: kbo-working-screenshot.png (높이: {total_height}px)")
-            
+            event['height'] = total_height
+            print(f"📸 전체 페이지 스크린샷 저장: {screenshot_path.name} (높이: {total_height}px)")
+
             # 원래 창 크기로 복원
             driver.set_window_size(original_size['width'], original_size['height'])
-            
-            # HTML 파싱
-            html = driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # 데이터 추출
-            games = self.extract_games_from_table(soup)
-            
-            print(f"\n✅ 총 {len(games)}개 경기 데이터 추출 완료")
-            
-            return games
-            
-        except Exception as e:
-            print(f"❌ 크롤링 오류: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
+
+    def parse_month_html(self, html, year=None):
+        """렌더링된 HTML에서 경기 데이터 추출 (설정된 파서 백엔드 사용)"""
+        with self.metrics.timer('parse', parser=self.parser.name):
+            games = self.extract_games_from_table(html, year)
+
+        print(f"\n✅ 총 {len(games)}개 경기 데이터 추출 완료")
+
+        return games
+
+    def build_fetchers(self, pool_size=1, validators=None):
+        """브라우저 없이 시도할 백엔드 목록 (순서대로 시도)"""
+        if self.backend == 'fixture':
+            return [FixtureScheduleFetcher(self.fixture_dir)]
+        if self.backend in ('auto', 'http'):
+            return [HttpScheduleFetcher(self.base_url, pool_size=pool_size, validators=validators)]
+        return []
+
+    def fetch_month(self, year, month, fetchers, pool):
+        """월별 HTML 가져오기 - 브라우저 없는 백엔드 우선, 실패 시 WebDriver 풀로 대체"""
+        html = None
+        for fetcher in fetchers:
+            with self.metrics.timer('fetch', phase=fetcher.name, month=month) as event:
+                try:
+                    html = fetcher.fetch_month_html(year, month)
+                    event['outcome'] = 'ready' if html else 'empty'
+                except MonthNotModified:
+                    event['outcome'] = 'not_modified'
+                    raise
+                except Exception as e:
+                    event['outcome'] = 'error'
+                    self.metrics.incr('fetch_errors')
+                    print(f"⚠️ {month}월 {fetcher.name} 백엔드 실패: {e}")
+                    continue
+            if html:
+                print(f"⚡ {month}월 {fetcher.name} 백엔드로 스케줄 수신")
+                break
+            print(f"ℹ️ {month}월 {fetcher.name} 백엔드 응답에 스케줄 행 없음")
+
+        if not html:
+            if pool is None:
+                raise RuntimeError(f"{self.backend} 백엔드에서 {month}월 스케줄을 가져오지 못함")
+            html = pool.fetch_month_html(year, month)
+
+        if self.record_dir:
+            self.paths.ensure_dir(self.record_dir)
+            (self.record_dir / month_fixture_filename(year, month)).write_text(html, encoding='utf-8')
+
+        return html
+
+    def iter_crawl_months(self, year, months, workers=1, skip_unchanged=False):
+        """여러 월을 동시에 가져오고, 파싱 결과를 월 순서대로 반환
+
+        (month, games, error) 튜플을 yield 한다. 가져오기(HTTP/브라우저)만 워커
+        스레드에서 실행되고, 중복 체크/파싱은 호출 스레드에서 월 순서대로 진행되므로
+        save_results와의 상호작용은 순차 크롤링과 동일하다. WebDriver는 HTTP
+        백엔드가 실패한 월이 있을 때만 생성된다.
+
+        skip_unchanged이면 HTTP 304를 받았거나 파싱된 행이 마지막 기록과 같은 월은
+        games 대신 None을 yield 한다 (중복 체크/저장 생략).
+        """
+        workers = max(1, min(workers, len(months))) if months else 1
+        headless = os.getenv('GITHUB_ACTIONS') == 'true'
+        print(f"🧵 월별 크롤링: {len(months)}개월, 워커 {workers}개, 백엔드 {self.backend}")
+
+        fingerprints = self.load_fingerprints(year) if skip_unchanged else None
+        fetchers = self.build_fetchers(
+            pool_size=workers,
+            validators=(lambda y, m: fingerprints.validators(y, m)) if fingerprints else None
+        )
+        use_browser = self.backend in ('auto', 'selenium')
+        try:
+            with WebDriverPool(self, size=workers, headless=headless) as pool:
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='kbo-crawl') as executor:
+                    futures = [
+                        (month, executor.submit(self.fetch_month, year, month, fetchers,
+                                                pool if use_browser else None))
+                        for month in months
+                    ]
+
+                    for month, future in futures:
+                        print(f"\n📡 {year}년 {month}월 KBO 데이터 파싱...")
+                        try:
+                            html = future.result()
+                        except MonthNotModified:
+                            print(f"💤 {month}월 스케줄 변경 없음 (HTTP 304)")
+                            fingerprints.record(year, month)
+                            fingerprints.save()
+                            yield month, None, None
+                            continue
+                        except Exception as e:
+                            yield month, [], e
+                            continue
+
+                        try:
+                            if fingerprints is None:
+                                yield month, self.parse_month_html(html, year), None
+                                continue
+
+                            with self.metrics.timer('parse', phase='rows', parser=self.parser.name):
+                                rows = self.parser.parse_rows(html)
+                            fingerprint = rows_fingerprint(rows) if rows else None
+                            if fingerprint and fingerprints.is_unchanged(year, month, fingerprint):
+                                print(f"💤 {month}월 스케줄 변경 없음 ({len(rows)}개 행) - 저장 생략")
+                                fingerprints.record(year, month)
+                                fingerprints.save()
+                                yield month, None, None
+                                continue
+
+                            etag, last_modified = next(
+                                (fetcher.last_validators.get((year, month)) for fetcher in fetchers
+                                 if getattr(fetcher, 'last_validators', {}).get((year, month))),
+                                (None, None)
+                            )
+                            if fingerprint:
+                                self.pending_fingerprints[(year, month)] = {
+                                    'fingerprint': fingerprint, 'rows': len(rows),
+                                    'etag': etag, 'last_modified': last_modified,
+                                }
+                            yield month, self.parse_month_html(rows if rows is not None else html, year), None
+                        except Exception as e:
+                            yield month, [], e
         finally:
-            time.sleep(3)  # 확인용
-            driver.quit()
-            print("🔚 브라우저 종료")
+            for fetcher in fetchers:
+                fetcher.close()
+
+    def live_interval(self, rows, now):
+        """다음 폴링까지 대기 시간(초) - 경기 중이면 짧게(후반 이닝은 더 짧게), 시작 전이면 첫 경기 시각까지"""
+        live_rows = [row for row in rows if live_phase(row.state) == 'live']
+        if live_rows:
+            for row in live_rows:
+                match = LIVE_INNING.search(row.state or '')
+                if match and int(match.group(1)) >= 8:
+                    return self.live_fast_interval
+            return self.live_interval_seconds
+
+        # 남은 경기가 모두 시작 전 - 가장 이른 시작 시각까지 (최대 live_idle_max)
+        starts = []
+        for row in rows:
+            match = re.search(r'(\d{1,2}):(\d{2})', row.time or '')
+            if live_phase(row.state) == 'pregame' and match:
+                start = now.replace(hour=int(match.group(1)), minute=int(match.group(2)), second=0, microsecond=0)
+                starts.append((start - now).total_seconds())
+        wait = min(starts) if starts else self.live_idle_max
+        return max(self.live_interval_seconds, min(wait, self.live_idle_max))
+
+    def run_live(self, max_hours=None, sleep=time.sleep, on_saved=None):
+        """오늘 경기만 짧은 간격으로 폴링 - 종료된 경기는 바로 저장하고, 모든 경기가 끝나면 종료
+
+        한 세션 동안 같은 HTTP 세션/WebDriver를 재사용한다. 저장이 일어날 때마다
+        on_saved()를 호출한다 (기본값: 후처리 스크립트 실행). 저장한 경기 수를 반환.
+        """
+        started = datetime.now(KST)
+        today = self.today = started.strftime('%Y-%m-%d')
+        year, month = started.year, started.month
+        max_hours = max_hours if max_hours is not None else float(os.getenv('KBO_LIVE_MAX_HOURS', '6'))
+        deadline = started + timedelta(hours=max_hours)
+        on_saved = on_saved or run_post_crawl_processing
+        print(f"🔴 라이브 모드: {today} 경기 폴링 (최대 {max_hours:g}시간)")
+
+        fetchers = self.build_fetchers(pool_size=1)
+        use_browser = self.backend in ('auto', 'selenium')
+        headless = os.getenv('GITHUB_ACTIONS') == 'true'
+        saved_total = 0
+        last_fingerprint = None
+        try:
+            with WebDriverPool(self, size=1, headless=headless) as pool:
+                while True:
+                    now = datetime.now(KST)
+                    with self.metrics.timer('live_poll', month=month) as event:
+                        try:
+                            html = self.fetch_month(year, month, fetchers, pool if use_browser else None)
+                            rows = [row for date, row in iter_dated_rows(self.parser.parse_rows(html) or [], year)
+                                    if date == today]
+                        except Exception as e:
+                            print(f"⚠️ 라이브 폴링 실패: {e} - {self.live_interval_seconds:g}초 후 재시도")
+                            event['outcome'] = 'error'
+                            rows = None
+
+                        if rows is not None:
+                            phases = [live_phase(row.state) for row in rows]
+                            event.update(outcome='ok', live=phases.count('live'),
+                                         pregame=phases.count('pregame'), final=phases.count('final'))
+
+                    if rows is not None:
+                        if not rows:
+                            print(f"ℹ️ {today} 경기가 없습니다 - 라이브 모드 종료")
+                            break
+
+                        print(f"⏱️ {now:%H:%M:%S} 진행 {phases.count('live')} / 시작 전 {phases.count('pregame')} / "
+                              f"종료 {phases.count('final')}")
+
+                        # 상태가 바뀐 경우에만 추출 - 진행 중 경기는 추출 단계에서 제외되고 종료된 경기만 저장됨
+                        fingerprint = rows_fingerprint(rows)
+                        if fingerprint != last_fingerprint:
+                            games = self.extract_games_from_table(rows, year)
+                            if games:
+                                self.save_results(games, year, month)
+                                saved_total += len(games)
+                                print(f"🏁 종료 경기 {len(games)}개 반영")
+                                self.save_standings(year)
+                                on_saved()
+                            last_fingerprint = fingerprint
+
+                        if 'live' not in phases and 'pregame' not in phases:
+                            print(f"✅ {today} 모든 경기 종료 - 라이브 모드 종료")
+                            break
+
+                    if datetime.now(KST) >= deadline:
+                        print("⏹️ 라이브 모드 최대 실행 시간 도달 - 종료")
+                        break
+
+                    interval = self.live_interval(rows, datetime.now(KST)) if rows else self.live_interval_seconds
+                    print(f"💤 {interval:.0f}초 후 다시 확인")
+                    sleep(interval)
+        finally:
+            for fetcher in fetchers:
+                fetcher.close()
 
-    def extract_games_from_table(self, soup):
-        """스케줄 테이블에서 경기 데이터 추출"""
+        print(f"🔴 라이브 모드 완료 - 저장 {saved_total}개 경기")
+        return saved_total
+
+    def extract_games_from_table(self, source, year=None):
+        """스케줄 테이블에서 경기 데이터 추출 - HTML 문자열(파서 백엔드), ScheduleRow 목록 또는 BeautifulSoup 트리
+
+        페이지의 "MM.DD" 날짜는 year(기본: 현재 시즌) 기준으로 해석하고, 그 시즌과 비교한
+        SeasonDiff(추가/갱신/변경 없음)를 반환 - 저장이 필요한 경기만 len()에 포함
+        """
+        year = year or self.season_year
         print("\n🎯 스케줄 테이블에서 데이터 추출 중...")
-        
-        games = []
-        
-        # scheduleList tbody 찾기
-        schedule_tbody = soup.find('tbody', id='scheduleList')
-        if not schedule_tbody:
+
+        diff = SeasonDiff()
+
+        # scheduleList의 모든 tr 행을 한 번에 ScheduleRow로 변환 (이미 변환된 목록이면 그대로 사용)
+        if isinstance(source, list):
+            rows = source
+        elif isinstance(source, str):
+            rows = self.parser.parse_rows(source)
+        else:
+            rows = Bs4ScheduleParser.rows_from_soup(source)
+        if rows is None:
             print("❌ scheduleList를 찾을 수 없음")
-            return []
-        
-        # 모든 tr 행 찾기
-        rows = schedule_tbody.find_all('tr')
+            return diff
+
         print(f"📊 {len(rows)}개 행 발견")
-        
+        self.metrics.incr('rows_parsed', len(rows))
+
+        store = self.load_existing_games(year)
+        today = self.today
+
+        # 중복 체크 소요 시간은 호출마다 기록하지 않고 합산해 한 번만 기록
+        dedup_checks = 0
+        dedup_seconds = 0.0
+
         current_date = None
-        
+
         for row_idx, row in enumerate(rows):
             try:
                 # 날짜 셀 확인 (rowspan이 있는 td_date)
-                date_cell = row.find('td', class_='td_date')
-                if date_cell:
-                    date_span = date_cell.find('span', class_='num_date')
-                    if date_span:
-                        date_text = date_span.get_text(strip=True)
-                        # "08.01" 형식을 "2025-08-01"로 변환
-                        date_match = re.match(r'(\d{2})\.(\d{2})', date_text)
-                        if date_match:
-                            month = date_match.group(1)
-                            day = date_match.group(2)
-                            current_date = f"2025-{month}-{day}"
-                            print(f"\n📅 날짜: {current_date}")
-                
-                # 경기 정보 추출
-                team_cell = row.find('td', class_='td_team')
-                if team_cell and current_date:
-                    # 홈팀 정보
-                    home_team_div = team_cell.find('div', class_='team_home')
-                    away_team_div = team_cell.find('div', class_='team_away')
-                    
-                    if home_team_div and away_team_div:
-                        # 팀명 추출
-                        home_team_name = home_team_div.find('span', class_='txt_team')
-                        away_team_name = away_team_div.find('span', class_='txt_team')
-                        
-                        # 점수 추출
-                        home_score_elem = home_team_div.find('span', class_='num_score')
-                        if not home_score_elem:
-                            home_score_elem = home_team_div.find('em', class_='num_score')
-                        
-                        away_score_elem = away_team_div.find('span', class_='num_score')
-                        if not away_score_elem:
-                            away_score_elem = away_team_div.find('em', class_='num_score')
-                        
-                        if home_team_name and away_team_name:
-                            home_team = home_team_name.get_text(strip=True)
-                            away_team = away_team_name.get_text(strip=True)
-
-                            # 경기 상태 확인 (먼저 확인)
-                            state_elem = team_cell.find('span', class_='state_game')
-                            state = state_elem.get_text(strip=True) if state_elem else "종료"
-
-                            # 점수 정보 추출 (취소 경기는 점수가 없을 수 있음)
-                            home_score = 0
-                            away_score = 0
-
-                            if home_score_elem and away_score_elem:
-                                # 점수 텍스트에서 숫자만 추출
-                                home_score_text = home_score_elem.get_text(strip=True)
-                                away_score_text = away_score_elem.get_text(strip=True)
-
-                                # 숫자만 추출
-                                home_score_match = re.search(r'\d+', home_score_text)
-                                away_score_match = re.search(r'\d+', away_score_text)
-
-                                if home_score_match and away_score_match:
-                                    home_score = int(home_score_match.group())
-                                    away_score = int(away_score_match.group())
-
-                            # 완료된 경기와 취소 경기 모두 저장
-                            completed_states = ["종료", "완료", "끝", "취소", "우천취소", "연기", "경기취소"]
-                            cancelled_states = ["취소", "우천취소", "연기", "경기취소"]
-                            in_progress_states = ["경기중", "1회말", "2회말", "3회말", "4회말", "5회말", "6회말", "7회말", "8회말", "9회말",
-                                                 "1회초", "2회초", "3회초", "4회초", "5회초", "6회초", "7회초", "8회초", "9회초",
-                                                 "연장", "10회", "11회", "12회", "진행중"]
-
-                            is_valid_game = (
-                                state in completed_states or
-                                (state == "종료" and home_score >= 0 and away_score >= 0 and
-                                 home_score <= 30 and away_score <= 30) or  # 완료 경기 점수 검증
-                                state in cancelled_states  # 취소 경기는 점수 무관
-                            )
+                if row.date_text:
+                    # "08.01" 형식을 "{year}-08-01"로 변환
+                    date_match = re.match(r'(\d{2})\.(\d{2})', row.date_text)
+                    if date_match:
+                        month = date_match.group(1)
+                        day = date_match.group(2)
+                        current_date = f"{year}-{month}-{day}"
+                        print(f"\n📅 날짜: {current_date}")
+
+                # 경기 정보 추출 (팀 셀과 두 팀 이름이 모두 있는 행만)
+                if row.home_team is None or not current_date:
+                    continue
+
+                home_team = row.home_team
+                away_team = row.away_team
+
+                # 경기 상태 확인 (먼저 확인)
+                state = row.state if row.state is not None else "종료"
+                kind = classify_state(state)
+
+                # 진행 중인 경기는 완료 후 다시 크롤링
+                if kind == GameState.LIVE:
+                    self.metrics.incr('in_progress_skipped')
+                    print(f"  ⚾ {home_team} vs {away_team} [{state}] - 경기중, 완료 후 재크롤링 필요")
+                    continue
+
+                # 점수 정보 추출 (취소 경기는 점수가 없을 수 있음)
+                home_score = 0
+                away_score = 0
+                is_done = kind in (GameState.FINAL, GameState.CANCELLED)
+
+                if is_done and row.home_score is not None and row.away_score is not None:
+                    # 점수 텍스트에서 숫자만 추출
+                    home_score_match = re.search(r'\d+', row.home_score)
+                    away_score_match = re.search(r'\d+', row.away_score)
+
+                    if home_score_match and away_score_match:
+                        home_score = int(home_score_match.group())
+                        away_score = int(away_score_match.group())
+
+                # 정규화된 팀명 - KBO 웹사이트에서 team_home div가 실제로는 원정팀, team_away div가 홈팀을 의미함
+                normalized_home = self.normalize_team_name(away_team)  # team_away div = 홈팀
+                normalized_away = self.normalize_team_name(home_team)  # team_home div = 원정팀
+                game_time = row.time
+
+                # td_time - 경기 시간 / td_area - 구장 정보 (앞 2글자만) / td_sort - 정렬 정보 / td_tv - 중계 정보
+                game = {
+                    'date': current_date,
+                    'away_team': normalized_away,
+                    'home_team': normalized_home,
+                    'away_score': home_score,  # team_home 점수 = 원정팀 점수
+                    'home_score': away_score,  # team_away 점수 = 홈팀 점수
+                    'state': state,
+                    'time': game_time,
+                    'stadium': row.area[:2] if row.area else "",
+                    'sort': row.sort,
+                    'tv': row.tv,
+                    'away_info': row.home_info if is_done else '',  # team_home div = 원정팀 정보
+                    'home_info': row.away_info if is_done else '',  # team_away div = 홈팀 정보
+                    'away_team_short': normalized_away[:2],  # 원정팀 앞 2글자
+                    'home_team_short': normalized_home[:2]   # 홈팀 앞 2글자
+                }
+
+                # 중복/갱신 판정 - 저장소 조회 한 번 + 상태 전이 표 조회 한 번 (상태 정보 포함)
+                start = time.perf_counter()
+                key = game_key(current_date, game_time, normalized_home, normalized_away)
+                action, existing = dedup_action(store, key, state, today)
+                dedup_checks += 1
+                dedup_seconds += time.perf_counter() - start
+                diff.add(action, game, existing)
+
+                if action is DedupAction.NOOP:
+                    self.metrics.incr('duplicates_skipped')
+                    label = "중복 경기" if is_done else "중복 경기전 경기"
+                    print(f"  ♻️ {label} 제외: {current_date} {game_time} {normalized_away} vs {normalized_home} [{existing.state}]")
+                elif action is DedupAction.UPDATE:
+                    self.metrics.incr('updates_detected')
+                    label = "오늘 경기 업데이트" if current_date == today else "경기 상태 업데이트 허용"
+                    print(f"  🔄 {label}: {current_date} {game_time} {normalized_away} vs {normalized_home} ({existing.state} → {state})")
+                elif kind == GameState.CANCELLED:
+                    print(f"  ❌ {normalized_away} vs {normalized_home} [{state}]")
+                elif is_done:
+                    print(f"  ✅ {normalized_away} {home_score}:{away_score} {normalized_home} [완료]")
+                else:
+                    print(f"  📅 {normalized_away} vs {normalized_home} [{state}] - 예정 경기 저장")
 
-                            if is_valid_game:
-                                    # 추가 정보 추출
-
-                                    # td_time - 경기 시간
-                                    time_cell = row.find('td', class_='td_time')
-                                    game_time = time_cell.get_text(strip=True) if time_cell else ""
-
-                                    # td_area - 구장 정보 (앞 2글자만)
-                                    area_cell = row.find('td', class_='td_area')
-                                    stadium_full = area_cell.get_text(strip=True) if area_cell else ""
-                                    stadium = stadium_full[:2] if stadium_full else ""
-
-                                    # td_sort - 정렬 정보
-                                    sort_cell = row.find('td', class_='td_sort')
-                                    sort_info = sort_cell.get_text(strip=True) if sort_cell else ""
-
-                                    # td_tv - 중계 정보
-                                    tv_cell = row.find('td', class_='td_tv')
-                                    tv_info = tv_cell.get_text(strip=True) if tv_cell else ""
-
-                                    # info_team 정보 추출
-                                    home_info_elem = home_team_div.find('span', class_='info_team')
-                                    away_info_elem = away_team_div.find('span', class_='info_team')
-                                    home_info = home_info_elem.get_text(strip=True) if home_info_elem else ""
-                                    away_info = away_info_elem.get_text(strip=True) if away_info_elem else ""
-
-                                    # td_team 팀정보 (앞 2글자만)
-                                    home_team_short = self.normalize_team_name(home_team)[:2]
-                                    away_team_short = self.normalize_team_name(away_team)[:2]
-
-                                    # 정규화된 팀명으로 중복 체크
-                                    normalized_home = self.normalize_team_name(away_team)  # team_away div = 홈팀
-                                    normalized_away = self.normalize_team_name(home_team)  # team_home div = 원정팀
-
-                                    # 중복 체크 - 크롤링 단계에서 즉시 확인 (상태 정보 포함)
-                                    if self.is_duplicate_game(current_date, game_time, normalized_home, normalized_away, state):
-                                        print(f"  ♻️ 중복 경기 제외: {current_date} {game_time} {normalized_away} vs {normalized_home}")
-                                        continue
-
-                                    # KBO 웹사이트에서 team_home div가 실제로는 원정팀, team_away div가 홈팀을 의미함
-                                    game = {
-                                        'date': current_date,
-                                        'away_team': normalized_away,  # team_home div = 원정팀
-                                        'home_team': normalized_home,  # team_away div = 홈팀
-                                        'away_score': home_score,  # team_home 점수 = 원정팀 점수
-                                        'home_score': away_score,  # team_away 점수 = 홈팀 점수
-                                        'state': state,
-                                        'time': game_time,
-                                        'stadium': stadium,
-                                        'sort': sort_info,
-                                        'tv': tv_info,
-                                        'away_info': home_info,  # team_home div = 원정팀 정보
-                                        'home_info': away_info,  # team_away div = 홈팀 정보
-                                        'away_team_short': home_team_short,  # 원정팀 앞 2글자
-                                        'home_team_short': away_team_short   # 홈팀 앞 2글자
-                                    }
-
-                                    games.append(game)
-                                    if state in cancelled_states:
-                                        print(f"  ❌ {normalized_away} vs {normalized_home} [{state}]")
-                                    else:
-                                        print(f"  ✅ {normalized_away} {home_score}:{away_score} {normalized_home} [완료]")
-                            else:
-                                # 경기전 상태인 경기들만 저장 (진행중인 경기는 제외)
-                                if state not in completed_states and state not in cancelled_states and state not in in_progress_states:
-                                    # 경기전 경기 정보 생성
-                                    # 추가 정보 추출
-                                    time_cell = row.find('td', class_='td_time')
-                                    game_time = time_cell.get_text(strip=True) if time_cell else ""
-
-                                    area_cell = row.find('td', class_='td_area')
-                                    stadium_full = area_cell.get_text(strip=True) if area_cell else ""
-                                    stadium = stadium_full[:2] if stadium_full else ""
-
-                                    sort_cell = row.find('td', class_='td_sort')
-                                    sort_info = sort_cell.get_text(strip=True) if sort_cell else ""
-
-                                    tv_cell = row.find('td', class_='td_tv')
-                                    tv_info = tv_cell.get_text(strip=True) if tv_cell else ""
-
-                                    # 정규화된 팀명으로 중복 체크
-                                    normalized_home = self.normalize_team_name(away_team)  # team_away div = 홈팀
-                                    normalized_away = self.normalize_team_name(home_team)  # team_home div = 원정팀
-
-                                    # 중복 체크 - 경기전 경기도 확인 (상태 정보 포함)
-                                    if self.is_duplicate_game(current_date, game_time, normalized_home, normalized_away, state):
-                                        print(f"  ♻️ 중복 경기전 경기 제외: {current_date} {game_time} {normalized_away} vs {normalized_home}")
-                                        continue
-
-                                    # 경기전 경기도 동일한 구조로 생성 (점수는 0:0)
-                                    schedule_game = {
-                                        'date': current_date,
-                                        'away_team': normalized_away,
-                                        'home_team': normalized_home,
-                                        'away_score': 0,
-                                        'home_score': 0,
-                                        'state': state,
-                                        'time': game_time,
-                                        'stadium': stadium,
-                                        'sort': sort_info,
-                                        'tv': tv_info,
-                                        'away_info': '',
-                                        'home_info': '',
-                                        'away_team_short': normalized_away[:2],
-                                        'home_team_short': normalized_home[:2]
-                                    }
-
-                                    # 동일한 games 리스트에 추가
-                                    games.append(schedule_game)
-
-                                    print(f"  📅 {normalized_away} vs {normalized_home} [{state}] - 예정 경기 저장")
-                                elif state in in_progress_states:
-                                    print(f"  ⚾ {self.normalize_team_name(away_team)} vs {self.normalize_team_name(home_team)} [{state}] - 경기중, 완료 후 재크롤링 필요")
-                                else:
-                                    print(f"  ⏳ {self.normalize_team_name(away_team)} vs {self.normalize_team_name(home_team)} [{state}] - 제외")
-                
             except Exception as e:
+                self.metrics.incr('parse_errors')
                 print(f"  ⚠️ 행 {row_idx} 파싱 오류: {e}")
                 continue
-        
-        return games
+
+        self.metrics.record({'name': 'dedup', 'checks': dedup_checks, 'duration_ms': round(dedup_seconds * 1000, 1)})
+        self.metrics.incr('games_extracted', len(diff))
+        return diff
 
     def normalize_team_name(self, team_name):
         """팀명 정규화"""
@@ -526,106 +959,101 @@ class KBOWorkingCrawler:
         except:
             return ""
 
+    def refresh_snapshot(self, store, changed=True):
+        """시즌 파일이 바뀌었거나 스냅샷이 없거나 원본과 다르면 .snap 다시 기록"""
+        if not changed:
+            snapshot = load_snapshot(store.path)
+            if snapshot:
+                snapshot.close()
+                return None
+        try:
+            with self.metrics.timer('snapshot'):
+                path = write_snapshot(store)
+        except OSError as e:
+            # 스냅샷은 캐시일 뿐 - 실패해도 소비자는 텍스트 파일로 대체
+            print(f"⚠️ 스냅샷 기록 실패 (텍스트 파일은 정상 저장됨): {e}")
+            return None
+        print(f"⚡ 스냅샷 갱신: {path.name}")
+        return path
+
     def save_results(self, games, year, month):
-        """결과 저장 - 간소화된 중복 방지 로직"""
+        """결과 저장 - extract_games_from_table의 SeasonDiff(경기 dict 목록이면 여기서 비교)를 시즌 파일에 반영"""
         if not games:
             print("\n❌ 저장할 데이터가 없습니다.")
             return
+        if not isinstance(games, SeasonDiff):
+            games = self.diff_games(games, year)
 
         # 저장 시작 알림
         print(f"💾 {month}월 데이터 저장 시작...")
 
         # PathManager와 일치하는 안전한 경로 사용
-        main_clean_file = Path(self.paths.data_dir) / f'{year}-season-data-clean.txt'
+        main_clean_file = Path(self.paths.data_dir) / season_file_name(year)
 
         # 크롤링 단계에서 이미 중복 제거했으므로 기존 로직 간소화
         print(f"📊 크롤링에서 중복 제거된 경기: {len(games)}개")
 
         if games:
             try:
-                # 기존 데이터 로드
-                all_data = {}
-
-                if main_clean_file.exists():
-                    with open(main_clean_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        current_date = None
-
-                        for line in content.split('\n'):
-                            line = line.strip()
-                            if not line:
-                                continue
-
-                            # 날짜 라인인지 확인
-                            if re.match(r'^\d{4}-\d{2}-\d{2}(\s*\([월화수목금토일]\))?$', line):
-                                # 요일 정보 제거하고 날짜만 추출
-                                date_only = re.match(r'^(\d{4}-\d{2}-\d{2})', line).group(1)
-                                current_date = date_only
-                                if current_date not in all_data:
-                                    all_data[current_date] = set()  # set으로 변경하여 중복 방지
-                            elif current_date:
-                                # 기존 경기 라인 저장 (단, 업데이트될 라인은 제외)
-                                if not hasattr(self, 'lines_to_remove') or line not in self.lines_to_remove:
-                                    all_data[current_date].add(line)
-                                else:
-                                    print(f"  🗑️ 기존 라인 제거: {line[:50]}...")
-
-                # 새로운 경기 추가 (크롤링 단계에서 이미 중복 제거됨)
-                for game in games:
-                    date = game['date']
-                    if date not in all_data:
-                        all_data[date] = set()
-
-                    # 새로운 확장 형식: 열 정렬된 가독성 좋은 형식
-                    if game['state'] in ["취소", "우천취소", "연기", "경기취소"]:
-                        score_part = "취소"
-                    elif game['state'] in ["종료", "완료", "끝"]:
-                        score_part = f"{game['away_score']}:{game['home_score']}"
-                    else:
-                        # 경기전 상태인 경우
-                        score_part = "경기전"
-
-                    # sort 필드에 페넌트레이스가 없으면 추가
-                    sort_info = game['sort']
-                    if not sort_info or sort_info == "":
-                        sort_info = "페넌트레이스"
-                    elif "페넌트레이스" not in sort_info and "올스타" not in sort_info:
-                        sort_info = "페넌트레이스"
-
-                    line = f"{game['time']:<8} {game['state']:<6} {game['stadium']:<6} {game['home_team']:<4} {game['away_team']:<4} {score_part:<8} {game['tv']:<8} {sort_info}"
-
-                    # set에 추가하므로 자동으로 중복 제거됨
-                    all_data[date].add(line)
-
-                # 전체 파일 다시 쓰기
-                with open(main_clean_file, 'w', encoding='utf-8') as f:
-                    first = True
-                    for date in sorted(all_data.keys()):
-                        if not first:
-                            f.write("\n\n")
-                        first = False
-
-                        weekday = self.get_weekday(date)
-                        f.write(f"{date} ({weekday})\n")
-
-                        # 시간순으로 경기 정렬
-                        sorted_games = sorted(list(all_data[date]), key=lambda x: x.split()[0] if x.split() else "")
-                        for line in sorted_games:
-                            f.write(f"{line}\n")
-
-                # 캐시 무효화 - 다음 크롤링에서 새로운 데이터 사용
-                self.existing_games_cache = None
-
-                # 업데이트 표시 제거
-                if hasattr(self, 'lines_to_remove'):
-                    delattr(self, 'lines_to_remove')
-
-                print(f"💾 {len(games)}개 경기를 {main_clean_file}에 저장")
-                print(f"✅ {month}월 데이터 안전하게 저장 완료!")
+                # 기존 데이터 (중복 체크에서 로드한 저장소 재사용)
+                store = self.load_existing_games(year)
+                # 순위 상태는 변경 전 저장소 기준으로 준비 (없거나 오래됐으면 여기서 재계산)
+                self.load_standings(year)
+                records = [GameRecord.from_game(game) for game in games]
+                record_for = {id(game): record for game, record in zip(games, records)}
+
+                with self.metrics.timer('save', phase='merge', month=month) as event:
+                    # 갱신될 경기의 기존 줄 제거 - 새 줄이 기존 줄과 같으면(오늘의 '경기전' 재수집 등)
+                    # 건드리지 않아 날짜가 dirty로 표시되지 않음
+                    replaced_records = []
+                    unchanged = set()
+                    for existing, game in games.updates:
+                        if store.is_stored(record_for[id(game)]):
+                            unchanged.add(id(game))
+                            continue
+                        if store.remove(existing.key):
+                            replaced_records.append(existing)
+                            print(f"  🗑️ 기존 라인 제거: {existing.line[:50]}...")
+                    replaced = len(replaced_records)
+
+                    # 추가/갱신 경기 반영 (크롤링 단계에서 이미 중복 제거됨, 같은 줄은 자동으로 무시)
+                    records = [record for game, record in zip(games, records) if id(game) not in unchanged]
+                    added = sum(store.add(record) for record in records)
+                    event.update(replaced=replaced, added=added, unchanged=len(unchanged))
+                self.metrics.incr('games_replaced', replaced)
+                self.metrics.incr('games_saved', added)
+
+                # 변경된 날짜 블록만 저장 (저널 기록 후 append 또는 원자적 교체)
+                with self.metrics.timer('save', phase='write', month=month) as event:
+                    mode = store.save(run_id=self.metrics.run_id, month=month)
+                    event['mode'] = mode
+
+                # 컬럼형 스냅샷 갱신 - JS 처리 스크립트가 텍스트 파싱 대신 사용
+                self.refresh_snapshot(store, changed=bool(mode))
+
+                # 순위/상대전적은 바뀐 경기만 반영 (상태 파일은 save_standings에서 기록)
+                with self.metrics.timer('standings', phase='apply', month=month) as event:
+                    standings_changed = self.load_standings(year).apply(replaced_records, records)
+                    event['changed'] = standings_changed
+                if standings_changed:
+                    print(f"📊 순위 상태 증분 반영: {standings_changed}경기")
+
+                if mode:
+                    write_kind = '파일 끝에 추가' if mode == 'append' else '변경 블록 반영'
+                    print(f"💾 {len(games)}개 경기를 {main_clean_file}에 저장 ({write_kind})")
+                    print(f"✅ {month}월 데이터 안전하게 저장 완료!")
+                else:
+                    print(f"ℹ️ {month}월 변경 없음 - 파일 쓰기 생략")
 
             except Exception as e:
+                self.metrics.incr('save_errors')
                 print(f"❌ 파일 저장 중 오류 발생: {e}")
                 print(f"💡 수동으로 백업 필요: {len(games)}개 경기 데이터")
+                # 저장 실패 시 메모리 상태를 버리고 다음 접근에서 파일(+저널)을 다시 읽음
+                self.seasons.drop(year)
+                self.standings.pop(year, None)
+                # 변경 감지 기록도 확정하지 않음 - 다음 실행에서 이 월을 다시 처리
+                self.pending_fingerprints.pop((year, month), None)
         else:
             print("ℹ️ 저장할 새로운 경기가 없습니다")
 
@@ -648,8 +1076,72 @@ class KBOWorkingCrawler:
             if len(date_counts) > 10:
                 print(f"  ... 외 {len(date_counts) - 10}일")
 
-def main():
+def parse_args(argv=None):
+    """명령행 옵션 파싱"""
+    parser = argparse.ArgumentParser(description='KBO 다음 스포츠 월별 스케줄 크롤러')
+    parser.add_argument(
+        '--workers', type=int, default=int(os.getenv('KBO_CRAWL_WORKERS', '1')),
+        help='동시에 사용할 WebDriver 수 (기본값: KBO_CRAWL_WORKERS 환경변수 또는 1)'
+    )
+    parser.add_argument(
+        '--backend', choices=KBOWorkingCrawler.FETCH_BACKENDS, default=os.getenv('KBO_FETCH_BACKEND', 'auto'),
+        help='가져오기 백엔드: auto(HTTP 우선, Selenium 대체) / http / selenium / fixture'
+    )
+    parser.add_argument(
+        '--fixture-dir', default=os.getenv('KBO_FIXTURE_DIR'),
+        help='fixture 백엔드에서 재생할 월별 HTML 디렉토리 (YYYYMM.html)'
+    )
+    parser.add_argument(
+        '--screenshots', action='store_true',
+        default=os.getenv('KBO_SCREENSHOTS', '').lower() in ('1', 'true', 'yes'),
+        help='월별 전체 페이지 스크린샷 저장 (HTML 확보 후 비동기 처리)'
+    )
+    parser.add_argument(
+        '--parser', choices=('auto', 'selectolax', 'lxml', 'bs4'), default=os.getenv('KBO_PARSER', 'auto'),
+        help='스케줄 HTML 파서 백엔드 (기본값: 설치된 것 중 가장 빠른 백엔드)'
+    )
+    parser.add_argument(
+        '--live', action='store_true',
+        help='오늘 경기만 짧은 간격으로 폴링하여 종료되는 대로 저장 (모든 경기가 끝나면 종료)'
+    )
+    parser.add_argument(
+        '--force', action='store_true',
+        help='변경 감지를 끄고 대상 월을 모두 가져와 다시 처리'
+    )
+    parser.add_argument(
+        '--resume', action='store_true',
+        help='중단된 이전 실행에서 저장까지 끝난 월은 건너뛰고 이어서 크롤링'
+    )
+    parser.add_argument(
+        '--record-html', default=None,
+        help='가져온 월별 HTML을 fixture로 기록할 디렉토리'
+    )
+    parser.add_argument(
+        '--year', type=int, default=None,
+        help='크롤링할 시즌 (기본값: KBO_SEASON 환경변수 또는 KST 기준 올해) - 지난 시즌은 3~10월 전체'
+    )
+    parser.add_argument(
+        '--prometheus', default=os.getenv('KBO_METRICS_PROM'),
+        help='실행 메트릭을 Prometheus textfile(.prom)로도 기록할 경로 (node_exporter textfile collector)'
+    )
+    return parser.parse_args(argv)
+
+
+def export_metrics(crawler, prometheus_path=None):
+    """실행 메트릭을 logs/crawler-metrics.jsonl에 추가하고, 경로가 있으면 Prometheus textfile도 기록"""
+    metrics_file = crawler.metrics.write_jsonl(crawler.paths.get_log_file('crawler-metrics.jsonl'))
+    print(f"📏 실행 메트릭 기록: {metrics_file}")
+    if prometheus_path:
+        try:
+            print(f"📏 Prometheus 메트릭 기록: {crawler.metrics.write_prometheus(prometheus_path)}")
+        except OSError as e:
+            print(f"⚠️ Prometheus 메트릭 기록 실패: {e}")
+
+
+def main(argv=None):
     """메인 실행"""
+    args = parse_args(argv)
+
     # 수동 실행 체크 - GITHUB_ACTIONS나 MANUAL_RUN 환경변수가 있을 때만 실행
     if not (os.getenv('GITHUB_ACTIONS') or os.getenv('MANUAL_RUN')):
         print("🔒 자동 실행 방지됨")
@@ -663,39 +1155,77 @@ def main():
     print("📡 다음 스포츠 월별 스케줄 크롤링")
     print("=" * 60)
     
-    crawler = KBOWorkingCrawler()
+    crawler = KBOWorkingCrawler(
+        backend=args.backend, fixture_dir=args.fixture_dir,
+        record_dir=args.record_html, screenshots=args.screenshots, parser=args.parser
+    )
+
+    if args.live:
+        crawler.run_live()
+        crawler.metrics.print_summary()
+        export_metrics(crawler, args.prometheus)
+        print("=" * 60)
+        return
     
-    # 3월부터 10월까지 크롤링
-    from datetime import datetime, timezone, timedelta
-    kst = timezone(timedelta(hours=9))
-    current_month = datetime.now(kst).month
+    # 시즌(기본: KST 기준 올해)의 3월부터 10월까지 크롤링 - 올해는 현재 월부터 시즌 끝(10월)까지만
+    year = args.year or crawler.season_year
+    current_month = datetime.now(KST).month
 
     all_games = []
 
-    # 현재 월부터 시즌 끝(10월)까지만 크롤링
-    # KBO 정규시즌: 3월~10월
-    season_months = [3, 4, 5, 6, 7, 8, 9, 10]
-    months_to_crawl = [month for month in season_months if month >= current_month]
+    months_to_crawl = season_months_to_crawl(year)
+
+    # 실행 시작을 저널에 기록 - 중간에 중단되면 --resume으로 남은 월만 이어서 진행
+    journal = crawler.load_existing_games(year).journal
+    unfinished = journal.unfinished_run()
+    if unfinished and unfinished['completed_months']:
+        if args.resume:
+            months_to_crawl = [m for m in months_to_crawl if m not in unfinished['completed_months']]
+            print(f"⏯️ 중단된 실행 {unfinished['run_id']} 이어서 진행 - 완료된 월 제외: {unfinished['completed_months']}")
+        else:
+            print(f"💡 중단된 실행 {unfinished['run_id']}이 있습니다 (완료: {unfinished['completed_months']}월) - --resume으로 이어서 진행 가능")
+    journal.append({'type': 'begin', 'run_id': crawler.metrics.run_id, 'months': months_to_crawl})
+
+    # 오늘이 속한 월/결과가 안 들어온 경기가 있는 월만 매번 확인, 나머지는 KBO_COLD_MONTH_TTL_HOURS마다
+    skipped_months = []
+    if not args.force:
+        months_to_crawl, skipped_months = plan_months(
+            months_to_crawl, year, crawler.load_existing_games(year), crawler.load_fingerprints(year)
+        )
 
-    print(f"📅 현재 {current_month}월 - 크롤링 대상: {months_to_crawl}월")
+    print(f"📅 {year} 시즌 (현재 {current_month}월) - 크롤링 대상: {months_to_crawl}월")
+    if skipped_months:
+        print(f"💤 최근 확인한 비활성 월 건너뜀: {skipped_months}월 (--force로 모두 크롤링)")
 
     # 크롤링 성공/실패 추적
     successful_months = []
     failed_months = []
 
-    for month in months_to_crawl:
+    unchanged_months = []
+
+    for month, games, error in crawler.iter_crawl_months(year, months_to_crawl, workers=args.workers,
+                                                         skip_unchanged=not args.force):
         try:
-            print(f"\n🗓️ {month}월 크롤링 시작...")
-            games = crawler.crawl_daum_kbo(2025, month)
+            if error:
+                raise error
+
+            if games is None:
+                unchanged_months.append(month)
+                continue
 
             if games:
                 # 즉시 저장 - 다음 월 크롤링이 실패해도 이미 크롤링한 데이터는 보존됨
-                crawler.save_results(games, 2025, month)
+                crawler.save_results(games, year, month)
                 all_games.extend(games)
                 successful_months.append(month)
                 print(f"✅ {month}월 크롤링 완료 및 저장! ({len(games)}개 경기)")
+            elif isinstance(games, SeasonDiff) and games.noops:
+                # 경기는 있지만 모두 저장된 그대로 - 정상 확인
+                unchanged_months.append(month)
+                print(f"💤 {month}월 새 경기/변경 없음 ({len(games.noops)}개 경기 유지)")
             else:
                 print(f"⚠️ {month}월 크롤링 결과 없음")
+            crawler.commit_month_fingerprint(year, month)
 
         except Exception as e:
             failed_months.append(month)
@@ -711,15 +1241,34 @@ def main():
         print(f"📊 총 {len(all_games)}개 경기 수집 및 저장 완료")
     if failed_months:
         print(f"❌ 실패한 월: {', '.join(map(str, failed_months))}")
+    if unchanged_months or skipped_months:
+        print(f"💤 변경 없음: {', '.join(map(str, unchanged_months)) or '-'} / 확인 생략: {', '.join(map(str, skipped_months)) or '-'}")
 
-    if not all_games:
-        print("\n❌ 전체 크롤링 실패 - 데이터 없음")
+    # 저장이 없었던 실행에서도 스냅샷이 원본과 맞도록 유지
+    crawler.refresh_snapshot(crawler.load_existing_games(year), changed=False)
+    crawler.save_standings(year)
+
+    # 실행 완료 - 이전에 중단된 실행까지 모두 정리
+    # 실패한 월이 있으면 실행을 열어 둠 (다음 실행에서 --resume으로 실패한 월만 다시 크롤링)
+    if failed_months:
+        print(f"⏯️ 실패한 월이 있어 실행 기록 유지 - --resume으로 실패한 월만 다시 크롤링")
     else:
+        journal.clear()
+
+    # 대기/단계별 소요 시간 기록
+    crawler.metrics.print_summary()
+    export_metrics(crawler, args.prometheus)
+
+    if all_games:
         print(f"\n🎯 크롤링 종료! 총 {len(all_games)}개 경기 처리")
 
         # 크롤링 성공 시 데이터 처리 및 분석 스크립트 자동 실행
         print("\n🚀 크롤링 완료 - 자동 데이터 처리 시작...")
         run_post_crawl_processing()
+    elif failed_months and not successful_months and not unchanged_months:
+        print("\n❌ 전체 크롤링 실패 - 데이터 없음")
+    else:
+        print("\n💤 새로 저장할 경기 없음 - 후처리 생략")
 
     print("=" * 60)
 
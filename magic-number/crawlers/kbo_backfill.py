@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+KBO 과거 시즌 일괄 백필
+- 날짜 범위(여러 시즌 가능)의 월별 스케줄을 요청 속도 제한 안에서 동시에 가져오고
+  월 순서대로 중복 판정 → 증분 저장(SeasonStore 저널/append) 경로로 반영
+- 월마다 체크포인트(logs/backfill-*.json)를 기록 - 중단 후 다시 실행하면 끝난 월은 건너뜀
+- 끝나면 예상 일정과 비교한 누락 보고 (날짜별 페이지 행 수 / 팀별 144경기 / 팀 쌍별 16경기)
+
+사용법:
+  python3 magic-number/crawlers/kbo_backfill.py --from 2023 --to 2025-04-15 [--workers 3] [--rate 0.5]
+  python3 magic-number/crawlers/kbo_backfill.py --from 2025-03 --to 2025-04 --report-only
+"""
+
+import argparse
+import calendar
+import importlib.util
+import json
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from itertools import combinations
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from kbo_game_states import DedupAction, SeasonDiff
+from kbo_metrics import KST
+from kbo_parsers import iter_dated_rows
+from kbo_season_store import CANCELLED_STATES, FINISHED_STATES, atomic_write_text
+
+CRAWLER_FILE = Path(__file__).resolve().parent / 'kbo-python-working-crawler.py'
+REGULAR_SEASON = "페넌트레이스"
+SEASON_GAMES = 144   # 정규시즌 팀당 경기 수
+GAMES_PER_PAIR = 16  # 팀 쌍별 경기 수 (9팀 × 16경기)
+DATE_ARG = re.compile(r'^(\d{4})(?:-(\d{1,2}))?(?:-(\d{1,2}))?$')
+
+
+def load_crawler_module():
+    """하이픈이 들어간 크롤러 파일을 모듈로 로드"""
+    spec = importlib.util.spec_from_file_location('kbo_working_crawler', CRAWLER_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def parse_date_arg(value: str, end: bool = False) -> date:
+    """YYYY / YYYY-MM / YYYY-MM-DD → 범위의 첫날(end이면 마지막 날)"""
+    match = DATE_ARG.match(value)
+    if not match:
+        raise argparse.ArgumentTypeError(f"날짜 형식 오류: {value} (YYYY, YYYY-MM, YYYY-MM-DD)")
+    year = int(match.group(1))
+    month = int(match.group(2) or (12 if end else 1))
+    if match.group(3):
+        return date(year, month, int(match.group(3)))
+    return date(year, month, calendar.monthrange(year, month)[1] if end else 1)
+
+
+def months_in_range(start: date, end: date, season_months) -> List[Tuple[int, int]]:
+    """범위에 걸친 (연도, 월) 중 정규시즌 월만"""
+    months = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        if month in season_months:
+            months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+class RateLimiter:
+    """요청 시작 간격을 1/rate초 이상으로 유지 (워커 스레드 공용)"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class BackfillCheckpoint:
+    """월별 진행 기록 (JSON) - {"range": [...], "months": {"YYYY-MM": {"status", "saved", "rows", "expected", ...}}}"""
+
+    def __init__(self, path: Path, start: date, end: date):
+        self.path = Path(path)
+        self.data = {'range': [start.isoformat(), end.isoformat()], 'months': {}}
+        if self.path.exists():
+            try:
+                self.data = json.loads(self.path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                print(f"⚠️ 체크포인트를 읽지 못해 처음부터 진행: {self.path}")
+
+    @staticmethod
+    def month_key(year: int, month: int) -> str:
+        return f"{year}-{month:02d}"
+
+    def get(self, year: int, month: int) -> Optional[Dict]:
+        return self.data['months'].get(self.month_key(year, month))
+
+    def is_done(self, year: int, month: int) -> bool:
+        entry = self.get(year, month)
+        return bool(entry) and entry.get('status') == 'done'
+
+    def record(self, year: int, month: int, **info):
+        """월 결과 기록 후 바로 디스크에 반영 (원자적 교체)"""
+        self.data['months'][self.month_key(year, month)] = {
+            **info, 'at': datetime.now(KST).isoformat(timespec='seconds')
+        }
+        self.save()
+
+    def save(self):
+        atomic_write_text(self.path, json.dumps(self.data, ensure_ascii=False, indent=2) + "\n")
+
+
+def rows_per_date(rows, year: int, start: date, end: date) -> Dict[str, int]:
+    """스케줄 페이지의 날짜별 경기 행 수 (범위 안만) - 누락 비교 기준"""
+    counts = {}
+    lo, hi = start.isoformat(), end.isoformat()
+    for game_date, row in iter_dated_rows(rows, year):
+        if row.home_team is not None and lo <= game_date <= hi:
+            counts[game_date] = counts.get(game_date, 0) + 1
+    return counts
+
+
+def within_range(diff: SeasonDiff, start: date, end: date) -> SeasonDiff:
+    """범위 밖 날짜를 뺀 SeasonDiff (월 중간에서 시작/끝나는 범위)"""
+    lo, hi = start.isoformat(), end.isoformat()
+    result = SeasonDiff()
+    for game in diff.inserts:
+        if lo <= game['date'] <= hi:
+            result.add(DedupAction.INSERT, game)
+    for existing, game in diff.updates:
+        if lo <= game['date'] <= hi:
+            result.add(DedupAction.UPDATE, game, existing)
+    result.noops = [key for key in diff.noops if lo <= key[0] <= hi]
+    return result
+
+
+def season_gaps(store, expected_by_date: Dict[str, int], start: date, end: date) -> Dict:
+    """한 시즌의 누락 보고 - 페이지보다 저장된 경기가 적은 날짜, 144경기/16경기에 못 미치는 팀/팀 쌍
+
+    팀/팀 쌍 경기 수는 종료 + 예정(취소 제외) 정규시즌 경기 기준
+    """
+    lo, hi = start.isoformat(), end.isoformat()
+    missing_dates = {}
+    for game_date, expected in sorted(expected_by_date.items()):
+        stored = len(store.games_on(game_date))
+        if stored < expected:
+            missing_dates[game_date] = {'page': expected, 'stored': stored}
+
+    finished, scheduled, pairs = {}, {}, {}
+    for record in store:
+        if REGULAR_SEASON not in record.sort or record.state in CANCELLED_STATES:
+            continue
+        counts = finished if record.state in FINISHED_STATES else scheduled
+        for team in (record.home_team, record.away_team):
+            counts[team] = counts.get(team, 0) + 1
+        pair = tuple(sorted((record.home_team, record.away_team)))
+        pairs[pair] = pairs.get(pair, 0) + 1
+
+    teams = sorted(set(finished) | set(scheduled))
+    team_gaps = {
+        team: {'finished': finished.get(team, 0), 'scheduled': scheduled.get(team, 0),
+               'missing': SEASON_GAMES - finished.get(team, 0) - scheduled.get(team, 0)}
+        for team in teams
+        if finished.get(team, 0) + scheduled.get(team, 0) < SEASON_GAMES
+    }
+    pair_gaps = {
+        f"{a}-{b}": GAMES_PER_PAIR - pairs.get((a, b), 0)
+        for a, b in combinations(teams, 2)
+        if pairs.get((a, b), 0) < GAMES_PER_PAIR
+    }
+    in_range = sum(len(records) for game_date, records in store.by_date.items() if lo <= game_date <= hi)
+    return {'games_in_range': in_range, 'missing_dates': missing_dates, 'teams': team_gaps, 'pairs': pair_gaps}
+
+
+def print_report(report: Dict[int, Dict]):
+    print("\n📋 누락 보고 (예상 일정 대비)")
+    for year, gaps in sorted(report.items()):
+        print(f"\n[{year}] 범위 내 저장 경기 {gaps['games_in_range']}개")
+        if gaps['missing_dates']:
+            print(f"  ⚠️ 페이지보다 저장 경기가 적은 날짜 {len(gaps['missing_dates'])}일:")
+            for game_date, item in list(gaps['missing_dates'].items())[:20]:
+                print(f"     {game_date}: 페이지 {item['page']}경기 / 저장 {item['stored']}경기")
+        else:
+            print("  ✅ 날짜별 누락 없음")
+        if gaps['teams']:
+            print(f"  ℹ️ {SEASON_GAMES}경기에 못 미치는 팀 (종료 + 예정):")
+            for team, item in gaps['teams'].items():
+                print(f"     {team}: 종료 {item['finished']} + 예정 {item['scheduled']} → {item['missing']}경기 부족")
+        if gaps['pairs']:
+            short = ', '.join(f"{pair} {missing}" for pair, missing in list(gaps['pairs'].items())[:12])
+            print(f"  ℹ️ 팀 쌍별 {GAMES_PER_PAIR}경기 부족: {short}{' ...' if len(gaps['pairs']) > 12 else ''}")
+
+
+def run_backfill(crawler, months, start: date, end: date, checkpoint: BackfillCheckpoint,
+                 pool_class, workers: int = 2, rate: float = 0.5, headless: bool = True) -> List[Tuple[int, int]]:
+    """체크포인트에 없는 월을 가져와 저장 - 실패한 (연도, 월) 목록 반환
+
+    pool_class는 크롤러 모듈의 WebDriverPool (HTTP 백엔드가 실패한 월이 있을 때만 브라우저 생성)
+    가져오기만 워커 스레드에서 동시에 하고, 파싱/중복 판정/저장은 월 순서대로 호출 스레드에서 진행
+    """
+    todo = [(year, month) for year, month in months if not checkpoint.is_done(year, month)]
+    done = len(months) - len(todo)
+    if done:
+        print(f"⏯️ 체크포인트에서 완료된 {done}개월 건너뜀")
+    if not todo:
+        return []
+
+    workers = max(1, min(workers, len(todo)))
+    limiter = RateLimiter(rate)
+    fetchers = crawler.build_fetchers(pool_size=workers)
+    use_browser = crawler.backend in ('auto', 'selenium')
+    failed = []
+    print(f"🧵 백필 {len(todo)}개월, 워커 {workers}개, 초당 {rate:g}회 이하, 백엔드 {crawler.backend}")
+
+    def fetch(year, month, pool):
+        limiter.wait()
+        return crawler.fetch_month(year, month, fetchers, pool if use_browser else None)
+
+    try:
+        with pool_class(crawler, size=workers, headless=headless) as pool:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='kbo-backfill') as executor:
+                futures = [((year, month), executor.submit(fetch, year, month, pool)) for year, month in todo]
+                for (year, month), future in futures:
+                    print(f"\n📡 {year}년 {month}월 백필...")
+                    try:
+                        html = future.result()
+                        with crawler.metrics.timer('parse', phase='rows', parser=crawler.parser.name):
+                            rows = crawler.parser.parse_rows(html) or []
+                        expected = rows_per_date(rows, year, start, end)
+                        diff = within_range(crawler.extract_games_from_table(rows, year), start, end)
+
+                        save_errors = crawler.metrics.counters.get('save_errors', 0)
+                        if diff:
+                            crawler.save_results(diff, year, month)
+                        if crawler.metrics.counters.get('save_errors', 0) > save_errors:
+                            raise RuntimeError("저장 실패")
+                    except Exception as e:
+                        failed.append((year, month))
+                        checkpoint.record(year, month, status='failed', error=str(e))
+                        print(f"❌ {year}년 {month}월 백필 실패: {e} - 다시 실행하면 이 월부터 재시도")
+                        continue
+
+                    checkpoint.record(year, month, status='done', rows=sum(expected.values()),
+                                      saved=len(diff), updated=len(diff.updates), expected=expected)
+                    print(f"✅ {year}년 {month}월: 페이지 {sum(expected.values())}경기, 저장 {len(diff)}경기 "
+                          f"(갱신 {len(diff.updates)}, 변경 없음 {len(diff.noops)})")
+    finally:
+        for fetcher in fetchers:
+            fetcher.close()
+    return failed
+
+
+def build_report(crawler, months, start: date, end: date, checkpoint: BackfillCheckpoint) -> Dict[int, Dict]:
+    """체크포인트의 날짜별 페이지 행 수와 저장된 시즌을 비교한 연도별 누락 보고"""
+    report = {}
+    for year in sorted({year for year, _ in months}):
+        expected = {}
+        for y, month in months:
+            entry = checkpoint.get(y, month)
+            if y == year and entry and entry.get('status') == 'done':
+                expected.update(entry.get('expected', {}))
+        report[year] = season_gaps(crawler.load_existing_games(year), expected, start, end)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='KBO 과거 시즌 일괄 백필 (중단 후 이어서 진행 가능)')
+    parser.add_argument('--from', dest='start', required=True, help='시작 (YYYY, YYYY-MM, YYYY-MM-DD)')
+    parser.add_argument('--to', dest='end', required=True, help='끝 (YYYY, YYYY-MM, YYYY-MM-DD)')
+    parser.add_argument('--workers', type=int, default=int(os.getenv('KBO_CRAWL_WORKERS', '2')),
+                        help='동시에 가져올 월 수 (브라우저 백엔드면 WebDriver 수)')
+    parser.add_argument('--rate', type=float, default=float(os.getenv('KBO_BACKFILL_RATE', '0.5')),
+                        help='초당 최대 요청 수 (기본 0.5 = 2초에 한 번)')
+    parser.add_argument('--backend', default=os.getenv('KBO_FETCH_BACKEND', 'auto'),
+                        help='가져오기 백엔드: auto / http / selenium / fixture')
+    parser.add_argument('--fixture-dir', default=os.getenv('KBO_FIXTURE_DIR'),
+                        help='fixture 백엔드에서 재생할 월별 HTML 디렉토리 (YYYYMM.html)')
+    parser.add_argument('--parser', default=os.getenv('KBO_PARSER', 'auto'), help='스케줄 HTML 파서 백엔드')
+    parser.add_argument('--checkpoint', default=None, help='체크포인트 파일 (기본: logs/backfill-시작_끝.json)')
+    parser.add_argument('--restart', action='store_true', help='체크포인트를 무시하고 처음부터 다시')
+    parser.add_argument('--report-only', action='store_true', help='가져오지 않고 저장된 데이터로 누락 보고만')
+    parser.add_argument('--show-browser', action='store_true', help='브라우저 창 표시 (기본: headless)')
+    args = parser.parse_args(argv)
+
+    start, end = parse_date_arg(args.start), parse_date_arg(args.end, end=True)
+    if start > end:
+        parser.error(f"시작({start})이 끝({end})보다 늦습니다")
+
+    module = load_crawler_module()
+    crawler = module.KBOWorkingCrawler(backend=args.backend, fixture_dir=args.fixture_dir, parser=args.parser)
+    months = months_in_range(start, end, module.SEASON_MONTHS)
+    if not months:
+        print(f"ℹ️ {start} ~ {end}에 정규시즌 월이 없습니다")
+        return 0
+
+    checkpoint_path = Path(args.checkpoint) if args.checkpoint else \
+        crawler.paths.get_log_file(f'backfill-{start:%Y%m%d}_{end:%Y%m%d}.json')
+    if args.restart and checkpoint_path.exists():
+        checkpoint_path.unlink()
+    checkpoint = BackfillCheckpoint(checkpoint_path, start, end)
+    print(f"📅 백필 범위 {start} ~ {end}: {len(months)}개월 / 체크포인트 {checkpoint_path}")
+
+    failed = []
+    if not args.report_only:
+        failed = run_backfill(crawler, months, start, end, checkpoint, module.WebDriverPool,
+                              workers=args.workers, rate=args.rate, headless=not args.show_browser)
+        for year in sorted({year for year, _ in months}):
+            crawler.refresh_snapshot(crawler.load_existing_games(year), changed=False)
+            crawler.save_standings(year)
+
+    report = build_report(crawler, months, start, end, checkpoint)
+    print_report(report)
+    checkpoint.data['report'] = {str(year): gaps for year, gaps in report.items()}
+    checkpoint.save()
+
+    crawler.metrics.print_summary()
+    module.export_metrics(crawler)
+    if failed:
+        print(f"\n❌ 실패한 월: {', '.join(f'{y}-{m:02d}' for y, m in failed)} - 같은 명령으로 다시 실행하면 이어서 진행")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+크롤링 → 저장 경로 벤치마크 (네트워크 없음)
+- 커밋된 실제 월별 스케줄 HTML(fixtures/schedule/, --record-html로 기록)을 재생하여
+  extract_games_from_table(파싱 + 중복 판정) → save_results 시간을 측정
+  (기록이 없는 시즌은 시즌 데이터로 재구성한 마크업 - 실제 페이지 구조 변화는 감지하지 못함, --require-recorded로 실패 처리)
+- 실제 시즌의 1×/10×/100× 크기 합성 시즌으로 load_existing_games 시간을 측정
+- 고정 보정 작업(calibration) 시간에 대한 비율로 기록하여 기준선 JSON과 비교 -
+  머신/부하가 달라도 같은 코드면 비율이 같음, 허용 범위를 넘게 느려진 항목이 있으면 실패(종료 코드 1)
+
+사용법:
+  python3 magic-number/crawlers/kbo_bench_crawl.py [--snapshots DIR] [--repeat N] [--threshold 0.25]
+  python3 magic-number/crawlers/kbo_bench_crawl.py --save-baseline   # 현재 결과를 기준선으로 기록
+"""
+
+import argparse
+import copy
+import importlib.util
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from kbo_fixtures import RECORDED_DIR, load_month_snapshots, recorded_snapshots
+from kbo_metrics import KST
+from kbo_season_store import FINISHED_STATES, GameRecord, SeasonStore, atomic_write_text, latest_season, season_file_name
+
+CRAWLER_FILE = Path(__file__).resolve().parent / 'kbo-python-working-crawler.py'
+DEFAULT_BASELINE = Path(__file__).resolve().parent / 'kbo_bench_baseline.json'
+SCALES = (1, 10, 100)
+CALIBRATION_REPEAT = 3
+# 수 ms 이하 항목은 한 번의 잡음(GC, 캐시)이 비율을 크게 흔들어 여러 번 실행한 평균을 한 표본으로 사용
+FAST_CASE_BATCH = 20
+
+
+def load_crawler_module():
+    """하이픈이 들어간 크롤러 파일을 모듈로 로드"""
+    spec = importlib.util.spec_from_file_location('kbo_working_crawler', CRAWLER_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_crawler(module, data_dir: Path, parser=None):
+    """data_dir을 데이터 경로로 쓰는 크롤러 (공용 PathManager는 건드리지 않음)"""
+    with redirect_stdout(io.StringIO()):
+        crawler = module.KBOWorkingCrawler(backend='http', parser=parser)
+    crawler.paths = copy.copy(crawler.paths)
+    crawler.paths.data_dir = data_dir
+    return crawler
+
+
+def stale_season(store: SeasonStore, path: Path, year: int, months: int = 2, drop_every: int = 10) -> SeasonStore:
+    """재생용 이전 상태 시즌 - 마지막 months개월의 완료 경기는 경기전으로, 그 전 경기는 drop_every개마다 하나 삭제
+
+    재생하면 갱신(경기전 → 종료)과 추가, 나머지는 중복 판정 경로를 모두 거침
+    """
+    month_list = sorted({date[5:7] for date in store.by_date if date.startswith(f'{year}-')})
+    recent = set(month_list[-months:])
+    stale = SeasonStore(year, path)
+    for idx, record in enumerate(store):
+        if record.date[5:7] in recent and record.state in FINISHED_STATES:
+            record = GameRecord(record.date, record.time, '경기전', record.stadium, record.home_team,
+                                record.away_team, '경기전', record.tv, record.sort)
+        elif idx % drop_every == 0:
+            continue
+        stale.add(GameRecord(record.date, record.time, record.state, record.stadium, record.home_team,
+                             record.away_team, record.score, record.tv, record.sort))
+    stale.write(path)
+    return stale
+
+
+def synthetic_season_text(season_text: str, year: int, scale: int) -> str:
+    """시즌 파일을 연도만 바꿔 scale번 이어 붙인 합성 시즌 (날짜 키가 겹치지 않음)"""
+    if scale == 1:
+        return season_text
+    parts = [season_text]
+    for offset in range(1, scale):
+        shifted = '\n'.join(
+            f"{year + offset}{line[4:]}" if line.startswith(f'{year}-') else line
+            for line in season_text.split('\n')
+        )
+        parts.append(shifted)
+    return '\n'.join(part.rstrip('\n') for part in parts) + '\n'
+
+
+def reset_data_dir(data_dir: Path, season_file_name: str, source: Path):
+    """시즌 파일을 원본으로 되돌리고 저널/스냅샷 제거"""
+    for path in data_dir.iterdir():
+        path.unlink()
+    shutil.copyfile(source, data_dir / season_file_name)
+
+
+def bench_replay(module, snapshots, season_file: Path, year: int, repeat: int, parser=None):
+    """월별 HTML 재생 - (extract 시간 목록, save 시간 목록, 결과 경기 수, 기대 경기 수)"""
+    original = SeasonStore.read(season_file, year=year)
+    with tempfile.TemporaryDirectory(prefix='kbo-bench-') as tmp:
+        tmp = Path(tmp)
+        pristine = tmp / 'stale.txt'
+        stale_season(original, pristine, year)
+        data_dir = tmp / 'data'
+        data_dir.mkdir()
+
+        extract_timings, save_timings = [], []
+        final_count = 0
+        for _ in range(repeat):
+            reset_data_dir(data_dir, season_file.name, pristine)
+            crawler = make_crawler(module, data_dir, parser)
+            extract_total = save_total = 0.0
+            with redirect_stdout(io.StringIO()):
+                crawler.load_existing_games(year)
+                for label, html in snapshots:
+                    start = time.perf_counter()
+                    games = crawler.extract_games_from_table(html, year)
+                    extract_total += time.perf_counter() - start
+                    start = time.perf_counter()
+                    crawler.save_results(games, year, int(label[4:]))
+                    save_total += time.perf_counter() - start
+            extract_timings.append(extract_total)
+            save_timings.append(save_total)
+            final_count = len(SeasonStore.read(data_dir / season_file.name, year=year))
+    return extract_timings, save_timings, final_count, len(original)
+
+
+def bench_duplicates(module, season_file: Path, year: int, repeat: int, batch: int = 1):
+    """시즌의 모든 경기를 diff_games로 다시 판정 (대부분 변경 없음 경로) - 시간은 batch회 평균"""
+    store = SeasonStore.read(season_file, year=year)
+    games = [{'date': record.date, 'time': record.time, 'home_team': record.home_team,
+              'away_team': record.away_team, 'state': record.state} for record in store]
+    with tempfile.TemporaryDirectory(prefix='kbo-bench-') as tmp:
+        data_dir = Path(tmp)
+        shutil.copyfile(season_file, data_dir / season_file.name)
+        crawler = make_crawler(module, data_dir)
+        timings = []
+        with redirect_stdout(io.StringIO()):
+            crawler.load_existing_games(year)
+            for _ in range(repeat):
+                start = time.perf_counter()
+                for _ in range(batch):
+                    crawler.diff_games(games, year)
+                timings.append((time.perf_counter() - start) / batch)
+    return timings, len(games)
+
+
+def bench_load(module, season_file: Path, year: int, scale: int, repeat: int, batch: int = 1):
+    """scale배 합성 시즌의 load_existing_games - (batch회 평균 시간 목록, 경기 수, 파일 크기)"""
+    text = synthetic_season_text(season_file.read_text(encoding='utf-8'), year, scale)
+    with tempfile.TemporaryDirectory(prefix='kbo-bench-') as tmp:
+        data_dir = Path(tmp)
+        (data_dir / season_file.name).write_text(text, encoding='utf-8')
+        crawler = make_crawler(module, data_dir)
+        timings = []
+        games = 0
+        with redirect_stdout(io.StringIO()):
+            for _ in range(repeat):
+                elapsed = 0.0
+                for _ in range(batch):
+                    if crawler.seasons is not None:
+                        crawler.seasons.drop(year)
+                    start = time.perf_counter()
+                    games = len(crawler.load_existing_games(year))
+                    elapsed += time.perf_counter() - start
+                timings.append(elapsed / batch)
+    return timings, games, len(text.encode('utf-8'))
+
+
+def calibration_work(lines: int = 20000) -> int:
+    """보정용 고정 작업 - 저장소 코드와 무관하게 시즌 파일 처리와 비슷한 연산(줄 생성/분할/딕셔너리/정렬/파일 I/O)"""
+    rows = [f"{18 + i % 4}:30 종료 잠실 T{i % 10} {i % 7}:{i % 5} T{(i + 3) % 10} SPO-T 페넌트레이스"
+            for i in range(lines)]
+    index = {}
+    for i, row in enumerate(rows):
+        parts = row.split()
+        index.setdefault((parts[3], parts[5]), []).append((i, parts[0], parts[4]))
+    ordered = sorted(index.items())
+    with tempfile.TemporaryDirectory(prefix='kbo-bench-') as tmp:
+        path = Path(tmp) / 'calibration.txt'
+        path.write_text('\n'.join(rows), encoding='utf-8')
+        text = path.read_text(encoding='utf-8')
+    return len(ordered) + len(text)
+
+
+def bench_calibration(repeat: int) -> List[float]:
+    """보정 작업 시간 목록"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        calibration_work()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def calibrated(run, repeat: int = CALIBRATION_REPEAT):
+    """run() 앞뒤로 보정 작업 실행 - (run 결과, 그 구간의 보정 작업 최소 시간)
+
+    항목마다 바로 옆에서 잰 보정 시간으로 나누므로 실행 도중 머신 속도가 바뀌어도 비율이 안정적
+    """
+    before = bench_calibration(repeat)
+    result = run()
+    return result, min(before + bench_calibration(repeat))
+
+
+def compare_with_baseline(results, baseline, threshold):
+    """보정 작업 대비 비율이 기준선보다 threshold 넘게 커진 항목 목록"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get('cases', {}).get(name)
+        if not base or 'relative' not in base:
+            continue
+        limit = base['relative'] * (1 + threshold)
+        if result['relative'] > limit:
+            regressions.append(f"{name}: 보정 대비 {result['relative']:.2f}배 > 기준 {base['relative']:.2f}배 × {1 + threshold:.2f}"
+                               f" ({result['min_ms']:.1f}ms)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='크롤링 → 저장 경로 벤치마크')
+    parser.add_argument('--snapshots', default=str(RECORDED_DIR), help='기록된 월별 HTML 디렉토리 (YYYYMM.html, 기본: fixtures/schedule)')
+    parser.add_argument('--require-recorded', action='store_true', help='기록된 HTML이 없으면 재구성하지 않고 실패')
+    parser.add_argument('--year', type=int, default=None, help='시즌 (기본: 기준선의 시즌, 없으면 KBO_SEASON 또는 데이터가 있는 가장 최근 시즌)')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수')
+    parser.add_argument('--parser', default=None, help='스케줄 HTML 파서 백엔드 (기본: KBO_PARSER 또는 auto)')
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='기준선 JSON 경로')
+    parser.add_argument('--threshold', type=float, default=float(os.getenv('KBO_BENCH_THRESHOLD', '0.25')),
+                        help='허용 성능 저하 비율 (기본 0.25 = 25%%)')
+    parser.add_argument('--save-baseline', action='store_true', help='현재 결과를 기준선으로 기록')
+    args = parser.parse_args(argv)
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text(encoding='utf-8')) if baseline_path.exists() else {}
+
+    module = load_crawler_module()
+    data_dir = Path(module.get_path_manager().data_dir)
+    # 기준선과 같은 시즌 파일로 비교 (--save-baseline은 가장 최근 시즌)
+    args.year = args.year or (None if args.save_baseline else baseline.get('year')) or latest_season(data_dir)
+    season_file = data_dir / season_file_name(args.year)
+    if not season_file.exists():
+        print(f"❌ 시즌 파일 없음: {season_file} (--year 또는 KBO_SEASON 확인)")
+        return 1
+    recorded = bool(recorded_snapshots(args.snapshots, args.year))
+    if not recorded:
+        print(f"⚠️ {args.year} 시즌 기록된 HTML 없음 ({args.snapshots}) - 시즌 파일로 재구성한 마크업 재생"
+              f" (npm run record-fixtures -- --year {args.year}로 기록)")
+        if args.require_recorded:
+            return 1
+    snapshots = load_month_snapshots(args.snapshots, year=args.year, season_file=season_file)
+    print(f"📄 {'기록된' if recorded else '재구성'} 스냅샷 {len(snapshots)}개월,"
+          f" 시즌 파일 {season_file.stat().st_size / 1024:.0f}KB, 반복 {args.repeat}회")
+    if baseline and baseline.get('snapshots', 'rendered') != ('recorded' if recorded else 'rendered'):
+        print("⚠️ 기준선과 재생 HTML 종류가 다름 - --save-baseline으로 다시 기록하세요")
+
+    # 항목 이름 → (시간 목록, 바로 옆에서 잰 보정 작업 시간)
+    timings = {}
+    (extract, save, final_count, expected), calibration = calibrated(
+        lambda: bench_replay(module, snapshots, season_file, args.year, args.repeat, args.parser))
+    if final_count != expected:
+        print(f"❌ 재생 결과 경기 수 {final_count}개 (원본 {expected}개)")
+        return 1
+    timings['replay.extract_games_from_table'] = (extract, calibration)
+    timings['replay.save_results'] = (save, calibration)
+
+    (duplicates, checked), calibration = calibrated(
+        lambda: bench_duplicates(module, season_file, args.year, args.repeat, FAST_CASE_BATCH))
+    timings['dedup.diff_games'] = (duplicates, calibration)
+
+    for scale in SCALES:
+        repeat = max(1, min(args.repeat, 3)) if scale == 100 else args.repeat
+        (load, games, size), calibration = calibrated(
+            lambda: bench_load(module, season_file, args.year, scale, repeat, FAST_CASE_BATCH if scale == 1 else 1))
+        timings[f'load_existing_games.{scale}x'] = (load, calibration)
+        print(f"   합성 시즌 {scale}×: {games:,}경기, {size / 1024:,.0f}KB")
+
+    results = {
+        name: {'min_ms': round(min(values) * 1000, 3), 'median_ms': round(statistics.median(values) * 1000, 3),
+               'relative': round(min(values) / calibration, 4)}
+        for name, (values, calibration) in timings.items()
+    }
+    calibration_ms = statistics.median(calibration for _, calibration in timings.values()) * 1000
+    print(f"\n{'항목':<34}{'최소(ms)':>10}{'중앙값(ms)':>12}{'보정 대비':>10}{'기준':>8}")
+    for name, result in results.items():
+        base = baseline.get('cases', {}).get(name)
+        base_text = f"{base['relative']:>8.2f}" if base and 'relative' in base else f"{'-':>8}"
+        print(f"{name:<34}{result['min_ms']:>10.1f}{result['median_ms']:>12.1f}{result['relative']:>10.2f}{base_text}")
+    base_calibration = baseline.get('calibration_ms')
+    print(f"(보정 작업 {calibration_ms:.1f}ms{f' / 기준선 {base_calibration:.1f}ms' if base_calibration else ''},"
+          f" dedup.diff_games 경기 {checked}개 기준)")
+
+    if args.save_baseline:
+        atomic_write_text(baseline_path, json.dumps({
+            'recorded_at': datetime.now(KST).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'machine': f"{platform.system()} {platform.machine()}",
+            'repeat': args.repeat,
+            'year': args.year,
+            'snapshots': 'recorded' if recorded else 'rendered',
+            'calibration_ms': round(calibration_ms, 3),
+            'cases': results,
+        }, ensure_ascii=False, indent=2) + "\n")
+        print(f"\n💾 기준선 기록: {baseline_path}")
+        return 0
+
+    if not baseline:
+        print(f"\nℹ️ 기준선 없음 - --save-baseline으로 기록하세요 ({baseline_path})")
+        return 0
+    regressions = compare_with_baseline(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n❌ 성능 저하 {len(regressions)}건 (허용 {args.threshold * 100:.0f}%)")
+        for line in regressions:
+            print(f"   {line}")
+        return 1
+    print(f"\n✅ 모든 항목이 기준선 대비 허용 범위({args.threshold * 100:.0f}%) 이내")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
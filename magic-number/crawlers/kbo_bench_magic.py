@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+매직넘버 엔진 검증 + 벤치마크
+1) 현재 데이터로 계산한 값이 JS 출력(calc-magic-numbers.json, ui-magic-matrix-precomputed.json)과 같은지 확인
+2) 무작위 what-if 시나리오(남은 경기 승/패 배분)를 한 번에 계산하는 처리량을
+   시나리오를 하나씩 계산하는 경우와 비교
+
+사용법:
+  python3 magic-number/crawlers/kbo_bench_magic.py [--scenarios N] [--repeat N] [--seed N]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from kbo_magic_engine import Standings, magic_tragic, matrix_rows, playoff_rows
+from paths import get_path_manager
+
+
+def compare_rows(label, expected_rows, actual_rows, keys=None):
+    """JS 출력 행과 엔진 행 비교 - 다른 값 목록"""
+    mismatches = []
+    actual_by_team = {row['team']: row for row in actual_rows}
+    for expected in expected_rows:
+        actual = actual_by_team.get(expected['team'])
+        if actual is None:
+            mismatches.append(f"{label} {expected['team']}: 엔진 결과 없음")
+            continue
+        for key in keys or expected:
+            if key in actual and actual[key] != expected[key]:
+                mismatches.append(f"{label} {expected['team']}.{key}: JS {expected[key]} / 엔진 {actual[key]}")
+    return mismatches
+
+
+def verify_against_js(data_dir: Path):
+    """현재 데이터 기준 JS 출력과 비교 - (비교한 값 수, 불일치 목록)"""
+    magic = json.loads((data_dir / 'calc-magic-numbers.json').read_text(encoding='utf-8'))
+    matrix = json.loads((data_dir / 'ui-magic-matrix-precomputed.json').read_text(encoding='utf-8'))
+
+    standings = Standings.load(data_dir / 'stats-comprehensive.json')
+    playoff_keys = list(playoff_rows(standings)[0])
+    mismatches = compare_rows('playoffResults', magic['playoffResults'], playoff_rows(standings), playoff_keys)
+
+    # 매트릭스는 playoffResults(잔여 경기 포함)와 results의 순위를 입력으로 사용
+    matrix_standings = Standings.from_records(magic['playoffResults'])
+    current_ranks = {row['team']: row['rank'] for row in magic['results']}
+    expected = matrix['precomputedMatrixResults']['rawCalculationData']
+    mismatches += compare_rows('rawCalculationData', expected, matrix_rows(matrix_standings, current_ranks))
+
+    compared = len(magic['playoffResults']) * len(playoff_keys) + sum(len(row) for row in expected)
+    return compared, mismatches
+
+
+def random_scenarios(standings: Standings, count: int, seed: int):
+    """팀별 남은 경기(음수면 0)를 무작위로 승/패로 나눈 (시나리오, 팀) 배열"""
+    rng = np.random.default_rng(seed)
+    remaining = np.maximum(standings.remaining, 0)
+    wins = rng.integers(0, remaining + 1, size=(count, len(standings.teams)))
+    return wins, remaining - wins
+
+
+def time_call(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='매직넘버 엔진 검증 + 벤치마크')
+    parser.add_argument('--scenarios', type=int, default=100000, help='한 번에 계산할 what-if 시나리오 수')
+    parser.add_argument('--loop-scenarios', type=int, default=1000, help='하나씩 계산해 비교할 시나리오 수')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수')
+    parser.add_argument('--seed', type=int, default=2025, help='시나리오 난수 시드')
+    args = parser.parse_args(argv)
+
+    data_dir = Path(get_path_manager().data_dir)
+    compared, mismatches = verify_against_js(data_dir)
+    if mismatches:
+        print(f"❌ JS 출력과 불일치 {len(mismatches)}건")
+        for line in mismatches[:20]:
+            print(f"   {line}")
+        return 1
+    print(f"✅ JS 출력과 일치 ({compared}개 값)")
+
+    standings = Standings.load(data_dir / 'stats-comprehensive.json')
+    wins, losses = random_scenarios(standings, args.scenarios, args.seed)
+    batch = standings.with_results(wins, losses)
+    loop_count = min(args.loop_scenarios, args.scenarios)
+    singles = [standings.with_results(wins[i], losses[i]) for i in range(loop_count)]
+
+    # 일괄 계산 결과가 하나씩 계산한 결과와 같은지 확인
+    batch_values = magic_tragic(batch)
+    for i, single in enumerate(singles):
+        single_values = magic_tragic(single)
+        if any(not np.array_equal(batch_values[name][i], single_values[name]) for name in single_values):
+            print(f"❌ 시나리오 {i}: 일괄 계산 결과가 단일 계산과 다름")
+            return 1
+
+    single_timings = time_call(lambda: magic_tragic(standings), args.repeat * 20)
+    loop_timings = time_call(lambda: [magic_tragic(single) for single in singles], args.repeat)
+    batch_timings = time_call(lambda: magic_tragic(batch), args.repeat)
+
+    per_loop = min(loop_timings) / loop_count
+    per_batch = min(batch_timings) / args.scenarios
+    print(f"\n팀 {len(standings.teams)}개 × 순위 9개")
+    print(f"{'방식':<18}{'최소(ms)':>10}{'중앙값(ms)':>12}{'시나리오/초':>14}")
+    print(f"{'현재 순위표 1회':<18}{min(single_timings) * 1000:>10.3f}{statistics.median(single_timings) * 1000:>12.3f}"
+          f"{1 / min(single_timings):>14,.0f}")
+    print(f"{f'하나씩 {loop_count}개':<18}{min(loop_timings) * 1000:>10.1f}{statistics.median(loop_timings) * 1000:>12.1f}"
+          f"{1 / per_loop:>14,.0f}")
+    print(f"{f'일괄 {args.scenarios}개':<18}{min(batch_timings) * 1000:>10.1f}{statistics.median(batch_timings) * 1000:>12.1f}"
+          f"{1 / per_batch:>14,.0f}")
+    print(f"⚡ 일괄 계산 {per_loop / per_batch:.1f}배 (시나리오당)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
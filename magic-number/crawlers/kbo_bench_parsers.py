@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+스케줄 HTML 파서 백엔드 벤치마크
+월별 HTML 스냅샷(커밋된 fixtures/schedule/ 기록, 없으면 시즌 데이터로 재구성)을
+각 백엔드로 파싱해 소요 시간을 비교하고, 결과가 bs4 백엔드와 같은지 확인
+
+사용법:
+  python3 magic-number/crawlers/kbo_bench_parsers.py [--snapshots DIR] [--repeat N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from kbo_fixtures import load_month_snapshots
+from kbo_parsers import PARSER_BACKENDS, available_parsers
+
+
+def time_backend(parser, snapshots, repeat):
+    """백엔드 하나로 모든 스냅샷을 repeat번 파싱 - 반복별 합계 시간(초) 목록과 마지막 결과"""
+    timings = []
+    results = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [parser.parse_rows(html) for _, html in snapshots]
+        timings.append(time.perf_counter() - start)
+    return timings, results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='스케줄 HTML 파서 백엔드 벤치마크')
+    parser.add_argument('--snapshots', default=None, help='월별 HTML 스냅샷 디렉토리 (YYYYMM.html, 기본: fixtures/schedule)')
+    parser.add_argument('--year', type=int, default=2025, help='스냅샷이 없을 때 재구성할 시즌')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수')
+    args = parser.parse_args(argv)
+
+    snapshots = load_month_snapshots(args.snapshots, year=args.year)
+    total_bytes = sum(len(html.encode('utf-8')) for _, html in snapshots)
+    print(f"📄 스냅샷 {len(snapshots)}개월 ({total_bytes / 1024:.0f}KB), 반복 {args.repeat}회")
+
+    backends = available_parsers()
+    missing = [name for name in PARSER_BACKENDS if name not in backends]
+    if missing:
+        print(f"ℹ️ 설치되지 않은 백엔드: {', '.join(missing)}")
+
+    baseline_rows = None
+    baseline_time = None
+    print(f"\n{'백엔드':<12}{'최소(ms)':>10}{'중앙값(ms)':>12}{'행 수':>8}{'배속':>8}  결과")
+    for name in reversed(backends):  # bs4를 기준으로 먼저 측정
+        timings, results = time_backend(PARSER_BACKENDS[name](), snapshots, args.repeat)
+        best = min(timings)
+        if baseline_rows is None:
+            baseline_rows, baseline_time = results, best
+        row_count = sum(len(rows or []) for rows in results)
+        same = '일치' if results == baseline_rows else '❌ 불일치'
+        print(f"{name:<12}{best * 1000:>10.1f}{statistics.median(timings) * 1000:>12.1f}"
+              f"{row_count:>8}{baseline_time / best:>7.1f}x  {same}")
+        if results != baseline_rows:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+KBO 순위 확정/탈락 정확 판정 (최대 유량)
+매직넘버 계산(pMax/pMin)은 팀마다 독립적으로 전승/전패를 가정하므로 서로 맞붙는 경기를 무시함
+여기서는 남은 상대 전적 경기를 유량 네트워크로 배분하여 정확히 판정
+
+- 탈락: 대상 팀이 남은 경기를 모두 이겨도, 어떤 결과 배분으로든 k팀 이상이 승률에서 앞서면 top-k 탈락
+  (승률이 같으면 대상 팀에 유리하게 봄 - 동률이면 아직 가능)
+- 확정: 대상 팀이 남은 경기를 모두 져도 승률이 같거나 높은 팀이 k팀 이상 나올 수 없으면 top-k 확정
+- 남은 경기는 승패가 난다고 가정 (무승부는 승률 분모에서 빠지므로 유량 모델 밖)
+- 같은 (제약 팀, 용량) 부분 문제는 팀/순위 질의 사이에서 재사용
+
+사용법:
+  python3 magic-number/crawlers/kbo_elimination.py [--games-per-pair N] [--output PATH]
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import deque
+from datetime import datetime
+from itertools import combinations
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'config'))
+from kbo_metrics import KST
+from kbo_season_store import atomic_write_text
+from paths import get_path_manager
+
+GAMES_PER_PAIR = 16  # 정규시즌 팀당 144경기 = 9팀 × 16경기
+CUTOFFS = (1, 2, 3, 4, 5)
+
+
+def max_flow(capacity: Dict, source, sink) -> int:
+    """Edmonds-Karp 최대 유량 - capacity[u][v] (잔여 용량으로 갱신됨)"""
+    flow = 0
+    while True:
+        parent = {source: None}
+        queue = deque([source])
+        while queue and sink not in parent:
+            node = queue.popleft()
+            for nxt, cap in capacity[node].items():
+                if cap > 0 and nxt not in parent:
+                    parent[nxt] = node
+                    queue.append(nxt)
+        if sink not in parent:
+            return flow
+
+        path_cap = None
+        node = sink
+        while parent[node] is not None:
+            prev = parent[node]
+            path_cap = capacity[prev][node] if path_cap is None else min(path_cap, capacity[prev][node])
+            node = prev
+        node = sink
+        while parent[node] is not None:
+            prev = parent[node]
+            capacity[prev][node] -= path_cap
+            capacity[node].setdefault(prev, 0)
+            capacity[node][prev] += path_cap
+            node = prev
+        flow += path_cap
+
+
+def _ceil_div(a: int, b: int) -> int:
+    return -(-a // b)
+
+
+class EliminationEngine:
+    """순위표(승/패)와 팀 쌍별 남은 경기 수로 top-k 확정/탈락 판정"""
+
+    def __init__(self, teams: Sequence[str], wins: Sequence[int], losses: Sequence[int],
+                 remaining: Sequence[Sequence[int]]):
+        self.teams = list(teams)
+        self.wins = [int(value) for value in wins]
+        self.losses = [int(value) for value in losses]
+        self.remaining = [[int(value) for value in row] for row in remaining]
+        self.games_left = [sum(row) for row in self.remaining]
+        self._memo: Dict[Tuple, bool] = {}
+        self.subproblems = 0
+
+    @classmethod
+    def from_data(cls, data_dir: Optional[Path] = None, games_per_pair: int = GAMES_PER_PAIR) -> 'EliminationEngine':
+        """calc-standings.json(승/패) + calc-head-to-head.json(쌍별 치른 경기 → 남은 경기)"""
+        data_dir = Path(data_dir) if data_dir else Path(get_path_manager().data_dir)
+        standings = json.loads((data_dir / 'calc-standings.json').read_text(encoding='utf-8'))['rankings']
+        head_to_head = json.loads((data_dir / 'calc-head-to-head.json').read_text(encoding='utf-8'))['totalData']
+
+        teams = [row['team'] for row in standings]
+        remaining = []
+        for team in teams:
+            row = []
+            for opponent in teams:
+                record = head_to_head.get(team, {}).get(opponent)
+                played = sum(record.get(key, 0) for key in ('wins', 'losses', 'draws')) if record else 0
+                row.append(0 if team == opponent else max(0, games_per_pair - played))
+            remaining.append(row)
+        return cls(teams, [row['wins'] for row in standings], [row['losses'] for row in standings], remaining)
+
+    def index(self, team: str) -> int:
+        return self.teams.index(team)
+
+    def _games_among(self, members: Sequence[int]) -> List[Tuple[int, int, int]]:
+        return [(a, b, self.remaining[a][b]) for a, b in combinations(members, 2) if self.remaining[a][b] > 0]
+
+    def _rival_games(self, team: int, target: int) -> int:
+        """team의 남은 경기 중 target 팀과의 경기를 뺀 수"""
+        return self.games_left[team] - self.remaining[team][target]
+
+    def _can_cap(self, members: Tuple[int, ...], caps: Tuple[int, ...]) -> bool:
+        """members끼리의 남은 경기를 각 팀 승수가 caps 이하가 되도록 배분할 수 있는가"""
+        key = ('cap', members, caps)
+        if key in self._memo:
+            return self._memo[key]
+        self.subproblems += 1
+
+        games = self._games_among(members)
+        total = sum(count for _, _, count in games)
+        if total > sum(caps):
+            result = False
+        else:
+            capacity = {'s': {}, 't': {}}
+            for a, b, count in games:
+                capacity['s'][(a, b)] = count
+                capacity[(a, b)] = {a: count, b: count}
+            for team, cap in zip(members, caps):
+                capacity.setdefault(team, {})['t'] = cap
+            result = max_flow(capacity, 's', 't') == total
+        self._memo[key] = result
+        return result
+
+    def _can_reach(self, target: int, members: Tuple[int, ...], needs: Tuple[int, ...]) -> bool:
+        """target 팀과의 경기를 뺀 남은 경기 배분으로 members 모두가 각자 needs 이상 승수를 얻을 수 있는가"""
+        key = ('need', target, members, needs)
+        if key in self._memo:
+            return self._memo[key]
+        self.subproblems += 1
+
+        member_set = set(members)
+        capacity = {'s': {}, 't': {}}
+        for a in members:
+            for b, count in enumerate(self.remaining[a]):
+                if count <= 0 or b == target or (b in member_set and b < a):
+                    continue
+                pair = (min(a, b), max(a, b))
+                capacity['s'][pair] = count
+                capacity[pair] = {team: count for team in pair if team in member_set}
+        for team, need in zip(members, needs):
+            capacity.setdefault(team, {})['t'] = need
+        result = max_flow(capacity, 's', 't') == sum(needs)
+        self._memo[key] = result
+        return result
+
+    def can_finish_top(self, team: str, k: int) -> bool:
+        """top-k 진입이 아직 수학적으로 가능한가 (False면 탈락)"""
+        x = self.index(team)
+        best_wins = self.wins[x] + self.games_left[x]
+        best_den = max(1, self.wins[x] + self.losses[x] + self.games_left[x])
+
+        above, candidates, caps = [], [], {}
+        for r in range(len(self.teams)):
+            if r == x:
+                continue
+            # x와의 경기는 모두 r의 패배 - r 승률 ≤ x 최종 승률이 되는 최대 추가 승수
+            final_den = self.wins[r] + self.losses[r] + self.games_left[r]
+            cap = (best_wins * final_den - self.wins[r] * best_den) // best_den
+            if cap < 0:
+                above.append(r)
+            elif cap < self._rival_games(r, x):
+                candidates.append(r)
+                caps[r] = cap
+        free = k - 1 - len(above)
+        if free < 0:
+            return False
+        if len(candidates) <= free:
+            return True
+
+        # 앞서도 되는 팀 free개를 고르고 나머지 팀을 용량 안에 묶을 수 있으면 가능
+        for released in combinations(candidates, free):
+            members = tuple(r for r in candidates if r not in released)
+            if self._can_cap(members, tuple(caps[r] for r in members)):
+                return True
+        return False
+
+    def has_clinched_top(self, team: str, k: int) -> bool:
+        """남은 경기를 모두 져도 top-k가 보장되는가 (동률 가능성도 없어야 확정)"""
+        x = self.index(team)
+        worst_wins = self.wins[x]
+        worst_den = max(1, self.wins[x] + self.losses[x] + self.games_left[x])
+
+        threats, needs = [], {}
+        for r in range(len(self.teams)):
+            if r == x:
+                continue
+            # x와의 경기는 모두 r의 승리 - r 승률 ≥ x 최종 승률이 되는 최소 추가 승수
+            base_wins = self.wins[r] + self.remaining[r][x]
+            final_den = self.wins[r] + self.losses[r] + self.games_left[r]
+            need = max(0, _ceil_div(worst_wins * final_den - base_wins * worst_den, worst_den))
+            if need <= self._rival_games(r, x):
+                threats.append(r)
+                needs[r] = need
+        if len(threats) < k:
+            return True
+
+        for members in combinations(threats, k):
+            if self._can_reach(x, members, tuple(needs[r] for r in members)):
+                return False
+        return True
+
+    def table(self, cutoffs: Sequence[int] = CUTOFFS) -> List[Dict]:
+        """팀별 top-k 상태 - 'clinched' / 'alive' / 'eliminated'"""
+        rows = []
+        for team in self.teams:
+            status = {}
+            for k in cutoffs:
+                if self.has_clinched_top(team, k):
+                    status[str(k)] = 'clinched'
+                elif self.can_finish_top(team, k):
+                    status[str(k)] = 'alive'
+                else:
+                    status[str(k)] = 'eliminated'
+            rows.append({'team': team, 'remainingGames': self.games_left[self.index(team)], 'top': status})
+        return rows
+
+
+def bound_statuses(engine: EliminationEngine, cutoffs: Sequence[int] = CUTOFFS) -> Dict[str, Dict[str, str]]:
+    """기존 승률 상한/하한(kbo_magic_engine) 기준 상태 - 정확 판정과 비교용"""
+    from kbo_magic_engine import Standings, magic_tragic
+
+    standings = Standings(engine.teams, engine.wins, engine.losses, [0] * len(engine.teams), engine.games_left)
+    values = magic_tragic(standings, cutoffs)
+    statuses = {}
+    for i, team in enumerate(engine.teams):
+        statuses[team] = {}
+        for j, k in enumerate(cutoffs):
+            if values['x_strict_raw'][i, j] == 0:
+                statuses[team][str(k)] = 'clinched'
+            elif values['y_tieOK_raw'][i, j] == 0:
+                statuses[team][str(k)] = 'eliminated'
+            else:
+                statuses[team][str(k)] = 'alive'
+    return statuses
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='KBO top-k 확정/탈락 정확 판정 (최대 유량)')
+    parser.add_argument('--games-per-pair', type=int, default=GAMES_PER_PAIR, help='팀 쌍별 정규시즌 경기 수')
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: data/calc-elimination.json)')
+    args = parser.parse_args(argv)
+
+    data_dir = Path(get_path_manager().data_dir)
+    engine = EliminationEngine.from_data(data_dir, args.games_per_pair)
+
+    started = time.perf_counter()
+    rows = engine.table()
+    elapsed = time.perf_counter() - started
+    queries = len(rows) * len(CUTOFFS) * 2
+
+    bounds = bound_statuses(engine)
+    labels = {'clinched': '확정', 'alive': '가능', 'eliminated': '탈락'}
+    print(f"\n{'팀':<6}{'남은':>5}  " + ''.join(f"{f'top{k}':>8}" for k in CUTOFFS))
+    earlier = []
+    for row in rows:
+        cells = []
+        for k in CUTOFFS:
+            exact, bound = row['top'][str(k)], bounds[row['team']][str(k)]
+            mark = '*' if exact != bound else ' '
+            cells.append(f"{labels[exact]:>6}{mark} ")
+            if exact != bound:
+                earlier.append(f"{row['team']} top{k}: 상한/하한 {labels[bound]} → 정확 {labels[exact]}")
+        print(f"{row['team']:<6}{row['remainingGames']:>5}  " + ''.join(cells))
+    if earlier:
+        print("\n* 승률 상한/하한 판정보다 먼저 확정된 항목")
+        for line in earlier:
+            print(f"   {line}")
+
+    output = Path(args.output) if args.output else data_dir / 'calc-elimination.json'
+    result = {
+        'lastUpdated': datetime.now(KST).isoformat(timespec='seconds'),
+        'gamesPerPair': args.games_per_pair,
+        'note': '남은 상대 전적 경기를 최대 유량으로 배분한 정확 판정 (남은 경기 무승부 없음 가정)',
+        'results': rows,
+    }
+    atomic_write_text(output, json.dumps(result, ensure_ascii=False, indent=2) + "\n")
+    print(f"\n✅ {queries}개 질의 {elapsed * 1000:.1f}ms (질의당 {elapsed * 1000 / queries:.2f}ms, "
+          f"부분 문제 {engine.subproblems}개) - 저장: {output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+오프라인 HTML fixture 도구
+- 기록된 월별 스케줄 HTML(YYYYMM.html, --record-html) 로드 - 기본은 저장소에 커밋된 fixtures/schedule/
+  (npm run record-fixtures -- --year YYYY로 실제 페이지를 기록)
+- 기록이 없을 때 시즌 데이터 파일을 다음 스포츠 스케줄 마크업으로 재구성
+  (파서가 기대하는 구조 그대로 만들므로 실제 페이지 구조 변화는 감지하지 못함)
+"""
+
+import sys
+from datetime import date as date_class
+from html import escape
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'config'))
+from paths import get_path_manager
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from kbo_season_store import SeasonStore
+
+WEEKDAYS = ['월', '화', '수', '목', '금', '토', '일']
+RECORDED_DIR = Path(__file__).resolve().parent / 'fixtures' / 'schedule'
+
+
+def _team_div(css_class: str, team: str, score: Optional[str]) -> str:
+    score_html = f'<em class="num_score">{escape(score)}</em>' if score is not None else ''
+    return f'<div class="info_team {css_class}"><span class="txt_team">{escape(team)}</span>{score_html}</div>'
+
+
+def render_month_html(store: SeasonStore, year: int, month: int) -> str:
+    """한 달치 경기를 다음 스포츠 tbody#scheduleList 구조로 렌더링
+
+    다음 마크업에서는 team_home div가 원정팀, team_away div가 홈팀이다.
+    시즌 파일의 점수 칸은 '원정:홈' 순서다.
+    """
+    prefix = f"{year}-{month:02d}-"
+    rows = []
+    for date in store.sorted_dates():
+        games = sorted(store.games_on(date), key=lambda record: record.time)
+        if not date.startswith(prefix) or not games:
+            continue
+        weekday = WEEKDAYS[date_class.fromisoformat(date).weekday()]
+        for idx, game in enumerate(games):
+            cells = []
+            if idx == 0:
+                cells.append(
+                    f'<td class="td_date" rowspan="{len(games)}">'
+                    f'<span class="num_date">{date[5:7]}.{date[8:10]}</span>'
+                    f'<span class="txt_day">{weekday}</span></td>'
+                )
+            away_score = home_score = None
+            if ':' in game.score:
+                away_score, home_score = game.score.split(':', 1)
+            cells.append(f'<td class="td_time">{escape(game.time)}</td>')
+            cells.append(f'<td class="td_area">{escape(game.stadium)}</td>')
+            cells.append(
+                '<td class="td_team">'
+                + _team_div('team_home', game.away_team, away_score)
+                + f'<span class="state_game">{escape(game.state)}</span>'
+                + _team_div('team_away', game.home_team, home_score)
+                + '</td>'
+            )
+            cells.append(f'<td class="td_sort">{escape(game.sort)}</td>')
+            cells.append(f'<td class="td_tv">{escape(game.tv)}</td>')
+            rows.append('<tr>' + ''.join(cells) + '</tr>')
+
+    return (
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>KBO 일정</title></head>'
+        '<body><div id="kboSchedule"><table class="tbl_schedule"><tbody id="scheduleList">\n'
+        + '\n'.join(rows)
+        + '\n</tbody></table></div></body></html>'
+    )
+
+
+def recorded_snapshots(snapshot_dir: Optional[Path] = None, year: Optional[int] = None) -> List[Tuple[str, str]]:
+    """기록된 YYYYMM.html 목록 (기본: RECORDED_DIR, year가 있으면 그 시즌만)"""
+    prefix = str(year) if year else '[0-9][0-9][0-9][0-9]'
+    paths = sorted(Path(snapshot_dir or RECORDED_DIR).glob(f'{prefix}[0-9][0-9].html'))
+    return [(path.stem, path.read_text(encoding='utf-8')) for path in paths]
+
+
+def load_month_snapshots(snapshot_dir: Optional[Path] = None, year: int = 2025,
+                         season_file: Optional[Path] = None) -> List[Tuple[str, str]]:
+    """(라벨, HTML) 목록 - 기록된 YYYYMM.html(기본: RECORDED_DIR)이 있으면 사용, 없으면 시즌 파일로 재구성"""
+    snapshots = recorded_snapshots(snapshot_dir, year)
+    if snapshots:
+        return snapshots
+
+    if season_file is None:
+        season_file = get_path_manager().get_data_file(f'{year}-season-data-clean.txt')
+    store = SeasonStore.read(season_file, year=year)
+
+    months = sorted({int(date[5:7]) for date in store.by_date if date.startswith(f'{year}-')})
+    return [(f'{year}{month:02d}', render_month_html(store, year, month)) for month in months]
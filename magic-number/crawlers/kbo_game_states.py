@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+KBO 경기 상태 분류 + 중복/갱신 판정 표
+- 스케줄 상태 문자열 → GameState (한 번 분류한 문자열은 캐시)
+- (기존 상태, 새 상태, 오늘 경기 여부) → DedupAction 표를 미리 계산해 두고 행마다 조회만 함
+- 크롤링한 경기 목록을 시즌 저장소와 비교해 추가/갱신/변경 없음으로 나눈 SeasonDiff 반환
+"""
+
+import re
+import sys
+from enum import Enum, IntEnum
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from kbo_season_store import CANCELLED_STATES, FINISHED_STATES, GameKey, GameRecord, SeasonStore
+
+PREGAME_STATES = ("경기전", "예정")
+IN_PROGRESS_STATES = ("경기중", "진행중", "연장")
+LIVE_INNING = re.compile(r'(\d+)회')
+
+
+class GameState(IntEnum):
+    PREGAME = 0    # 경기전 / 예정
+    FINAL = 1      # 종료 / 완료 / 끝
+    CANCELLED = 2  # 취소 / 우천취소 / 연기 / 경기취소
+    LIVE = 3       # 진행 중 (n회초/말, 연장 등) - 저장하지 않음
+    OTHER = 4      # 그 밖의 상태 - 예정 경기와 같이 저장하지만 갱신 대상은 아님
+
+
+class DedupAction(Enum):
+    INSERT = 'insert'  # 새 경기 추가
+    UPDATE = 'update'  # 기존 줄을 새 데이터로 교체
+    NOOP = 'noop'      # 기존 데이터 유지 (중복)
+
+
+_STATE_CACHE: Dict[Optional[str], GameState] = {
+    **{state: GameState.PREGAME for state in PREGAME_STATES},
+    **{state: GameState.FINAL for state in FINISHED_STATES},
+    **{state: GameState.CANCELLED for state in CANCELLED_STATES},
+    **{state: GameState.LIVE for state in IN_PROGRESS_STATES},
+    None: GameState.OTHER,
+}
+
+
+def classify_state(state: Optional[str]) -> GameState:
+    """상태 문자열 분류 - 처음 보는 문자열만 규칙으로 판정하고 결과를 캐시"""
+    kind = _STATE_CACHE.get(state)
+    if kind is None:
+        kind = GameState.LIVE if LIVE_INNING.search(state) else GameState.OTHER
+        _STATE_CACHE[state] = kind
+    return kind
+
+
+def _build_transitions() -> Dict[Tuple[Optional[GameState], GameState, bool], DedupAction]:
+    """(기존 상태 또는 None, 새 상태, 오늘 경기 여부) → 판정
+
+    - 기존 경기가 없으면 추가
+    - 오늘 경기: 기존이 경기전/예정이면 새 데이터로 교체, 종료/취소면 유지, 그 밖이면 추가
+    - 지난/다음 경기: 기존이 경기전/예정이고 새 상태가 종료/취소일 때만 교체, 나머지는 유지
+    """
+    done = (GameState.FINAL, GameState.CANCELLED)
+    table = {}
+    for new in GameState:
+        for is_today in (True, False):
+            table[(None, new, is_today)] = DedupAction.INSERT
+            for existing in GameState:
+                if is_today:
+                    if existing == GameState.PREGAME:
+                        action = DedupAction.UPDATE
+                    elif existing in done:
+                        action = DedupAction.NOOP
+                    else:
+                        action = DedupAction.INSERT
+                elif existing == GameState.PREGAME and new in done:
+                    action = DedupAction.UPDATE
+                else:
+                    action = DedupAction.NOOP
+                table[(existing, new, is_today)] = action
+    return table
+
+
+TRANSITIONS = _build_transitions()
+
+
+def game_key(date: str, time: str, home_team: str, away_team: str) -> GameKey:
+    """인터닝된 문자열로 만든 경기 키 - 저장소 키와 비교할 때 대부분 동일 객체 비교로 끝남"""
+    return (sys.intern(date), sys.intern(time), sys.intern(home_team), sys.intern(away_team))
+
+
+class SeasonDiff:
+    """크롤링 결과와 시즌 저장소의 차이 - 추가 / 갱신(기존 레코드, 새 경기) / 변경 없음
+
+    len()과 games는 저장이 필요한 경기(추가 + 갱신) 기준, 페이지 순서 유지
+    """
+
+    def __init__(self):
+        self.games: List[Dict] = []
+        self.inserts: List[Dict] = []
+        self.updates: List[Tuple[GameRecord, Dict]] = []
+        self.noops: List[GameKey] = []
+
+    def add(self, action: DedupAction, game: Dict, existing: Optional[GameRecord] = None):
+        if action is DedupAction.NOOP:
+            self.noops.append(existing.key)
+            return
+        self.games.append(game)
+        if action is DedupAction.UPDATE:
+            self.updates.append((existing, game))
+        else:
+            self.inserts.append(game)
+
+    def __len__(self):
+        return len(self.games)
+
+    def __iter__(self):
+        return iter(self.games)
+
+    def __repr__(self):
+        return f"SeasonDiff(추가 {len(self.inserts)}, 갱신 {len(self.updates)}, 유지 {len(self.noops)})"
+
+
+def dedup_action(store: SeasonStore, key: GameKey, new_state: Optional[str], today: str):
+    """(판정, 기존 레코드) - 저장소 조회 한 번과 표 조회 한 번"""
+    existing = store.get(key)
+    existing_kind = classify_state(existing.state) if existing is not None else None
+    return TRANSITIONS[(existing_kind, classify_state(new_state), key[0] == today)], existing
+
+
+def diff_games(store: SeasonStore, games: Iterable[Dict], today: str) -> SeasonDiff:
+    """크롤링한 경기 dict 목록을 저장소와 비교 (저장소는 바꾸지 않음)"""
+    diff = SeasonDiff()
+    for game in games:
+        key = game_key(game['date'], game['time'], game['home_team'], game['away_team'])
+        action, existing = dedup_action(store, key, game['state'], today)
+        diff.add(action, game, existing)
+    return diff
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+KBO 매직넘버 / 트래직넘버 엔진 (NumPy)
+01_magic-number-calculator.js, generate-magic-matrix-precomputed.js와 같은 규칙으로
+모든 팀 × 모든 순위의 매직/트래직 넘버를 배열 연산으로 계산
+
+- 입력 배열은 (..., 팀) 형태 - 앞쪽 차원은 what-if 시나리오 묶음
+- 규칙 (JS와 동일, 승률 = 승 / (승 + 패), 무승부 제외)
+  pMax = 남은 경기 전승 승률, pMin = 남은 경기 전패 승률
+  Kk_max / Kk_min = 다른 팀들의 pMax / pMin 중 k번째로 큰 값
+  매직 x = Kk_max * D - W 를 넘는 최소 승수, 트래직 y = W + R - Kk_min * D 이상의 최소 패수
+"""
+
+import json
+import sys
+from decimal import ROUND_HALF_UP, Decimal
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'config'))
+from paths import get_path_manager
+
+SEASON_GAMES = 144
+RANKS = tuple(range(1, 10))  # 매트릭스에 표시하는 순위 (10위는 항상 확보)
+PLAYOFF_RANK = 5
+
+
+def round3(value: float) -> float:
+    """JS Number(x.toFixed(3))와 같은 반올림 (정확한 이진 값 기준, 0.5는 올림)"""
+    return float(Decimal(float(value)).quantize(Decimal('0.001'), rounding=ROUND_HALF_UP))
+
+
+class Standings:
+    """팀 이름과 승/패/무/잔여 경기 배열"""
+
+    def __init__(self, teams: Sequence[str], wins, losses, draws, remaining=None, season: int = SEASON_GAMES):
+        self.teams = list(teams)
+        self.wins = np.asarray(wins, dtype=np.int64)
+        self.losses = np.asarray(losses, dtype=np.int64)
+        self.draws = np.asarray(draws, dtype=np.int64)
+        if remaining is None:
+            remaining = season - (self.wins + self.losses + self.draws)
+        self.remaining = np.asarray(remaining, dtype=np.int64)
+        self.season = season
+
+    def index(self, team: str) -> int:
+        return self.teams.index(team)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict], season: int = SEASON_GAMES) -> 'Standings':
+        """stats-comprehensive.json의 standings 또는 calc-magic-numbers.json의 playoffResults"""
+        records = list(records)
+        remaining = None
+        if records and all('remainingGames' in record for record in records):
+            remaining = [record['remainingGames'] for record in records]
+        return cls([record['team'] for record in records],
+                   [record['wins'] for record in records],
+                   [record['losses'] for record in records],
+                   [record.get('draws') or 0 for record in records],
+                   remaining, season)
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None, season: int = SEASON_GAMES) -> 'Standings':
+        """stats-comprehensive.json 순위표 로드 (01_magic-number-calculator.js 입력과 같음)"""
+        path = Path(path) if path else get_path_manager().get_data_file('stats-comprehensive.json')
+        data = json.loads(path.read_text(encoding='utf-8'))
+        return cls.from_records(data['standings'] if 'standings' in data else data['playoffResults'], season)
+
+    def with_results(self, wins, losses, draws=0) -> 'Standings':
+        """what-if - 팀별 추가 승/패/무를 더한 순위표 (배열이면 앞쪽 차원이 시나리오)"""
+        wins = np.asarray(wins, dtype=np.int64)
+        losses = np.asarray(losses, dtype=np.int64)
+        draws = np.asarray(draws, dtype=np.int64)
+        return Standings(self.teams, self.wins + wins, self.losses + losses, self.draws + draws,
+                         self.remaining - wins - losses - draws, self.season)
+
+
+def win_rate_bounds(wins, losses, remaining):
+    """(pMax, pMin) - 남은 경기 전승 / 전패 시 최종 승률 (분모가 0 이하면 0)"""
+    denominator = wins + losses + remaining
+    safe = np.where(denominator > 0, denominator, 1)
+    p_max = np.where(denominator > 0, (wins + remaining) / safe, 0.0)
+    p_min = np.where(denominator > 0, wins / safe, 0.0)
+    return p_max, p_min
+
+
+def others_kth(values, columns: Sequence[int]):
+    """(..., 팀 i, c) - 팀 i를 제외한 다른 팀 값 중 (c + 1)번째로 큰 값 (다른 팀이 부족하면 0)
+
+    시나리오마다 한 번만 정렬 - 팀 i가 c번째 이내에 있으면 한 칸 뒤의 값이 다른 팀 기준 값
+    """
+    n = values.shape[-1]
+    order = np.argsort(-values, axis=-1, kind='stable')
+    descending = np.take_along_axis(values, order, axis=-1)
+    position = np.empty_like(order)
+    np.put_along_axis(position, order, np.broadcast_to(np.arange(n), order.shape), axis=-1)
+    padded = np.concatenate([descending, np.zeros(values.shape[:-1] + (1,))], axis=-1)
+
+    columns = np.asarray(columns)
+    shifted = columns + (position[..., None] <= columns)  # (..., 팀, c)
+    result = np.take_along_axis(padded[..., None, :], np.minimum(shifted, n), axis=-1)
+    return np.where(columns < n - 1, result, 0.0)
+
+
+def kth_benchmarks(standings: Standings, ranks: Sequence[int] = RANKS):
+    """(Kk_max, Kk_min) - 각 (..., 팀, 순위) 별 다른 팀 pMax / pMin의 k번째 값 (없으면 0)"""
+    p_max, p_min = win_rate_bounds(standings.wins, standings.losses, standings.remaining)
+    columns = [k - 1 for k in ranks]
+    return others_kth(p_max, columns), others_kth(p_min, columns)
+
+
+def magic_tragic(standings: Standings, ranks: Sequence[int] = RANKS) -> Dict[str, np.ndarray]:
+    """모든 팀 × 순위의 매직/트래직 넘버 - 각 값은 (..., 팀, 순위) 배열
+
+    *_raw는 잔여 경기 제한 없는 값, 나머지는 0..R로 제한한 값 (generate-magic-matrix-precomputed.js)
+    """
+    k_max, k_min = kth_benchmarks(standings, ranks)
+    wins = standings.wins[..., None]
+    remaining = standings.remaining[..., None]
+    denominator = wins + standings.losses[..., None] + remaining
+
+    rhs_magic = k_max * denominator - wins
+    rhs_tragic = wins + remaining - k_min * denominator
+    result = {
+        'K_max': k_max,
+        'K_min': k_min,
+        'x_strict_raw': np.maximum(0, np.floor(rhs_magic) + 1).astype(np.int64),
+        'x_tieOK_raw': np.maximum(0, np.ceil(rhs_magic)).astype(np.int64),
+        'y_strict_raw': np.maximum(0, np.ceil(rhs_tragic)).astype(np.int64),
+        'y_tieOK_raw': np.maximum(0, np.floor(rhs_tragic) + 1).astype(np.int64),
+    }
+    # JS clamp(v, 0, R) = max(0, min(R, v)) - R이 음수면 0
+    for name in ('x_strict', 'x_tieOK', 'y_strict', 'y_tieOK'):
+        result[name] = np.maximum(0, np.minimum(remaining, result[f'{name}_raw']))
+    return result
+
+
+def playoff_magic_tragic(standings: Standings) -> Dict[str, np.ndarray]:
+    """calc-magic-numbers.json playoffResults의 포스트시즌/1위 값 - 각 값은 (..., 팀) 배열
+
+    01_magic-number-calculator.js와 같이 K5_min은 다른 팀 pMin의 4번째 값을 사용
+    """
+    p_max, p_min = win_rate_bounds(standings.wins, standings.losses, standings.remaining)
+    top_max = others_kth(p_max, [0, PLAYOFF_RANK - 1])
+    top_min = others_kth(p_min, [0, PLAYOFF_RANK - 2])
+    wins = standings.wins
+    remaining = standings.remaining
+    denominator = wins + standings.losses + remaining
+
+    k5_max = top_max[..., 1]
+    k5_min = top_min[..., 1]
+    magic_rhs = k5_max * denominator - wins
+    tragic_base = wins + remaining - k5_min * denominator
+    eliminated = tragic_base <= 0
+
+    k1_max = np.maximum(top_max[..., 0], 0.0)
+    k1_min = np.maximum(top_min[..., 0], 0.0)
+    return {
+        'K5_max': k5_max,
+        'K5_min': k5_min,
+        'playoffMagicStrict': np.maximum(0, np.floor(magic_rhs) + 1).astype(np.int64),
+        'playoffMagicTieOK': np.maximum(0, np.ceil(magic_rhs)).astype(np.int64),
+        'playoffTragicStrict': np.where(eliminated, 0, np.maximum(0, np.ceil(tragic_base))).astype(np.int64),
+        'playoffTragicTieOK': np.where(eliminated, 0, np.maximum(0, np.floor(tragic_base) + 1)).astype(np.int64),
+        'championshipMagic': np.maximum(0, np.floor(k1_max * denominator - wins) + 1).astype(np.int64),
+        'championshipTragic': np.maximum(0, np.ceil(wins + remaining - k1_min * denominator)).astype(np.int64),
+    }
+
+
+def matrix_rows(standings: Standings, current_ranks: Optional[Dict[str, int]] = None,
+                ranks: Sequence[int] = RANKS) -> List[Dict]:
+    """ui-magic-matrix-precomputed.json의 rawCalculationData와 같은 행 목록 (시나리오 차원 없음)"""
+    current_ranks = current_ranks or {}
+    values = magic_tragic(standings, ranks)
+    rows = []
+    for i, team in enumerate(standings.teams):
+        wins, losses = int(standings.wins[i]), int(standings.losses[i])
+        row = {
+            'team': team,
+            'W': wins, 'L': losses, 'T': int(standings.draws[i]), 'R': int(standings.remaining[i]),
+            'winPct': round3(wins / (wins + losses) if wins + losses > 0 else 0),
+            '_jsonRank': current_ranks.get(team),
+        }
+        for j, k in enumerate(ranks):
+            row[f'K{k}_max'] = round3(values['K_max'][i, j])
+            row[f'K{k}_min'] = round3(values['K_min'][i, j])
+            for name in ('x_strict', 'x_tieOK', 'y_strict', 'y_tieOK',
+                         'x_strict_raw', 'x_tieOK_raw', 'y_strict_raw', 'y_tieOK_raw'):
+                prefix, suffix = name.split('_', 1)
+                row[f'{prefix}{k}_{suffix}'] = int(values[name][i, j])
+        rows.append(row)
+    return rows
+
+
+def playoff_rows(standings: Standings) -> List[Dict]:
+    """calc-magic-numbers.json playoffResults의 계산 값 (상태 문구 제외)"""
+    values = playoff_magic_tragic(standings)
+    rows = []
+    for i, team in enumerate(standings.teams):
+        row = {
+            'team': team,
+            'wins': int(standings.wins[i]),
+            'losses': int(standings.losses[i]),
+            'draws': int(standings.draws[i]),
+            'remainingGames': int(standings.remaining[i]),
+        }
+        for name, array in values.items():
+            row[name] = round3(array[i]) if name.startswith('K') else int(array[i])
+        rows.append(row)
+    return rows
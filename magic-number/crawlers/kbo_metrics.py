@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+KBO 크롤러 실행 메트릭 수집
+대기/단계별 소요 시간과 카운터(파싱 행 수, 중복 제외 수 등)를 구조화된 JSON 라인으로 기록
+선택적으로 Prometheus node_exporter textfile 형식으로도 내보냄
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+KST = timezone(timedelta(hours=9))
+
+
+def current_season(now: Optional[datetime] = None) -> int:
+    """현재 시즌 연도 - KST 기준 연도 (KBO_SEASON으로 고정 가능), 1월 1일 KST에 자동으로 넘어감"""
+    if os.getenv('KBO_SEASON'):
+        return int(os.getenv('KBO_SEASON'))
+    return (now or datetime.now(KST)).year
+
+
+class RunMetrics:
+    """한 번의 크롤러 실행 동안 발생한 타이밍 이벤트 수집기 (스레드 안전)"""
+
+    def __init__(self, run_id: Optional[str] = None):
+        self.run_id = run_id or datetime.now(KST).strftime('%Y%m%dT%H%M%S')
+        self.events: List[Dict] = []
+        self.counters: Dict[str, int] = {}
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """블록 실행 시간을 측정해 이벤트로 기록 - yield된 dict에 결과 필드 추가 가능"""
+        event = {'name': name, **labels}
+        start = time.perf_counter()
+        try:
+            yield event
+        finally:
+            event['duration_ms'] = round((time.perf_counter() - start) * 1000, 1)
+            self.record(event)
+
+    def record(self, event: Dict):
+        """이벤트 하나 기록"""
+        with self._lock:
+            self.events.append({
+                'run_id': self.run_id,
+                'ts': datetime.now(KST).isoformat(timespec='milliseconds'),
+                **event
+            })
+
+    def incr(self, name: str, value: int = 1):
+        """카운터 증가 (rows_parsed, duplicates_skipped, ...)"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def summary(self) -> Dict[str, Dict]:
+        """이름/단계별 집계 (횟수, 합계, 최대, 타임아웃 수)"""
+        summary = {}
+        with self._lock:
+            events = list(self.events)
+        for event in events:
+            if 'duration_ms' not in event:
+                continue
+            key = event['name'] if 'phase' not in event else f"{event['name']}.{event['phase']}"
+            item = summary.setdefault(key, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'timeouts': 0})
+            item['count'] += 1
+            item['total_ms'] = round(item['total_ms'] + event['duration_ms'], 1)
+            item['max_ms'] = max(item['max_ms'], event['duration_ms'])
+            if event.get('outcome') == 'timeout':
+                item['timeouts'] += 1
+        return summary
+
+    def write_jsonl(self, path: Path) -> Path:
+        """이벤트들과 실행 요약(카운터 + 단계별 집계) 한 줄을 JSON 라인 파일에 추가 기록"""
+        with self._lock:
+            events = list(self.events)
+            counters = dict(self.counters)
+        run_summary = {
+            'run_id': self.run_id,
+            'ts': datetime.now(KST).isoformat(timespec='milliseconds'),
+            'name': 'run_summary',
+            'elapsed_ms': round((time.time() - self.started_at) * 1000, 1),
+            'counters': counters,
+            'phases': self.summary(),
+        }
+        with open(path, 'a', encoding='utf-8') as f:
+            for event in events + [run_summary]:
+                f.write(json.dumps(event, ensure_ascii=False) + '\n')
+        return path
+
+    def write_prometheus(self, path: Path, prefix: str = 'kbo_crawler') -> Path:
+        """node_exporter textfile collector 형식으로 기록 (임시 파일 후 교체 - 읽는 중 잘린 파일 방지)"""
+        path = Path(path)
+        with self._lock:
+            counters = dict(self.counters)
+        summary = self.summary()
+
+        def label(value):
+            return str(value).replace('\\', '\\\\').replace('"', '\\"')
+
+        lines = []
+        phase_metrics = (
+            ('phase_seconds_total', '단계별 소요 시간 합계', lambda item: f"{item['total_ms'] / 1000:.3f}"),
+            ('phase_max_seconds', '단계별 최대 소요 시간', lambda item: f"{item['max_ms'] / 1000:.3f}"),
+            ('phase_count', '단계별 실행 횟수', lambda item: item['count']),
+            ('phase_timeouts', '단계별 타임아웃 횟수', lambda item: item['timeouts']),
+        )
+        for metric, help_text, value in phase_metrics:
+            lines += [f'# HELP {prefix}_{metric} {help_text}', f'# TYPE {prefix}_{metric} gauge']
+            lines += [f'{prefix}_{metric}{{phase="{label(key)}"}} {value(item)}' for key, item in sorted(summary.items())]
+        for name, value in sorted(counters.items()):
+            metric = f"{prefix}_{re.sub(r'[^a-zA-Z0-9_]', '_', name)}"
+            lines += [f'# TYPE {metric} gauge', f'{metric} {value}']
+        lines += [
+            f'# TYPE {prefix}_run_duration_seconds gauge',
+            f'{prefix}_run_duration_seconds {time.time() - self.started_at:.3f}',
+            f'# TYPE {prefix}_last_run_timestamp_seconds gauge',
+            f'{prefix}_last_run_timestamp_seconds {time.time():.0f}',
+        ]
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f'.{path.name}.tmp')
+        tmp_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        os.replace(tmp_path, path)
+        return path
+
+    def print_summary(self):
+        """단계별 소요 시간 / 카운터 요약 출력"""
+        summary = self.summary()
+        if summary:
+            print("\n⏱️ 단계별 소요 시간:")
+        for key, item in sorted(summary.items()):
+            timeout_note = f", 타임아웃 {item['timeouts']}회" if item['timeouts'] else ""
+            print(f"  {key}: {item['count']}회, 합계 {item['total_ms']:.0f}ms, 최대 {item['max_ms']:.0f}ms{timeout_note}")
+        with self._lock:
+            counters = dict(self.counters)
+        if counters:
+            print("🔢 " + ", ".join(f"{name} {value}" for name, value in sorted(counters.items())))
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+월별 스케줄 변경 감지
+- 파싱된 행의 해시(+ HTTP ETag/Last-Modified)를 월별로 기록
+- 변경 없는 월은 중복 체크/저장을 건너뜀
+- hot 월(오늘이 속한 월, 끝나지 않은 지난 경기가 있는 월)만 매번 가져오고
+  나머지 월은 마지막 확인 후 일정 시간이 지났을 때만 다시 확인
+"""
+
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from kbo_metrics import KST
+from kbo_season_store import CANCELLED_STATES, FINISHED_STATES, SeasonStore, atomic_write_text
+
+
+class MonthNotModified(Exception):
+    """HTTP 304 - 마지막으로 기록한 월별 스케줄에서 바뀐 것이 없음"""
+
+
+def rows_fingerprint(rows) -> str:
+    """파싱된 ScheduleRow 목록의 해시 (마크업/속성 변화는 무시하고 값만 비교)"""
+    payload = json.dumps([list(row) for row in rows], ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def month_label(year: int, month: int) -> str:
+    return f"{year}{month:02d}"
+
+
+class MonthFingerprints:
+    """월별 마지막 확인 기록
+
+    - data/{year}-month-fingerprints.json (저장소에 커밋됨): 행 해시/ETag/Last-Modified/변경 시각
+      {"202509": {"rows_sha256", "rows", "etag", "last_modified", "changed_at"}}
+      내용이 바뀐 때만 기록 - 변경 없는 실행이 커밋/배포를 만들지 않음
+    - checks_path(logs/ 아래, 커밋 안 됨): 월별 마지막 확인 시각 {"202509": checked_at}
+      CI에서는 actions/cache로 실행 사이에 유지, 없으면(캐시 만료 등) 모든 월을 확인 대상으로 봄
+    """
+
+    def __init__(self, path: Path, checks_path: Optional[Path] = None):
+        self.path = Path(path)
+        self.checks_path = Path(checks_path) if checks_path else None
+        self.entries: Dict[str, Dict] = self._read(self.path)
+        self.checked: Dict[str, str] = self._read(self.checks_path) if self.checks_path else {}
+        # 이전 형식은 확인 시각도 커밋 파일에 있었음 - 확인 기록으로 옮기고 다음 기록에서 제거
+        for label, entry in self.entries.items():
+            checked_at = entry.pop('checked_at', None)
+            if checked_at and label not in self.checked:
+                self.checked[label] = checked_at
+
+    @staticmethod
+    def _read(path: Path) -> Dict:
+        if not path.exists():
+            return {}
+        try:
+            return json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            # 손상된 기록은 버리고 모든 월을 다시 확인
+            return {}
+
+    def get(self, year: int, month: int) -> Optional[Dict]:
+        return self.entries.get(month_label(year, month))
+
+    def checked_at(self, year: int, month: int) -> Optional[datetime]:
+        value = self.checked.get(month_label(year, month))
+        return datetime.fromisoformat(value) if value else None
+
+    def validators(self, year: int, month: int) -> Dict[str, str]:
+        """조건부 요청 헤더 (If-None-Match / If-Modified-Since)"""
+        entry = self.get(year, month) or {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def is_unchanged(self, year: int, month: int, fingerprint: str) -> bool:
+        entry = self.get(year, month)
+        return bool(entry) and entry.get('rows_sha256') == fingerprint
+
+    def record(self, year: int, month: int, fingerprint: Optional[str] = None, rows: Optional[int] = None,
+               etag: Optional[str] = None, last_modified: Optional[str] = None, now: Optional[datetime] = None):
+        """확인 결과 기록 - fingerprint가 None이면(304/변경 없음) 확인 시각만 갱신"""
+        now = (now or datetime.now(KST)).isoformat(timespec='seconds')
+        label = month_label(year, month)
+        entry = self.entries.setdefault(label, {})
+        if fingerprint is not None:
+            if entry.get('rows_sha256') != fingerprint:
+                entry['changed_at'] = now
+            entry['rows_sha256'] = fingerprint
+            entry['rows'] = rows
+        if etag is not None:
+            entry['etag'] = etag
+        if last_modified is not None:
+            entry['last_modified'] = last_modified
+        self.checked[label] = now
+
+    def save(self):
+        """확인 시각은 항상, 커밋 파일은 내용이 바뀌었을 때만 기록"""
+        if self.checks_path:
+            atomic_write_text(self.checks_path, json.dumps(self.checked, ensure_ascii=False, indent=2, sort_keys=True) + "\n")
+        text = json.dumps(self.entries, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+        try:
+            if self.path.read_text(encoding='utf-8') == text:
+                return
+        except OSError:
+            pass
+        atomic_write_text(self.path, text)
+
+
+def hot_months(store: SeasonStore, months: Iterable[int], today: str) -> List[int]:
+    """매번 가져와야 하는 월 - 오늘이 속한 월, 오늘 이전인데 결과가 없는 경기가 있는 월"""
+    done_states = FINISHED_STATES + CANCELLED_STATES
+    hot = set()
+    for month in months:
+        prefix = f"{store.year}-{month:02d}-"
+        if today.startswith(prefix):
+            hot.add(month)
+            continue
+        for date in store.by_date:
+            if date.startswith(prefix) and date <= today and any(
+                    record.state not in done_states for record in store.games_on(date)):
+                hot.add(month)
+                break
+    return sorted(hot)
+
+
+def plan_months(months: List[int], year: int, store: SeasonStore, fingerprints: MonthFingerprints,
+                now: Optional[datetime] = None, cold_ttl_hours: Optional[float] = None) -> Tuple[List[int], List[int]]:
+    """(가져올 월, 건너뛸 월) - 기록이 없거나 확인한 지 cold_ttl_hours가 지난 월은 다시 가져옴"""
+    now = now or datetime.now(KST)
+    if cold_ttl_hours is None:
+        cold_ttl_hours = float(os.getenv('KBO_COLD_MONTH_TTL_HOURS', '12'))
+
+    hot = set(hot_months(store, months, now.strftime('%Y-%m-%d')))
+    to_fetch, skipped = [], []
+    for month in months:
+        checked_at = fingerprints.checked_at(year, month)
+        if month in hot or checked_at is None or now - checked_at >= timedelta(hours=cold_ttl_hours):
+            to_fetch.append(month)
+        else:
+            skipped.append(month)
+    return to_fetch, skipped
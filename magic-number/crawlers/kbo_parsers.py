@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+다음 스포츠 스케줄 테이블 파서 백엔드
+tbody#scheduleList의 각 tr을 한 번만 훑어 ScheduleRow로 변환
+(BeautifulSoup / lxml / selectolax 중 선택, 결과는 동일)
+"""
+
+import os
+import re
+from collections import namedtuple
+
+# 한 행에서 뽑아내는 원본 값 - 팀 셀(두 팀 div와 팀명)이 온전하지 않으면 home_team/away_team은 None
+# home_*/away_*는 다음 HTML의 div 클래스(team_home/team_away) 기준 값이다
+ScheduleRow = namedtuple('ScheduleRow', [
+    'date_text', 'time', 'area', 'sort', 'tv', 'state',
+    'home_team', 'away_team', 'home_score', 'away_score', 'home_info', 'away_info'
+])
+
+# 행 단위로 읽는 td 클래스 → ScheduleRow 필드
+CELL_FIELDS = {'td_time': 'time', 'td_area': 'area', 'td_sort': 'sort', 'td_tv': 'tv'}
+
+
+def _team_values(name, score, info):
+    """팀 div에서 읽은 (팀명, 점수 텍스트, 부가정보)"""
+    return name, score, info or ""
+
+
+def _make_row(date_text, cells, state, home, away):
+    """셀 값들로 ScheduleRow 생성"""
+    if home is None or away is None or home[0] is None or away[0] is None:
+        home = away = (None, None, "")
+    return ScheduleRow(
+        date_text, cells.get('time', ""), cells.get('area', ""), cells.get('sort', ""), cells.get('tv', ""),
+        state, home[0], away[0], home[1], away[1], home[2], away[2]
+    )
+
+
+DATE_TEXT = re.compile(r'(\d{2})\.(\d{2})')
+
+
+def iter_dated_rows(rows, year):
+    """(YYYY-MM-DD, ScheduleRow) 순회 - 날짜 셀은 rowspan이라 그 날짜의 첫 행에만 있으므로 이어받음"""
+    current_date = None
+    for row in rows:
+        if row.date_text:
+            match = DATE_TEXT.match(row.date_text)
+            if match:
+                current_date = f"{year}-{match.group(1)}-{match.group(2)}"
+        if current_date:
+            yield current_date, row
+
+
+class Bs4ScheduleParser:
+    """BeautifulSoup 백엔드 - 기존 크롤러와 동일한 html.parser 트리"""
+
+    name = 'bs4'
+
+    def __init__(self, features='html.parser'):
+        from bs4 import BeautifulSoup
+        self._soup_class = BeautifulSoup
+        self.features = features
+
+    def parse_rows(self, html):
+        """HTML → ScheduleRow 리스트 (scheduleList가 없으면 None)"""
+        return self.rows_from_soup(self._soup_class(html, self.features))
+
+    @staticmethod
+    def _text(elem):
+        return elem.get_text(strip=True) if elem is not None else None
+
+    @classmethod
+    def _team(cls, div):
+        if div is None:
+            return None
+        name = span_score = em_score = info = None
+        for part in div.find_all(('span', 'em')):
+            classes = part.get('class') or ()
+            if part.name == 'em':
+                if em_score is None and 'num_score' in classes:
+                    em_score = cls._text(part)
+            elif 'txt_team' in classes and name is None:
+                name = cls._text(part)
+            elif 'num_score' in classes and span_score is None:
+                span_score = cls._text(part)
+            elif 'info_team' in classes and info is None:
+                info = cls._text(part)
+        # span.num_score 우선, 없으면 em.num_score
+        return _team_values(name, span_score if span_score is not None else em_score, info)
+
+    @classmethod
+    def rows_from_soup(cls, soup):
+        """이미 만들어진 BeautifulSoup 트리에서 ScheduleRow 추출"""
+        tbody = soup.find('tbody', id='scheduleList')
+        if tbody is None:
+            return None
+
+        rows = []
+        for tr in tbody.find_all('tr'):
+            date_text = state = home = away = None
+            cells, seen = {}, set()
+            for td in tr.find_all('td'):
+                classes = td.get('class') or ()
+                if 'td_date' in classes and 'td_date' not in seen:
+                    seen.add('td_date')
+                    date_text = cls._text(td.find('span', class_='num_date'))
+                elif 'td_team' in classes and 'td_team' not in seen:
+                    seen.add('td_team')
+                    state = cls._text(td.find('span', class_='state_game'))
+                    home = cls._team(td.find('div', class_='team_home'))
+                    away = cls._team(td.find('div', class_='team_away'))
+                else:
+                    for css_class, field in CELL_FIELDS.items():
+                        if css_class in classes and css_class not in seen:
+                            seen.add(css_class)
+                            cells[field] = td.get_text(strip=True)
+            rows.append(_make_row(date_text, cells, state, home, away))
+        return rows
+
+
+class LxmlScheduleParser:
+    """lxml 백엔드 - 미리 컴파일한 XPath로 행 단위 추출"""
+
+    name = 'lxml'
+
+    def __init__(self):
+        from lxml import etree, html as lxml_html
+        self._fromstring = lxml_html.document_fromstring
+
+        def has_class(css_class):
+            return f"contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')"
+
+        self._tbody = etree.XPath("//tbody[@id='scheduleList']")
+        self._rows = etree.XPath(".//tr")
+        self._cells = etree.XPath(".//td")
+        self._num_date = etree.XPath(f".//span[{has_class('num_date')}]")
+        self._state = etree.XPath(f".//span[{has_class('state_game')}]")
+        self._team_home = etree.XPath(f".//div[{has_class('team_home')}]")
+        self._team_away = etree.XPath(f".//div[{has_class('team_away')}]")
+        self._team_parts = etree.XPath(
+            f".//span[{has_class('txt_team')} or {has_class('num_score')} or {has_class('info_team')}]"
+            f" | .//em[{has_class('num_score')}]"
+        )
+
+    @staticmethod
+    def _text(elem):
+        if elem is None:
+            return None
+        return ''.join(part.strip() for part in elem.itertext())
+
+    @staticmethod
+    def _first(xpath, elem):
+        found = xpath(elem)
+        return found[0] if found else None
+
+    def _team(self, div):
+        if div is None:
+            return None
+        name = span_score = em_score = info = None
+        for part in self._team_parts(div):
+            classes = (part.get('class') or '').split()
+            if part.tag == 'em':
+                if em_score is None:
+                    em_score = self._text(part)
+            elif 'txt_team' in classes and name is None:
+                name = self._text(part)
+            elif 'num_score' in classes and span_score is None:
+                span_score = self._text(part)
+            elif 'info_team' in classes and info is None:
+                info = self._text(part)
+        return _team_values(name, span_score if span_score is not None else em_score, info)
+
+    def parse_rows(self, html):
+        """HTML → ScheduleRow 리스트 (scheduleList가 없으면 None)"""
+        tbody = self._first(self._tbody, self._fromstring(html))
+        if tbody is None:
+            return None
+
+        rows = []
+        for tr in self._rows(tbody):
+            date_text = state = home = away = None
+            cells, seen = {}, set()
+            for td in self._cells(tr):
+                classes = (td.get('class') or '').split()
+                if 'td_date' in classes and 'td_date' not in seen:
+                    seen.add('td_date')
+                    date_text = self._text(self._first(self._num_date, td))
+                elif 'td_team' in classes and 'td_team' not in seen:
+                    seen.add('td_team')
+                    state = self._text(self._first(self._state, td))
+                    home = self._team(self._first(self._team_home, td))
+                    away = self._team(self._first(self._team_away, td))
+                else:
+                    for css_class, field in CELL_FIELDS.items():
+                        if css_class in classes and css_class not in seen:
+                            seen.add(css_class)
+                            cells[field] = self._text(td)
+            rows.append(_make_row(date_text, cells, state, home, away))
+        return rows
+
+
+class SelectolaxScheduleParser:
+    """selectolax(lexbor) 백엔드 - C 파서 + CSS 선택자"""
+
+    name = 'selectolax'
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+        self._parser_class = LexborHTMLParser
+
+    @staticmethod
+    def _text(node):
+        return node.text(deep=True, separator='', strip=True) if node is not None else None
+
+    def _team(self, div):
+        if div is None:
+            return None
+        name = span_score = em_score = info = None
+        for part in div.css('span.txt_team, span.num_score, em.num_score, span.info_team'):
+            classes = (part.attributes.get('class') or '').split()
+            if part.tag == 'em':
+                if em_score is None:
+                    em_score = self._text(part)
+            elif 'txt_team' in classes and name is None:
+                name = self._text(part)
+            elif 'num_score' in classes and span_score is None:
+                span_score = self._text(part)
+            elif 'info_team' in classes and info is None:
+                info = self._text(part)
+        return _team_values(name, span_score if span_score is not None else em_score, info)
+
+    def parse_rows(self, html):
+        """HTML → ScheduleRow 리스트 (scheduleList가 없으면 None)"""
+        tbody = self._parser_class(html).css_first('tbody#scheduleList')
+        if tbody is None:
+            return None
+
+        rows = []
+        for tr in tbody.css('tr'):
+            date_text = state = home = away = None
+            cells, seen = {}, set()
+            for td in tr.css('td'):
+                classes = (td.attributes.get('class') or '').split()
+                if 'td_date' in classes and 'td_date' not in seen:
+                    seen.add('td_date')
+                    date_text = self._text(td.css_first('span.num_date'))
+                elif 'td_team' in classes and 'td_team' not in seen:
+                    seen.add('td_team')
+                    state = self._text(td.css_first('span.state_game'))
+                    home = self._team(td.css_first('div.team_home'))
+                    away = self._team(td.css_first('div.team_away'))
+                else:
+                    for css_class, field in CELL_FIELDS.items():
+                        if css_class in classes and css_class not in seen:
+                            seen.add(css_class)
+                            cells[field] = self._text(td)
+            rows.append(_make_row(date_text, cells, state, home, away))
+        return rows
+
+
+PARSER_BACKENDS = {
+    'selectolax': SelectolaxScheduleParser,
+    'lxml': LxmlScheduleParser,
+    'bs4': Bs4ScheduleParser,
+}
+
+
+def available_parsers():
+    """현재 환경에서 사용 가능한 백엔드 이름 (빠른 순)"""
+    names = []
+    for name, parser_class in PARSER_BACKENDS.items():
+        try:
+            parser_class()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_parser(name=None):
+    """백엔드 생성 - auto(기본값)는 설치된 것 중 가장 빠른 백엔드 선택 (KBO_PARSER 환경변수)"""
+    name = name or os.getenv('KBO_PARSER', 'auto')
+    if name != 'auto':
+        if name not in PARSER_BACKENDS:
+            raise ValueError(f"지원하지 않는 파서: {name}")
+        return PARSER_BACKENDS[name]()
+
+    for parser_class in PARSER_BACKENDS.values():
+        try:
+            return parser_class()
+        except ImportError:
+            continue
+    raise ImportError("사용 가능한 HTML 파서가 없습니다 (selectolax, lxml, beautifulsoup4 중 하나 필요)")
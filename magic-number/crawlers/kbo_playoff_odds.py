@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+KBO 포스트시즌 진출 확률 몬테카를로 시뮬레이터
+- 남은 일정: 시즌 데이터의 경기전 페넌트레이스 경기
+- 팀 전력: 2025-team-stats.json 득실점의 피타고리안 승률 → log5 + 홈 어드밴티지 + 리그 무승부율
+- 시즌 묶음(chunk)을 NumPy로 한 번에 시뮬레이션하고 프로세스 풀에 나눠 실행
+  묶음마다 SeedSequence에서 나눈 시드를 사용하므로 워커 수와 관계없이 결과가 같음
+- 묶음이 끝날 때마다 진행 상황을 순서대로 내보내고, 95% 신뢰구간이 충분히 좁아지면 조기 종료
+
+사용법:
+  python3 magic-number/crawlers/kbo_playoff_odds.py [--seasons N] [--workers N] [--seed N] [--tolerance P]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'config'))
+from kbo_metrics import KST
+from kbo_season_store import (CANCELLED_STATES, FINISHED_STATES, SeasonStore, atomic_write_text, latest_season,
+                              season_file_name)
+from paths import get_path_manager
+
+POSTSEASON_TEAMS = 5
+PYTHAGOREAN_EXPONENT = 1.83
+REGULAR_SEASON = "페넌트레이스"
+Z_95 = 1.96
+
+
+class OddsProgress(NamedTuple):
+    """시뮬레이션 진행 상황 - rank_odds[팀, 순위-1], postseason_odds[팀]"""
+    seasons: int
+    rank_odds: np.ndarray
+    postseason_odds: np.ndarray
+    max_half_width: float
+    done: bool
+
+
+def pythagorean(runs_scored: float, runs_allowed: float) -> float:
+    if runs_scored <= 0 and runs_allowed <= 0:
+        return 0.5
+    scored = runs_scored ** PYTHAGOREAN_EXPONENT
+    return scored / (scored + runs_allowed ** PYTHAGOREAN_EXPONENT)
+
+
+def home_win_probability(home_strength, away_strength, home_advantage: float):
+    """log5 승률에 리그 홈 승률(0.5 기준)의 배당비를 곱한 홈팀 승리 확률 (무승부 제외)"""
+    odds = (home_strength * (1 - away_strength)) / (away_strength * (1 - home_strength))
+    odds = odds * (home_advantage / (1 - home_advantage))
+    return odds / (1 + odds)
+
+
+def simulate_chunk(params: Dict, seasons: int, seed_sequence) -> np.ndarray:
+    """시즌 seasons번 시뮬레이션 - 순위 횟수 배열 [팀, 순위-1]
+
+    프로세스 풀에서 실행되므로 모듈 최상위 함수로 두고 작은 배열만 주고받음
+    """
+    rng = np.random.default_rng(seed_sequence)
+    wins, losses = params['wins'], params['losses']
+    teams = len(wins)
+    home_onehot, away_onehot = params['home_onehot'], params['away_onehot']
+    draw_rate, p_home = params['draw_rate'], params['p_home']
+
+    if len(p_home):
+        u = rng.random((seasons, len(p_home)), dtype=np.float32)
+        home_win = (u >= draw_rate) & (u < draw_rate + (1 - draw_rate) * p_home)
+        away_win = u >= draw_rate + (1 - draw_rate) * p_home
+        # 원핫 행렬 곱으로 팀별 추가 승/패 합산 (float32는 2^24까지 정확)
+        home_win = home_win.astype(np.float32)
+        away_win = away_win.astype(np.float32)
+        final_wins = wins + home_win @ home_onehot + away_win @ away_onehot
+        final_losses = losses + away_win @ home_onehot + home_win @ away_onehot
+    else:
+        final_wins = np.broadcast_to(wins, (seasons, teams)).astype(np.float64)
+        final_losses = np.broadcast_to(losses, (seasons, teams)).astype(np.float64)
+
+    decisions = final_wins + final_losses
+    pct = np.divide(final_wins, decisions, out=np.zeros_like(decisions, dtype=np.float64), where=decisions > 0)
+    # 승률이 같으면 무작위 순위 (승률 차이의 최소 단위보다 훨씬 작은 값)
+    pct = pct + rng.random(pct.shape) * 1e-9
+    order = np.argsort(-pct, axis=1)
+    counts = np.zeros((teams, teams), dtype=np.int64)
+    np.add.at(counts, (order, np.broadcast_to(np.arange(teams), order.shape)), 1)
+    return counts
+
+
+class PlayoffOddsSimulator:
+    """현재 순위표 + 남은 일정 + 팀 전력으로 최종 순위 확률 계산"""
+
+    def __init__(self, teams: List[str], wins, losses, draws, schedule: List, strength: Dict[str, float],
+                 draw_rate: float = 0.0, home_advantage: float = 0.5):
+        self.teams = list(teams)
+        index = {team: i for i, team in enumerate(self.teams)}
+        self.wins = np.asarray(wins, dtype=np.float64)
+        self.losses = np.asarray(losses, dtype=np.float64)
+        self.draws = np.asarray(draws, dtype=np.int64)
+        self.schedule = [(home, away) for home, away in schedule if home in index and away in index]
+        self.strength = np.array([strength.get(team, 0.5) for team in self.teams])
+        self.draw_rate = draw_rate
+        self.home_advantage = home_advantage
+
+        count = len(self.schedule)
+        home_idx = np.array([index[home] for home, _ in self.schedule], dtype=np.int64)
+        away_idx = np.array([index[away] for _, away in self.schedule], dtype=np.int64)
+        home_onehot = np.zeros((count, len(self.teams)), dtype=np.float32)
+        away_onehot = np.zeros((count, len(self.teams)), dtype=np.float32)
+        home_onehot[np.arange(count), home_idx] = 1
+        away_onehot[np.arange(count), away_idx] = 1
+        p_home = home_win_probability(self.strength[home_idx], self.strength[away_idx], home_advantage)
+        self.params = {
+            'wins': self.wins, 'losses': self.losses,
+            'home_onehot': home_onehot, 'away_onehot': away_onehot,
+            'draw_rate': np.float32(draw_rate), 'p_home': p_home.astype(np.float32),
+        }
+
+    @classmethod
+    def from_season(cls, store: SeasonStore, team_stats: Dict[str, Dict]) -> 'PlayoffOddsSimulator':
+        """시즌 저장소(완료/경기전 페넌트레이스 경기)와 팀 통계(득실점)로 생성"""
+        records = {}
+        schedule = []
+        home_wins = decisions = games = draws = 0
+        for record in store:
+            if REGULAR_SEASON not in record.sort or record.state in CANCELLED_STATES:
+                continue
+            if record.state == "경기전" and record.score == "경기전":
+                schedule.append((record.home_team, record.away_team))
+                continue
+            if record.state not in FINISHED_STATES or ':' not in record.score:
+                continue
+            away_score, home_score = (int(value) for value in record.score.split(':'))
+            home = records.setdefault(record.home_team, [0, 0, 0])
+            away = records.setdefault(record.away_team, [0, 0, 0])
+            games += 1
+            if home_score == away_score:
+                home[2] += 1
+                away[2] += 1
+                draws += 1
+            elif home_score > away_score:
+                home[0] += 1
+                away[1] += 1
+                home_wins += 1
+                decisions += 1
+            else:
+                home[1] += 1
+                away[0] += 1
+                decisions += 1
+
+        teams = [team for team in team_stats if team in records] + \
+                sorted(team for team in records if team not in team_stats)
+        strength = {}
+        for team, stats in team_stats.items():
+            strength[team] = pythagorean(stats.get('runs_scored', 0), stats.get('runs_allowed', 0))
+        return cls(teams,
+                   [records[team][0] for team in teams],
+                   [records[team][1] for team in teams],
+                   [records[team][2] for team in teams],
+                   schedule, strength,
+                   draw_rate=draws / games if games else 0.0,
+                   home_advantage=home_wins / decisions if decisions else 0.5)
+
+    def iter_progress(self, max_seasons: int = 1_000_000, min_seasons: int = 100_000, chunk_size: int = 20_000,
+                      workers: Optional[int] = None, seed: int = 2025, tolerance: float = 0.0025) -> Iterator[OddsProgress]:
+        """묶음이 끝날 때마다 누적 확률을 내보냄 - 모든 확률의 95% 신뢰구간 반폭이 tolerance 이하면 조기 종료
+
+        묶음 결과는 제출 순서대로 합치므로 같은 seed면 워커 수와 관계없이 같은 지점에서 멈춤
+        """
+        workers = workers or min(4, os.cpu_count() or 1)
+        chunks = [min(chunk_size, max_seasons - start) for start in range(0, max_seasons, chunk_size)]
+        seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+        if not self.schedule:
+            # 남은 경기가 없으면 한 번이면 충분 (동률 순위만 무작위)
+            chunks, seeds = chunks[:1], seeds[:1]
+
+        counts = np.zeros((len(self.teams), len(self.teams)), dtype=np.int64)
+        seasons = 0
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(chunks) > 1 else None
+        pending = deque()
+        next_chunk = 0
+        try:
+            while next_chunk < len(chunks) or pending:
+                while executor and next_chunk < len(chunks) and len(pending) < workers * 2:
+                    pending.append(executor.submit(simulate_chunk, self.params, chunks[next_chunk], seeds[next_chunk]))
+                    next_chunk += 1
+                if executor:
+                    chunk_counts = pending.popleft().result()
+                else:
+                    chunk_counts = simulate_chunk(self.params, chunks[next_chunk], seeds[next_chunk])
+                    next_chunk += 1
+
+                counts += chunk_counts
+                seasons += int(chunk_counts[0].sum())
+                rank_odds = counts / seasons
+                postseason = rank_odds[:, :POSTSEASON_TEAMS].sum(axis=1)
+                probabilities = np.concatenate([rank_odds.ravel(), postseason])
+                half_width = float(Z_95 * np.sqrt(probabilities * (1 - probabilities) / seasons).max())
+                done = (next_chunk >= len(chunks) and not pending) or \
+                    (seasons >= min_seasons and half_width <= tolerance) or not self.schedule
+                yield OddsProgress(seasons, rank_odds, postseason, half_width, done)
+                if done:
+                    break
+        finally:
+            if executor:
+                for future in pending:
+                    future.cancel()
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def run(self, **kwargs) -> OddsProgress:
+        progress = None
+        for progress in self.iter_progress(**kwargs):
+            pass
+        return progress
+
+    def to_json(self, progress: OddsProgress, seed: int) -> Dict:
+        """calc-playoff-odds.json 형식"""
+        teams = {}
+        for i, team in enumerate(self.teams):
+            teams[team] = {
+                'wins': int(self.wins[i]),
+                'losses': int(self.losses[i]),
+                'draws': int(self.draws[i]),
+                'strength': round(float(self.strength[i]), 4),
+                'postseason': round(float(progress.postseason_odds[i]), 4),
+                'ranks': [round(float(value), 4) for value in progress.rank_odds[i]],
+            }
+        return {
+            'lastUpdated': datetime.now(KST).isoformat(timespec='seconds'),
+            'seasons': progress.seasons,
+            'seed': seed,
+            'ci95HalfWidth': round(progress.max_half_width, 5),
+            'remainingGames': len(self.schedule),
+            'drawRate': round(self.draw_rate, 4),
+            'homeWinRate': round(self.home_advantage, 4),
+            'postseasonTeams': POSTSEASON_TEAMS,
+            'teams': teams,
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='KBO 포스트시즌 진출 확률 시뮬레이션')
+    parser.add_argument('--year', type=int, default=None, help='시즌 (기본: KBO_SEASON 또는 데이터가 있는 가장 최근 시즌)')
+    parser.add_argument('--seasons', type=int, default=1_000_000, help='최대 시뮬레이션 시즌 수')
+    parser.add_argument('--min-seasons', type=int, default=100_000, help='조기 종료 전 최소 시즌 수')
+    parser.add_argument('--chunk', type=int, default=20_000, help='묶음(작업) 하나의 시즌 수')
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수 (기본: CPU 수, 최대 4)')
+    parser.add_argument('--seed', type=int, default=2025, help='난수 시드')
+    parser.add_argument('--tolerance', type=float, default=0.0025, help='조기 종료 95%% 신뢰구간 반폭')
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: data/calc-playoff-odds.json)')
+    args = parser.parse_args(argv)
+
+    paths = get_path_manager()
+    data_dir = Path(paths.data_dir)
+    args.year = args.year or latest_season(data_dir)
+    season_file = data_dir / season_file_name(args.year)
+    team_stats_file = data_dir / f'{args.year}-team-stats.json'
+    for required in (season_file, team_stats_file):
+        if not required.exists():
+            print(f"❌ 파일 없음: {required} (--year 또는 KBO_SEASON 확인, 팀 통계는 npm run pipeline으로 생성)")
+            return 1
+    store = SeasonStore.read(season_file, year=args.year)
+    team_stats = json.loads(team_stats_file.read_text(encoding='utf-8'))
+    simulator = PlayoffOddsSimulator.from_season(store, team_stats)
+    print(f"🎲 포스트시즌 확률 시뮬레이션: {len(simulator.teams)}개 팀, 남은 경기 {len(simulator.schedule)}개")
+
+    started = time.perf_counter()
+    progress = None
+    for progress in simulator.iter_progress(max_seasons=args.seasons, min_seasons=args.min_seasons,
+                                            chunk_size=args.chunk, workers=args.workers, seed=args.seed,
+                                            tolerance=args.tolerance):
+        print(f"   {progress.seasons:>9,}시즌 - 95% 신뢰구간 ±{progress.max_half_width * 100:.2f}%p")
+
+    output = Path(args.output) if args.output else data_dir / 'calc-playoff-odds.json'
+    atomic_write_text(output, json.dumps(simulator.to_json(progress, args.seed), ensure_ascii=False, indent=2) + "\n")
+
+    print(f"\n{'팀':<6}{'승-패-무':>12}{'PS 확률':>10}  순위별 확률 (1~{len(simulator.teams)}위)")
+    for i in np.argsort(-progress.postseason_odds, kind='stable'):
+        record = f"{int(simulator.wins[i])}-{int(simulator.losses[i])}-{int(simulator.draws[i])}"
+        ranks = ' '.join(f"{value * 100:5.1f}" for value in progress.rank_odds[i])
+        print(f"{simulator.teams[i]:<6}{record:>12}{progress.postseason_odds[i] * 100:>9.1f}%  {ranks}")
+    print(f"\n✅ {progress.seasons:,}시즌 {time.perf_counter() - started:.1f}초 - 저장: {output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
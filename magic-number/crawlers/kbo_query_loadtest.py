@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+KBO 조회 서비스 부하 테스트 (asyncio, keep-alive 연결)
+- 순위표/팀 일정/상대전적/매직넘버 요청을 섞어 동시 연결 수만큼 보내고
+  처리량, 지연 시간 분포(p50/p95/p99), 상태 코드, 전송 바이트, 서버 캐시 적중률을 출력
+- --revalidate: 한 번 받은 응답의 ETag로 If-None-Match 재요청 (304 경로)
+- --spawn: 임의 포트로 서비스를 띄워 테스트 후 종료 (없으면 --url의 실행 중인 서비스 사용)
+
+사용법:
+  python3 magic-number/crawlers/kbo_query_loadtest.py --spawn [--connections 32] [--requests 5000] [--revalidate]
+  python3 magic-number/crawlers/kbo_query_loadtest.py --url http://127.0.0.1:8765 --max-p95-ms 20
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from kbo_season_store import latest_season
+from kbo_standings_engine import TEAMS
+
+SERVICE_FILE = Path(__file__).resolve().parent / 'kbo_query_service.py'
+
+
+def request_paths(year: int, rng: random.Random, count: int) -> List[str]:
+    """요청 경로 혼합 - 날짜별 순위 40%, 팀 일정 25%, 상대전적 20%, 매직넘버 15%"""
+    dates = [f"{year}-{month:02d}-{day:02d}" for month in range(3, 11) for day in (1, 8, 15, 22, 28)]
+    paths = []
+    for _ in range(count):
+        roll = rng.random()
+        team = rng.choice(TEAMS)
+        if roll < 0.40:
+            paths.append(f"/standings?date={rng.choice(dates)}")
+        elif roll < 0.65:
+            paths.append(f"/teams/{quote(team)}/schedule")
+        elif roll < 0.85:
+            opponent = rng.choice([other for other in TEAMS if other != team])
+            paths.append(f"/head-to-head?team={quote(team)}&opponent={quote(opponent)}&date={rng.choice(dates)}")
+        else:
+            paths.append(f"/magic?team={quote(team)}&rank={rng.randint(1, 9)}")
+    return paths
+
+
+async def read_response(reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str], bytes]:
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError('연결 종료')
+    status = int(status_line.split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers.get('content-length', '0')))
+    return status, headers, body
+
+
+async def worker(host: str, port: int, queue: asyncio.Queue, results: List, etags: Dict[str, str], revalidate: bool):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            try:
+                path = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            extra = f"If-None-Match: {etags[path]}\r\n" if revalidate and path in etags else ''
+            started = time.perf_counter()
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n{extra}\r\n".encode('latin-1'))
+            await writer.drain()
+            status, headers, body = await read_response(reader)
+            results.append((time.perf_counter() - started, status, len(body)))
+            if 'etag' in headers:
+                etags[path] = headers['etag']
+    finally:
+        writer.close()
+
+
+async def fetch_json(host: str, port: int, path: str) -> Dict:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode('latin-1'))
+        await writer.drain()
+        _, _, body = await read_response(reader)
+        return json.loads(body)
+    finally:
+        writer.close()
+
+
+async def run_load(host: str, port: int, paths: List[str], connections: int, revalidate: bool):
+    """(결과 목록, 경과 시간) - 결과는 (지연 초, 상태 코드, 본문 바이트)"""
+    etags: Dict[str, str] = {}
+    if revalidate:
+        # 경로별 ETag를 먼저 한 번 받아 둠 (측정에서 제외)
+        warmup = asyncio.Queue()
+        for path in dict.fromkeys(paths):
+            warmup.put_nowait(path)
+        await asyncio.gather(*(worker(host, port, warmup, [], etags, False) for _ in range(connections)))
+
+    queue = asyncio.Queue()
+    for path in paths:
+        queue.put_nowait(path)
+    results = []
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(host, port, queue, results, etags, revalidate) for _ in range(connections)))
+    return results, time.perf_counter() - started
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def spawn_service(port: int, year: int, data_dir: Optional[str]) -> subprocess.Popen:
+    command = [sys.executable, str(SERVICE_FILE), '--host', '127.0.0.1', '--port', str(port), '--year', str(year)]
+    if data_dir:
+        command += ['--data-dir', data_dir]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"조회 서비스 시작 실패: {process.stderr.read().decode('utf-8', 'replace')}")
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.2):
+                return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError('조회 서비스가 30초 안에 시작되지 않음')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='KBO 조회 서비스 부하 테스트')
+    parser.add_argument('--url', default='http://127.0.0.1:8765', help='서비스 주소 (--spawn이 없을 때)')
+    parser.add_argument('--spawn', action='store_true', help='임의 포트로 서비스를 띄워서 테스트')
+    parser.add_argument('--data-dir', default=None, help='--spawn 서비스의 데이터 디렉토리')
+    parser.add_argument('--year', type=int, default=None, help='시즌 (기본: KBO_SEASON 또는 데이터가 있는 가장 최근 시즌)')
+    parser.add_argument('--connections', type=int, default=32, help='동시 keep-alive 연결 수')
+    parser.add_argument('--requests', type=int, default=5000, help='총 요청 수')
+    parser.add_argument('--revalidate', action='store_true', help='ETag로 If-None-Match 재요청 (304 경로 측정)')
+    parser.add_argument('--seed', type=int, default=2025, help='요청 혼합 난수 시드')
+    parser.add_argument('--max-p95-ms', type=float, default=None, help='p95 지연이 이 값을 넘으면 종료 코드 1')
+    args = parser.parse_args(argv)
+    if args.year is None:
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'config'))
+        from paths import get_path_manager
+        args.year = latest_season(Path(args.data_dir or get_path_manager().data_dir))
+
+    process = None
+    if args.spawn:
+        host, port = '127.0.0.1', free_port()
+        process = spawn_service(port, args.year, args.data_dir)
+    else:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+
+    try:
+        paths = [f"{path}{'&' if '?' in path else '?'}year={args.year}"
+                 for path in request_paths(args.year, random.Random(args.seed), args.requests)]
+        results, elapsed = asyncio.run(run_load(host, port, paths, args.connections, args.revalidate))
+        health = asyncio.run(fetch_json(host, port, '/health'))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+    latencies = sorted(latency * 1000 for latency, _, _ in results)
+    statuses = Counter(status for _, status, _ in results)
+    transferred = sum(size for _, _, size in results)
+    p95 = percentile(latencies, 0.95)
+    print(f"🚀 {len(results)}건 / 연결 {args.connections}개 / {elapsed:.2f}초 → {len(results) / elapsed:,.0f} req/s")
+    print(f"⏱️ 지연 p50 {percentile(latencies, 0.50):.2f}ms · p95 {p95:.2f}ms · p99 {percentile(latencies, 0.99):.2f}ms "
+          f"· 최대 {latencies[-1]:.2f}ms · 평균 {statistics.mean(latencies):.2f}ms")
+    print(f"📦 본문 {transferred / 1024:,.0f}KB (요청당 평균 {transferred / max(1, len(results)):,.0f}B)")
+    print(f"📊 상태 코드: {', '.join(f'{status} × {count}' for status, count in sorted(statuses.items()))}")
+    cache = health.get('cache', {})
+    print(f"🗄️ 서버 캐시: 항목 {cache.get('entries')}/{cache.get('maxEntries')}, 적중률 {cache.get('hitRate')}, "
+          f"재로드 {health.get('reloads')}회")
+
+    if any(status >= 500 for status in statuses):
+        print("❌ 서버 오류 응답 발생")
+        return 1
+    if args.max_p95_ms is not None and p95 > args.max_p95_ms:
+        print(f"❌ p95 {p95:.2f}ms > 허용 {args.max_p95_ms:.2f}ms")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+KBO 시즌 데이터 읽기 전용 조회 서비스 (asyncio, 표준 라이브러리 HTTP/1.1)
+정적 JSON 전체를 내려받지 않고 필요한 값만 조회
+
+- GET /standings?date=YYYY-MM-DD[&from=YYYY-MM-DD]        날짜 기준(또는 구간) 순위표
+- GET /teams/{팀}/schedule[?from=&to=]                     팀 일정/결과
+- GET /head-to-head?team=LG&opponent=한화[&date=&from=]    두 팀 상대전적
+- GET /magic?team=LG&rank=5[&date=]                        팀/순위별 매직·트래직 넘버 (+ raw 값, clinched/eliminated/alive)
+- GET /health                                              캐시/데이터 상태
+  모든 조회는 year 파라미터로 시즌 지정 (기본: KBO_SEASON 또는 올해)
+
+- 응답은 (경로, 파라미터)별 LRU + TTL 메모리 캐시 - 크롤러가 시즌 파일/순위 상태를 다시 쓰면
+  (파일 mtime/크기/inode 변화) 해당 시즌을 다시 로드하고 캐시를 비움
+- ETag(본문 해시) + If-None-Match → 304
+
+사용법:
+  python3 magic-number/crawlers/kbo_query_service.py [--host 127.0.0.1] [--port 8765] [--cache-size 512] [--ttl 60]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from kbo_magic_engine import RANKS, Standings, magic_tragic
+from kbo_metrics import KST
+from kbo_season_store import SeasonStore, latest_season, season_file_name
+from kbo_standings_engine import TEAMS, StandingsEngine, counted_score, standings_state_path
+from kbo_standings_index import StandingsIndex
+
+DATE_PARAM = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+KEEPALIVE_TIMEOUT = 15
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           500: 'Internal Server Error'}
+
+
+class QueryError(Exception):
+    """잘못된 요청/없는 자원 - HTTP 상태 코드와 메시지"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ResponseCache:
+    """응답 본문 LRU + TTL 캐시 - 키마다 (시즌 세대, ETag, 본문, 만료 시각)"""
+
+    def __init__(self, max_entries: int = 512, ttl: float = 60.0, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.entries: 'OrderedDict[Tuple, Tuple[int, str, bytes, float]]' = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+        # 요청은 스레드 풀에서 처리되므로 항목/통계 변경은 잠금 안에서
+        self.lock = threading.Lock()
+
+    def get(self, key: Tuple, generation: int) -> Optional[Tuple[str, bytes]]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] != generation or entry[3] <= self.clock():
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1], entry[2]
+
+    def put(self, key: Tuple, generation: int, etag: str, body: bytes):
+        with self.lock:
+            self.entries[key] = (generation, etag, body, self.clock() + self.ttl)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, year: Optional[int] = None):
+        """시즌 하나(또는 전체)의 응답 제거 - 키의 첫 항목이 시즌"""
+        with self.lock:
+            if year is None:
+                self.entries.clear()
+                return
+            for key in [key for key in self.entries if key[0] == year]:
+                del self.entries[key]
+
+    def stats(self) -> Dict:
+        with self.lock:
+            total = self.hits + self.misses
+            return {'entries': len(self.entries), 'maxEntries': self.max_entries, 'ttlSeconds': self.ttl,
+                    'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                    'hitRate': round(self.hits / total, 3) if total else None}
+
+
+class SeasonData:
+    """한 시즌의 저장소/순위 상태/누적 인덱스 - 파일이 바뀌었을 때만 다시 로드"""
+
+    def __init__(self, data_dir: Path, year: int):
+        self.year = year
+        self.season_file = Path(data_dir) / season_file_name(year)
+        self.state_file = standings_state_path(data_dir, year)
+        # 크롤러의 저널 - append 후 commit이 기록되면 시즌 파일은 그대로여도 다시 읽어야 함
+        self.journal_file = self.season_file.with_name(self.season_file.name + '.journal')
+        self.signature = None
+        self.generation = 0
+        self.loaded_at = None
+        self.store: Optional[SeasonStore] = None
+        self.index: Optional[StandingsIndex] = None
+        self.reload_lock = threading.Lock()
+
+    def file_signature(self):
+        signature = []
+        for path in (self.season_file, self.state_file, self.journal_file):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                signature.append(None)
+                continue
+            signature.append((stat.st_mtime_ns, stat.st_size, stat.st_ino))
+        return tuple(signature)
+
+    def refresh(self) -> bool:
+        """크롤러가 파일을 다시 썼으면 재로드 - 재로드했으면 True
+
+        시즌/순위 상태 파일은 읽기만 함 (SeasonStore.read - 임시 파일 정리나 저널 복구를 하지 않음)
+        다른 요청이 재로드 중이면 이전 세대를 그대로 제공 (처음 로드할 때만 끝날 때까지 대기)
+        """
+        signature = self.file_signature()
+        if signature == self.signature:
+            return False
+        if not self.reload_lock.acquire(blocking=self.store is None):
+            return False
+        try:
+            return self._reload()
+        finally:
+            self.reload_lock.release()
+
+    def _reload(self) -> bool:
+        signature = self.file_signature()
+        if signature == self.signature:
+            return False
+        if signature[0] is None:
+            raise QueryError(404, f"{self.year} 시즌 데이터 없음")
+        store = SeasonStore.read(self.season_file, year=self.year)
+        if store.pending and self.store is not None:
+            # 크롤러가 쓰는 중 - 이전 세대를 계속 제공하고, 서명을 그대로 둬서 다음 요청에서 다시 확인
+            return False
+        self.index = StandingsIndex.from_engine(StandingsEngine.load_for(store, self.state_file))
+        self.store = store
+        self.signature = signature
+        self.generation += 1
+        self.loaded_at = datetime.now(KST).isoformat(timespec='seconds')
+        return True
+
+
+class QueryService:
+    """경로 → 조회 함수, 시즌별 데이터와 응답 캐시"""
+
+    def __init__(self, data_dir: Path, default_year: int, cache: Optional[ResponseCache] = None):
+        self.data_dir = Path(data_dir)
+        self.default_year = default_year
+        self.cache = cache or ResponseCache()
+        self.seasons: Dict[int, SeasonData] = {}
+        self.started_at = datetime.now(KST).isoformat(timespec='seconds')
+        self.requests = 0
+        self.not_modified = 0
+        self.reloads = 0
+        # 시즌 등록/카운터 잠금 - respond()는 이벤트 루프 밖 스레드 풀에서 실행됨
+        self.lock = threading.Lock()
+
+    def season(self, year: int) -> SeasonData:
+        with self.lock:
+            data = self.seasons.get(year)
+            if data is None:
+                # 파일이 있는 시즌만 등록 - 임의 year 요청으로 항목이 늘어나지 않음
+                data = SeasonData(self.data_dir, year)
+                if not data.season_file.exists():
+                    raise QueryError(404, f"{year} 시즌 데이터 없음")
+                self.seasons[year] = data
+        if data.refresh():
+            with self.lock:
+                self.reloads += 1
+            self.cache.invalidate(year)
+        return data
+
+    # ---- 요청 처리 ----
+
+    def respond(self, method: str, target: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """(상태 코드, 응답 헤더, 본문) - 조회 결과는 캐시에서 꺼내거나 계산 후 캐시
+
+        재로드/조회 계산이 이벤트 루프를 막지 않도록 스레드 풀에서 호출됨 (handle_connection)
+        """
+        with self.lock:
+            self.requests += 1
+        try:
+            if method not in ('GET', 'HEAD'):
+                raise QueryError(405, '읽기 전용 서비스 - GET/HEAD만 지원')
+            url = urlsplit(target)
+            path = unquote(url.path).rstrip('/') or '/'
+            params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+            if path == '/health':
+                return self._json_response(200, self.health())
+
+            year = self._int_param(params.pop('year', None), self.default_year, 'year')
+            data = self.season(year)
+            key = (year, path, tuple(sorted(params.items())))
+            cached = self.cache.get(key, data.generation)
+            if cached is None:
+                body = self._encode(self.route(data, path, params))
+                etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+                self.cache.put(key, data.generation, etag, body)
+            else:
+                etag, body = cached
+            return self._body_response(body, etag, headers, method)
+        except QueryError as e:
+            return self._json_response(e.status, {'error': str(e)})
+        except Exception as e:
+            return self._json_response(500, {'error': f'{type(e).__name__}: {e}'})
+
+    def route(self, data: SeasonData, path: str, params: Dict[str, str]):
+        parts = path.strip('/').split('/')
+        if path == '/standings':
+            return self.standings(data, params)
+        if len(parts) == 3 and parts[0] == 'teams' and parts[2] == 'schedule':
+            return self.schedule(data, self._team(parts[1]), params)
+        if path == '/head-to-head':
+            return self.head_to_head(data, params)
+        if path == '/magic':
+            return self.magic(data, params)
+        raise QueryError(404, f'알 수 없는 경로: {path}')
+
+    # ---- 조회 ----
+
+    def standings(self, data: SeasonData, params: Dict[str, str]):
+        as_of, since = self._date(params, 'date'), self._date(params, 'from')
+        return {
+            'year': data.year,
+            'from': since,
+            'asOf': data.index.last_game_date(as_of),
+            'standings': [self._round(row) for row in data.index.standings(as_of=as_of, since=since)],
+        }
+
+    def schedule(self, data: SeasonData, team: str, params: Dict[str, str]):
+        since, until = self._date(params, 'from'), self._date(params, 'to')
+        games = []
+        for record in sorted(data.store.games_for(team), key=lambda record: (record.date, record.time)):
+            if (since and record.date < since) or (until and record.date > until):
+                continue
+            is_home = record.home_team == team
+            scores = counted_score(record)
+            result = None
+            if scores is not None:
+                scored, allowed = (scores[1], scores[0]) if is_home else scores
+                result = 'W' if scored > allowed else 'L' if scored < allowed else 'D'
+            games.append({
+                'date': record.date, 'time': record.time, 'state': record.state, 'stadium': record.stadium,
+                'opponent': record.away_team if is_home else record.home_team, 'isHome': is_home,
+                'score': record.score, 'result': result, 'category': record.sort,
+            })
+        return {'year': data.year, 'team': team, 'games': games}
+
+    def head_to_head(self, data: SeasonData, params: Dict[str, str]):
+        team = self._team(self._required(params, 'team'))
+        opponent = self._team(self._required(params, 'opponent'))
+        if team == opponent:
+            raise QueryError(400, 'team과 opponent가 같습니다')
+        as_of, since = self._date(params, 'date'), self._date(params, 'from')
+        return {'year': data.year, 'from': since, 'asOf': data.index.last_game_date(as_of),
+                **data.index.head_to_head_record(team, opponent, as_of=as_of, since=since)}
+
+    def magic(self, data: SeasonData, params: Dict[str, str]):
+        team = self._team(self._required(params, 'team'))
+        rank = self._int_param(params.get('rank'), 5, 'rank')
+        if rank not in RANKS:
+            raise QueryError(400, f'rank는 {RANKS[0]}~{RANKS[-1]}')
+        as_of = self._date(params, 'date')
+        rows = data.index.standings(as_of=as_of)
+        standings = Standings.from_records(rows)
+        values = magic_tragic(standings, ranks=[rank])
+        i = standings.index(team)
+        current = next(row for row in rows if row['team'] == team)
+        # 제한 값은 0..잔여 경기라 확정/탈락/자력 불가가 모두 0 또는 잔여 경기로 보임 - raw 값과 상태도 함께 반환
+        magic_raw, tragic_raw = int(values['x_strict_raw'][i, 0]), int(values['y_strict_raw'][i, 0])
+        status = 'clinched' if magic_raw == 0 else 'eliminated' if tragic_raw == 0 else 'alive'
+        return {
+            'year': data.year, 'asOf': data.index.last_game_date(as_of), 'team': team, 'rank': rank,
+            'currentRank': current['rank'], 'wins': current['wins'], 'losses': current['losses'],
+            'draws': current['draws'], 'remainingGames': max(0, int(standings.remaining[i])), 'status': status,
+            'magic': int(values['x_strict'][i, 0]), 'magicTieOK': int(values['x_tieOK'][i, 0]),
+            'tragic': int(values['y_strict'][i, 0]), 'tragicTieOK': int(values['y_tieOK'][i, 0]),
+            'magicRaw': magic_raw, 'magicTieOKRaw': int(values['x_tieOK_raw'][i, 0]),
+            'tragicRaw': tragic_raw, 'tragicTieOKRaw': int(values['y_tieOK_raw'][i, 0]),
+        }
+
+    def health(self):
+        with self.lock:
+            seasons = list(self.seasons.items())
+        return {
+            'startedAt': self.started_at,
+            'requests': self.requests,
+            'notModified': self.not_modified,
+            'reloads': self.reloads,
+            'cache': self.cache.stats(),
+            'seasons': {str(year): {'generation': data.generation, 'loadedAt': data.loaded_at,
+                                    'lastGameDate': data.index.last_game_date() if data.index else None}
+                        for year, data in seasons},
+        }
+
+    # ---- 파라미터/응답 ----
+
+    @staticmethod
+    def _required(params: Dict[str, str], name: str) -> str:
+        value = params.get(name)
+        if not value:
+            raise QueryError(400, f'{name} 파라미터 필요')
+        return value
+
+    @staticmethod
+    def _team(team: str) -> str:
+        if team not in TEAMS:
+            raise QueryError(404, f'알 수 없는 팀: {team}')
+        return team
+
+    @staticmethod
+    def _date(params: Dict[str, str], name: str) -> Optional[str]:
+        value = params.get(name)
+        if value:
+            # 형식만 맞는 2025-02-30, 2025-13-01 같은 날짜도 거부
+            try:
+                if not DATE_PARAM.match(value):
+                    raise ValueError(value)
+                date.fromisoformat(value)
+            except ValueError:
+                raise QueryError(400, f'{name}은 YYYY-MM-DD 형식의 올바른 날짜')
+        return value or None
+
+    @staticmethod
+    def _int_param(value: Optional[str], default: int, name: str) -> int:
+        if value is None or value == '':
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise QueryError(400, f'{name}은 정수')
+
+    @staticmethod
+    def _round(row: Dict) -> Dict:
+        return {**row, 'winRate': round(row['winRate'], 3)}
+
+    @staticmethod
+    def _encode(payload) -> bytes:
+        return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def _body_response(self, body: bytes, etag: str, headers: Dict[str, str], method: str):
+        response_headers = {'Content-Type': 'application/json; charset=utf-8', 'ETag': etag,
+                            'Cache-Control': 'no-cache'}
+        if etag_matches(headers.get('if-none-match'), etag):
+            with self.lock:
+                self.not_modified += 1
+            return 304, response_headers, b''
+        response_headers['Content-Length'] = str(len(body))
+        return 200, response_headers, b'' if method == 'HEAD' else body
+
+    def _json_response(self, status: int, payload):
+        body = self._encode(payload)
+        return status, {'Content-Type': 'application/json; charset=utf-8', 'Cache-Control': 'no-store',
+                        'Content-Length': str(len(body))}, body
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 비교 (약한 비교, 여러 값/와일드카드 허용)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(','))
+    return any((candidate[2:] if candidate.startswith('W/') else candidate) == etag for candidate in candidates)
+
+
+async def handle_connection(service: QueryService, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """HTTP/1.1 keep-alive 연결 하나 - 요청 줄/헤더만 읽음 (읽기 전용이라 본문은 무시)"""
+    try:
+        while True:
+            try:
+                request_line = await asyncio.wait_for(reader.readline(), KEEPALIVE_TIMEOUT)
+            except asyncio.TimeoutError:
+                break
+            if not request_line.strip():
+                break
+            try:
+                method, target, version = request_line.decode('latin-1').split()
+            except ValueError:
+                writer.write(b'HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+                break
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+            if headers.get('content-length', '0') not in ('', '0'):
+                await reader.readexactly(int(headers['content-length']))
+
+            connection = headers.get('connection', '').lower()
+            keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+            # 시즌 재로드(파일 파싱 + 인덱스 재구성)가 다른 연결을 멈추지 않도록 스레드에서 처리
+            status, response_headers, body = await asyncio.to_thread(service.respond, method, target, headers)
+            response_headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+            head = f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n" + ''.join(
+                f"{name}: {value}\r\n" for name, value in response_headers.items()) + "\r\n"
+            writer.write(head.encode('utf-8') + body)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(service: QueryService, host: str, port: int, ready=None):
+    server = await asyncio.start_server(lambda r, w: handle_connection(service, r, w), host, port)
+    address = server.sockets[0].getsockname()
+    print(f"🌐 KBO 조회 서비스: http://{address[0]}:{address[1]} (데이터: {service.data_dir})")
+    if ready is not None:
+        ready(address)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='KBO 시즌 데이터 읽기 전용 조회 서비스')
+    parser.add_argument('--host', default=os.getenv('KBO_QUERY_HOST', '127.0.0.1'), help='바인드 주소')
+    parser.add_argument('--port', type=int, default=int(os.getenv('KBO_QUERY_PORT', '8765')), help='포트 (0이면 임의 포트)')
+    parser.add_argument('--year', type=int, default=None, help='기본 시즌 (기본: KBO_SEASON 또는 데이터가 있는 가장 최근 시즌)')
+    parser.add_argument('--cache-size', type=int, default=int(os.getenv('KBO_QUERY_CACHE_SIZE', '512')),
+                        help='캐시할 응답 수')
+    parser.add_argument('--ttl', type=float, default=float(os.getenv('KBO_QUERY_CACHE_TTL', '60')),
+                        help='응답 캐시 유효 시간 (초)')
+    parser.add_argument('--data-dir', default=None, help='데이터 디렉토리 (기본: PathManager data_dir)')
+    args = parser.parse_args(argv)
+
+    if args.data_dir:
+        data_dir = Path(args.data_dir)
+    else:
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'config'))
+        from paths import get_path_manager
+        data_dir = Path(get_path_manager().data_dir)
+    year = args.year or latest_season(data_dir)
+
+    service = QueryService(data_dir, year, ResponseCache(args.cache_size, args.ttl))
+    try:
+        service.season(year)
+    except QueryError as e:
+        print(f"⚠️ {e} - 요청 시 다시 확인")
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 조회 서비스 종료")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+KBO 시즌 데이터 컬럼형 스냅샷 (.snap)
+시즌 텍스트 파일과 같은 내용을 고정 폭 컬럼 배열로 저장하여
+파싱 없이 mmap으로 바로 읽을 수 있게 함 (JS 쪽 리더: magic-number/config/season-snapshot.js)
+
+파일 구조 (리틀 엔디언)
+- 0  : 매직 b'KBOSNAP1'
+- 8  : uint32 헤더 길이
+- 12 : JSON 헤더 (버전, 행 수, 원본 sha256, 문자열 사전, 컬럼 위치)
+- 컬럼 데이터 - 각 컬럼은 8바이트 정렬된 offset에서 시작
+"""
+
+import hashlib
+import json
+import mmap
+import re
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from kbo_season_store import SeasonStore, atomic_write_bytes
+
+SNAPSHOT_MAGIC = b'KBOSNAP1'
+SNAPSHOT_VERSION = 1
+SCORE_PATTERN = re.compile(r'^(\d+):(\d+)$')
+
+# (컬럼명, struct/array 타입 코드) - 문자열 컬럼은 공용 사전의 uint16 인덱스
+COLUMNS = [
+    ('date', 'I'),          # YYYYMMDD
+    ('time', 'H'),
+    ('state', 'H'),
+    ('stadium', 'H'),
+    ('home_team', 'H'),
+    ('away_team', 'H'),
+    ('score', 'H'),         # 원문 점수 칸 ('3:4', '취소', '경기전')
+    ('away_score', 'h'),    # 숫자 점수가 없으면 -1
+    ('home_score', 'h'),
+    ('tv', 'H'),
+    ('sort', 'H'),
+]
+STRING_COLUMNS = ('time', 'state', 'stadium', 'home_team', 'away_team', 'score', 'tv', 'sort')
+DTYPE_NAMES = {'I': 'uint32', 'H': 'uint16', 'h': 'int16'}
+
+
+def snapshot_path_for(season_file: Path) -> Path:
+    """2025-season-data-clean.txt → 2025-season-data-clean.snap"""
+    return Path(season_file).with_suffix('.snap')
+
+
+def file_sha256(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def build_snapshot(store: SeasonStore, source_sha256: str) -> bytes:
+    """저장소 → 스냅샷 바이트 (행 순서는 시즌 파일과 동일: 날짜순, 같은 날짜는 시간순)"""
+    records = [record for date in store.sorted_dates()
+               for record in sorted(store.games_on(date), key=lambda record: record.time)]
+
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    values = {name: [] for name, _ in COLUMNS}
+    for record in records:
+        values['date'].append(int(record.date.replace('-', '')))
+        for name in STRING_COLUMNS:
+            values[name].append(intern(getattr(record, name)))
+        match = SCORE_PATTERN.match(record.score)
+        values['away_score'].append(int(match.group(1)) if match else -1)
+        values['home_score'].append(int(match.group(2)) if match else -1)
+
+    if len(strings) > 0xFFFF:
+        raise ValueError(f"문자열 사전이 너무 큽니다: {len(strings)}개")
+
+    column_bytes = [(name, code, struct.pack(f'<{len(records)}{code}', *values[name]))
+                    for name, code in COLUMNS]
+
+    # 헤더 길이가 컬럼 offset에 영향을 주므로, offset 자릿수가 안정될 때까지 반복 계산
+    header_len = 0
+    while True:
+        offset = _align(12 + header_len)
+        columns_meta = []
+        for name, code, data in column_bytes:
+            columns_meta.append({'name': name, 'dtype': DTYPE_NAMES[code], 'offset': offset})
+            offset = _align(offset + len(data))
+        header = json.dumps({
+            'version': SNAPSHOT_VERSION,
+            'year': store.year,
+            'rows': len(records),
+            'source_sha256': source_sha256,
+            'strings': strings,
+            'columns': columns_meta,
+        }, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        if len(header) == header_len:
+            break
+        header_len = len(header)
+
+    out = bytearray(SNAPSHOT_MAGIC + struct.pack('<I', header_len) + header)
+    for meta, (_, _, data) in zip(columns_meta, column_bytes):
+        out.extend(b'\0' * (meta['offset'] - len(out)))
+        out.extend(data)
+    return bytes(out)
+
+
+def write_snapshot(store: SeasonStore, path: Optional[Path] = None) -> Path:
+    """시즌 파일 옆에 스냅샷을 원자적으로 기록 - 원본 해시는 디스크의 시즌 파일 기준"""
+    path = Path(path) if path else snapshot_path_for(store.path)
+    atomic_write_bytes(path, build_snapshot(store, file_sha256(store.path)))
+    return path
+
+
+class SeasonSnapshot:
+    """mmap으로 연 스냅샷 - column()은 복사 없이 memoryview를 돌려줌"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = buffer = memoryview(self._mmap)
+        if bytes(buffer[:8]) != SNAPSHOT_MAGIC:
+            self.close()
+            raise ValueError(f"스냅샷 형식이 아닙니다: {self.path}")
+        header_len, = struct.unpack_from('<I', buffer, 8)
+        self.meta = json.loads(bytes(buffer[12:12 + header_len]).decode('utf-8'))
+        if self.meta.get('version') != SNAPSHOT_VERSION:
+            self.close()
+            raise ValueError(f"지원하지 않는 스냅샷 버전: {self.meta.get('version')}")
+        self.rows = self.meta['rows']
+        self.strings = self.meta['strings']
+        self._offsets = {column['name']: column['offset'] for column in self.meta['columns']}
+
+    def column(self, name: str):
+        """컬럼 배열 (numpy가 있으면 numpy.frombuffer로 그대로 감쌀 수 있음)"""
+        code = dict(COLUMNS)[name]
+        start = self._offsets[name]
+        view = self._buffer[start:start + self.rows * struct.calcsize(code)]
+        if sys.byteorder == 'little':
+            return view.cast(code)
+        # 빅 엔디언 환경에서만 복사
+        return struct.unpack(f'<{self.rows}{code}', view)
+
+    def string_column(self, name: str) -> List[str]:
+        strings = self.strings
+        return [strings[idx] for idx in self.column(name)]
+
+    def is_fresh(self, season_file: Path) -> bool:
+        """원본 시즌 파일 내용이 스냅샷을 만들 때와 같은지"""
+        return self.meta.get('source_sha256') == file_sha256(season_file)
+
+    def iter_records(self) -> Iterator[Tuple[str, str, str, str, str, str, str, str, str]]:
+        """(date, time, state, stadium, home_team, away_team, score, tv, sort) 행 순회"""
+        dates = self.column('date')
+        string_columns = [self.string_column(name) for name in STRING_COLUMNS]
+        for idx in range(self.rows):
+            date = str(dates[idx])
+            yield (f"{date[:4]}-{date[4:6]}-{date[6:]}",) + tuple(column[idx] for column in string_columns)
+
+    def close(self):
+        """mmap 해제 - column()으로 받은 뷰가 아직 살아 있으면 GC 때 해제됨"""
+        try:
+            if getattr(self, '_buffer', None) is not None:
+                self._buffer.release()
+            self._mmap.close()
+        except BufferError:
+            pass
+        self._buffer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_snapshot(season_file: Path) -> Optional[SeasonSnapshot]:
+    """시즌 파일의 스냅샷 열기 - 없거나 손상됐거나 원본과 다르면(stale) None"""
+    path = snapshot_path_for(season_file)
+    if not path.exists():
+        return None
+    try:
+        snapshot = SeasonSnapshot(path)
+    except (ValueError, OSError, KeyError):
+        return None
+    if not snapshot.is_fresh(season_file):
+        snapshot.close()
+        return None
+    return snapshot
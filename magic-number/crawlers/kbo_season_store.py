@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+"""
+KBO 시즌 데이터 저장소
+YYYY-season-data-clean.txt를 한 번만 파싱하여 날짜/경기키/팀별 인덱스로 보관
+크롤러의 중복 체크와 저장 경로가 같은 인스턴스를 공유
+"""
+
+import json
+import os
+import re
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from sys import intern
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from kbo_metrics import current_season
+
+DATE_LINE = re.compile(r'^(\d{4}-\d{2}-\d{2})')
+WEEKDAYS = ['월', '화', '수', '목', '금', '토', '일']
+
+CANCELLED_STATES = ("취소", "우천취소", "연기", "경기취소")
+FINISHED_STATES = ("종료", "완료", "끝")
+
+GameKey = Tuple[str, str, str, str]  # (date, time, home_team, away_team)
+
+
+def atomic_write_bytes(path: Path, data: bytes):
+    """임시 파일에 쓰고 fsync 후 rename - 쓰는 도중 중단돼도 기존 파일은 온전함"""
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    _fsync_dir(path.parent)
+
+
+def atomic_write_text(path: Path, text: str):
+    atomic_write_bytes(path, text.encode('utf-8'))
+
+
+def _fsync_dir(dir_path: Path):
+    """rename 결과를 디렉토리 엔트리까지 디스크에 반영 (지원하지 않는 OS는 무시)"""
+    try:
+        fd = os.open(str(dir_path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class SeasonJournal:
+    """시즌 파일 쓰기 전 변경 내용을 먼저 기록하는 write-ahead 저널 (JSON 라인)
+
+    - write: 저장할 변경 (제거 키, 추가 줄, 쓰기 방식) / commit: 파일 반영 완료
+    - begin/end: 크롤링 실행 단위 - end 없이 끝난 실행은 완료된 월부터 이어서 진행 가능
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def append(self, entry: Dict):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def entries(self) -> List[Dict]:
+        """저널 항목 목록 - 쓰다 만 마지막 줄은 무시"""
+        if not self.path.exists():
+            return []
+        entries = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+        return entries
+
+    def pending_writes(self) -> List[Dict]:
+        """commit되지 않은 write 항목 (파일 반영 여부가 불확실한 변경)"""
+        entries = self.entries()
+        committed = {entry['seq'] for entry in entries if entry.get('type') == 'commit'}
+        return [entry for entry in entries if entry.get('type') == 'write' and entry['seq'] not in committed]
+
+    def next_seq(self) -> int:
+        return max((entry.get('seq', 0) for entry in self.entries()), default=0) + 1
+
+    def unfinished_run(self) -> Optional[Dict]:
+        """end 없이 끝난 실행 - 마지막 run_id와, 그런 실행들에서 저장까지 끝난 월 목록"""
+        entries = self.entries()
+        open_runs = OrderedDict()
+        for entry in entries:
+            if entry.get('type') == 'begin':
+                open_runs[entry['run_id']] = entry.get('months', [])
+            elif entry.get('type') == 'end':
+                open_runs.pop(entry.get('run_id'), None)
+        if not open_runs:
+            return None
+
+        committed = {entry['seq'] for entry in entries if entry.get('type') == 'commit'}
+        completed_months = []
+        for entry in entries:
+            if (entry.get('type') == 'write' and entry['seq'] in committed
+                    and entry.get('run_id') in open_runs and entry.get('month') is not None
+                    and entry['month'] not in completed_months):
+                completed_months.append(entry['month'])
+        run_id = next(reversed(open_runs))
+        return {'run_id': run_id, 'months': open_runs[run_id], 'completed_months': completed_months}
+
+    def clear(self):
+        if self.path.exists():
+            self.path.unlink()
+
+
+class GameRecord:
+    """경기 한 줄 - 파일에서 읽은 줄은 원문(line)을 그대로 보존하여 다시 쓸 때 바이트가 바뀌지 않음"""
+
+    __slots__ = ('date', 'time', 'state', 'stadium', 'home_team', 'away_team',
+                 'score', 'tv', 'sort', 'line')
+
+    def __init__(self, date, time, state, stadium, home_team, away_team, score, tv, sort, line=None):
+        self.date = date
+        self.time = time
+        self.state = state
+        self.stadium = stadium
+        self.home_team = home_team
+        self.away_team = away_team
+        self.score = score
+        self.tv = tv
+        self.sort = sort
+        self.line = line if line is not None else self.format_line()
+
+    @classmethod
+    def from_line(cls, date: str, line: str) -> 'GameRecord':
+        """시즌 파일의 경기 줄 파싱 (중계 칸은 공백을 포함하거나 비어 있을 수 있음)
+
+        키/상태 문자열은 인터닝 - 경기 키 비교와 상태 분류가 대부분 동일 객체 비교로 끝남
+        """
+        parts = line.split()
+        parts += [''] * (6 - len(parts))
+        if len(parts) >= 7:
+            tv, sort = ' '.join(parts[6:-1]), parts[-1]
+        else:
+            tv, sort = '', ''
+        return cls(date, intern(parts[0]), intern(parts[1]), parts[2], intern(parts[3]), intern(parts[4]),
+                   parts[5], tv, sort, line=line)
+
+    @classmethod
+    def from_game(cls, game: Dict) -> 'GameRecord':
+        """크롤러가 만든 경기 dict → 레코드 (점수 칸/정렬 정보 정규화 포함)"""
+        if game['state'] in CANCELLED_STATES:
+            score = "취소"
+        elif game['state'] in FINISHED_STATES:
+            score = f"{game['away_score']}:{game['home_score']}"
+        else:
+            # 경기전 상태인 경우
+            score = "경기전"
+
+        # sort 필드에 페넌트레이스가 없으면 추가
+        sort_info = game['sort']
+        if not sort_info or ("페넌트레이스" not in sort_info and "올스타" not in sort_info):
+            sort_info = "페넌트레이스"
+
+        return cls(game['date'], game['time'], game['state'], game['stadium'],
+                   game['home_team'], game['away_team'], score, game['tv'], sort_info)
+
+    def format_line(self) -> str:
+        """열 정렬된 시즌 파일 형식"""
+        return (f"{self.time:<8} {self.state:<6} {self.stadium:<6} {self.home_team:<4} "
+                f"{self.away_team:<4} {self.score:<8} {self.tv:<8} {self.sort}")
+
+    @property
+    def key(self) -> GameKey:
+        return (self.date, self.time, self.home_team, self.away_team)
+
+    def __repr__(self):
+        return f"GameRecord({self.date} {self.line.strip()})"
+
+
+class SeasonStore:
+    """한 시즌의 경기 레코드 - 날짜별 목록과 경기키/팀 인덱스"""
+
+    def __init__(self, year: int, path: Optional[Path] = None):
+        self.year = year
+        self.path = Path(path) if path else None
+        self.by_date: Dict[str, List[GameRecord]] = OrderedDict()
+        self.by_key: Dict[GameKey, GameRecord] = {}
+        self.by_team: Dict[str, List[GameRecord]] = {}
+
+        # 마지막 저장 이후 변경 내용 (증분 저장/저널용)
+        self.dirty_dates: Set[str] = set()
+        self.removed_keys: List[GameKey] = []
+        self.added_records: List[GameRecord] = []
+        self._block_cache: Dict[str, str] = {}
+        self._disk_size = 0
+        # 파일에 기록된 가장 늦은 날짜 - 이보다 늦은 날짜만 append 가능
+        self._disk_last_date: Optional[str] = None
+        # read()로 읽을 때 commit되지 않은 쓰기가 있었는지 (크롤러가 쓰는 중)
+        self.pending = False
+        self.journal = SeasonJournal(self.path.with_name(self.path.name + '.journal')) if self.path else None
+
+    @classmethod
+    def load(cls, path: Path, year: Optional[int] = None) -> 'SeasonStore':
+        """시즌 파일을 한 번 읽어 저장소 생성 (파일이 없으면 빈 저장소)
+
+        이전 실행이 남긴 임시 파일/미완료 저장을 정리하고 재적용하므로 파일을 쓰는 프로세스(크롤러)만 사용.
+        다른 프로세스는 read()를 사용
+        """
+        path = Path(path)
+        store = cls(year if year is not None else _year_from_path(path), path)
+
+        # 이전 실행이 append 도중 중단됐다면 저널에 기록된 크기로 되돌린 뒤 읽음
+        pending = store.journal.pending_writes()
+        stale_tmp = path.with_name(f".{path.name}.tmp")
+        if stale_tmp.exists():
+            stale_tmp.unlink()
+        for entry in pending:
+            if entry.get('mode') == 'append' and path.exists() and path.stat().st_size > entry['base_size']:
+                with open(path, 'r+b') as f:
+                    f.truncate(entry['base_size'])
+                break
+
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                store.extend_from_lines(f)
+            store._disk_size = path.stat().st_size
+            store._disk_last_date = max(store.by_date, default=None)
+        store.mark_clean()
+
+        # commit되지 않은 변경 재적용 후 저장 (재적용은 여러 번 해도 결과가 같음)
+        if pending:
+            for entry in pending:
+                for key in entry['removed']:
+                    store.remove(tuple(key))
+                for date, line in entry['added']:
+                    store.add(GameRecord.from_line(date, line))
+            print(f"♻️ 저널 복구: 미완료 저장 {len(pending)}건 재적용")
+            store.save(run_id=pending[-1].get('run_id'), month=pending[-1].get('month'))
+            for entry in pending:
+                store.journal.append({'type': 'commit', 'seq': entry['seq']})
+        return store
+
+    @classmethod
+    def read(cls, path: Path, year: Optional[int] = None) -> 'SeasonStore':
+        """읽기 전용 로드 - 임시 파일 정리, 저널 복구/재저장을 하지 않음 (조회 서비스 등)
+
+        commit되지 않은 쓰기가 있으면 pending=True로 표시하고, append 중이면 저널의
+        base_size까지만 읽어 마지막으로 완료된 저장 상태를 돌려줌
+        (rewrite는 rename이 원자적이라 파일이 항상 한 세대 전체)
+        """
+        path = Path(path)
+        store = cls(year if year is not None else _year_from_path(path), path)
+        pending = store.journal.pending_writes()
+        store.pending = bool(pending)
+        if not path.exists():
+            return store
+
+        with open(path, 'rb') as f:
+            data = f.read()
+        append_sizes = [entry['base_size'] for entry in pending if entry.get('mode') == 'append']
+        if append_sizes:
+            data = data[:min(append_sizes)]
+        store.extend_from_lines(data.decode('utf-8').splitlines())
+        store._disk_size = len(data)
+        store._disk_last_date = max(store.by_date, default=None)
+        store.mark_clean()
+        return store
+
+    def extend_from_lines(self, lines: Iterable[str]):
+        """시즌 텍스트 줄들을 레코드로 추가"""
+        current_date = None
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            match = DATE_LINE.match(line)
+            if match:
+                current_date = intern(match.group(1))
+                self.by_date.setdefault(current_date, [])
+            elif current_date:
+                self.add(GameRecord.from_line(current_date, line))
+
+    def __len__(self):
+        return sum(len(records) for records in self.by_date.values())
+
+    def __iter__(self):
+        for records in self.by_date.values():
+            yield from records
+
+    def get(self, key: GameKey) -> Optional[GameRecord]:
+        """(날짜, 시간, 홈팀, 원정팀) 키로 경기 조회 - 같은 키가 여러 줄이면 마지막 줄"""
+        return self.by_key.get(key)
+
+    def games_on(self, date: str) -> List[GameRecord]:
+        return self.by_date.get(date, [])
+
+    def games_for(self, team: str) -> List[GameRecord]:
+        return self.by_team.get(team, [])
+
+    def is_stored(self, record: GameRecord) -> bool:
+        """레코드의 키에 해당하는 줄이 이 레코드와 바이트까지 같은 한 줄뿐인지
+
+        True면 갱신해도 바뀌는 것이 없음 - 매 실행 다시 들어오는 오늘의 '경기전' 경기 등
+        """
+        current = [existing for existing in self.by_date.get(record.date, []) if existing.key == record.key]
+        return len(current) == 1 and current[0].line == record.line
+
+    def add(self, record: GameRecord) -> bool:
+        """레코드 추가 - 같은 날짜에 완전히 같은 줄이 있으면 무시 (False 반환)"""
+        records = self.by_date.setdefault(record.date, [])
+        if any(existing.line == record.line for existing in records):
+            return False
+        records.append(record)
+        self.by_key[record.key] = record
+        for team in (record.home_team, record.away_team):
+            self.by_team.setdefault(team, []).append(record)
+        self.dirty_dates.add(record.date)
+        self.added_records.append(record)
+        return True
+
+    def remove(self, key: GameKey) -> List[GameRecord]:
+        """키에 해당하는 모든 줄 제거 - 제거된 레코드 반환"""
+        records = self.by_date.get(key[0], [])
+        removed = [record for record in records if record.key == key]
+        if not removed:
+            return []
+        self.by_date[key[0]] = [record for record in records if record.key != key]
+        self.by_key.pop(key, None)
+        for team in (key[2], key[3]):
+            if team in self.by_team:
+                self.by_team[team] = [record for record in self.by_team[team] if record.key != key]
+        self.dirty_dates.add(key[0])
+        self.removed_keys.append(key)
+        self.added_records = [record for record in self.added_records if record.key != key]
+        return removed
+
+    def mark_clean(self):
+        """현재 메모리 상태가 디스크와 같다고 표시"""
+        self.dirty_dates.clear()
+        self.removed_keys = []
+        self.added_records = []
+
+    def sorted_dates(self) -> List[str]:
+        return sorted(self.by_date)
+
+    def format_date_block(self, date: str) -> str:
+        """날짜 헤더 + 시간순 경기 줄 (같은 시간은 기존 순서 유지) - 변경 없는 날짜는 캐시 재사용"""
+        if date in self._block_cache and date not in self.dirty_dates:
+            return self._block_cache[date]
+        weekday = WEEKDAYS[datetime.strptime(date, '%Y-%m-%d').weekday()]
+        records = sorted(self.by_date.get(date, []), key=lambda record: record.time)
+        block = f"{date} ({weekday})\n" + ''.join(f"{record.line}\n" for record in records)
+        self._block_cache[date] = block
+        return block
+
+    def render(self) -> str:
+        """시즌 파일 전체 텍스트"""
+        return "\n\n".join(self.format_date_block(date) for date in self.sorted_dates())
+
+    def write(self, path: Optional[Path] = None) -> Path:
+        """시즌 파일 전체를 원자적으로 다시 쓰기"""
+        path = Path(path) if path else self.path
+        atomic_write_text(path, self.render())
+        if path == self.path:
+            self._disk_size = path.stat().st_size
+            self._disk_last_date = max(self.by_date, default=None)
+            self.mark_clean()
+        return path
+
+    def _appendable_dates(self) -> Optional[List[str]]:
+        """변경이 파일 끝에 새 날짜를 붙이는 것뿐이면 그 날짜 목록, 아니면 None
+
+        변경된 날짜가 모두 파일의 마지막 날짜보다 늦어야 함 - 이미 파일에 있는 날짜(예: 마지막 날의
+        두 번째 경기)를 append하면 같은 날짜 헤더가 두 번 생겨 처리 스크립트가 경기를 중복 집계
+        """
+        if self.removed_keys or not self.path.exists() or self.path.stat().st_size != self._disk_size:
+            return None
+        dirty = sorted(self.dirty_dates)
+        if self._disk_last_date is not None and dirty[0] <= self._disk_last_date:
+            return None
+        return dirty
+
+    def save(self, run_id: Optional[str] = None, month: Optional[int] = None) -> Optional[str]:
+        """마지막 저장 이후 변경분만 저장 - 'append' / 'rewrite' / 변경 없으면 None
+
+        쓰기 전에 변경 내용을 저널에 먼저 기록하고, 반영이 끝나면 commit을 남긴다.
+        새 날짜가 파일 끝에 붙는 경우는 그 블록만 append 하고, 그 외에는
+        변경된 날짜 블록만 다시 만들고 나머지는 캐시된 블록을 이어 붙여 원자적으로 교체한다.
+        """
+        if not self.dirty_dates:
+            return None
+
+        append_dates = self._appendable_dates()
+        mode = 'append' if append_dates else 'rewrite'
+        seq = self.journal.next_seq()
+        self.journal.append({
+            'type': 'write', 'seq': seq, 'run_id': run_id, 'month': month, 'mode': mode,
+            'base_size': self._disk_size,
+            'removed': [list(key) for key in self.removed_keys],
+            'added': [[record.date, record.line] for record in self.added_records],
+        })
+
+        if mode == 'append':
+            text = "\n\n".join(self.format_date_block(date) for date in append_dates)
+            if self._disk_size:
+                text = "\n\n" + text
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            self._disk_size = self.path.stat().st_size
+            self._disk_last_date = append_dates[-1]
+            self.mark_clean()
+        else:
+            self.write()
+
+        self.journal.append({'type': 'commit', 'seq': seq})
+
+        # 진행 중인 실행이 없으면 저널은 더 필요 없음
+        if not self.journal.unfinished_run():
+            self.journal.clear()
+        return mode
+
+
+def _year_from_path(path: Path) -> int:
+    match = re.match(r'^(\d{4})', path.name)
+    return int(match.group(1)) if match else datetime.now().year
+
+
+def season_file_name(year: int) -> str:
+    return f'{year}-season-data-clean.txt'
+
+
+def latest_season(data_dir: Path) -> int:
+    """조회 도구의 기본 시즌 - KBO_SEASON, 없으면 현재 시즌(KST) 이하에서 시즌 파일이 있는 가장 최근 연도
+
+    (새해 첫 크롤링 전, 시즌 시작 전에도 지난 시즌을 조회) 시즌 파일이 하나도 없으면 현재 시즌
+    """
+    season = current_season()
+    if os.getenv('KBO_SEASON'):
+        return season
+    years = [_year_from_path(path) for path in Path(data_dir).glob(season_file_name('[0-9]' * 4))]
+    return max((year for year in years if year <= season), default=season)
+
+
+class SeasonCache:
+    """연도별 SeasonStore - 처음 접근할 때만 로드하고, 한도를 넘으면 가장 오래 쓰지 않은 시즌부터 해제
+
+    한도: 시즌 수(KBO_SEASON_CACHE_SIZE) / 전체 경기 수(KBO_SEASON_CACHE_GAMES, 메모리 기준)
+    저장하지 않은 변경이 있는 시즌과 방금 요청한 시즌은 해제하지 않음
+    """
+
+    def __init__(self, data_dir: Path, max_seasons: Optional[int] = None, max_games: Optional[int] = None):
+        self.data_dir = Path(data_dir)
+        self.max_seasons = max_seasons or int(os.getenv('KBO_SEASON_CACHE_SIZE', '12'))
+        self.max_games = max_games or int(os.getenv('KBO_SEASON_CACHE_GAMES', '20000'))
+        self._stores: 'OrderedDict[int, SeasonStore]' = OrderedDict()
+
+    def path_for(self, year: int) -> Path:
+        return self.data_dir / season_file_name(year)
+
+    def __contains__(self, year: int) -> bool:
+        return year in self._stores
+
+    def __len__(self):
+        return len(self._stores)
+
+    def years(self) -> List[int]:
+        """메모리에 있는 시즌 (오래 쓰지 않은 순)"""
+        return list(self._stores)
+
+    def available_years(self) -> List[int]:
+        """데이터 디렉토리에 시즌 파일이 있는 연도"""
+        years = []
+        for path in self.data_dir.glob('*-season-data-clean.txt'):
+            match = re.match(r'^(\d{4})-season-data-clean\.txt$', path.name)
+            if match:
+                years.append(int(match.group(1)))
+        return sorted(years)
+
+    def get(self, year: int) -> SeasonStore:
+        """시즌 저장소 (없으면 파일에서 로드 - 파일이 없으면 빈 저장소)"""
+        store = self._stores.get(year)
+        if store is not None:
+            self._stores.move_to_end(year)
+            return store
+        store = SeasonStore.load(self.path_for(year), year=year)
+        self._stores[year] = store
+        self._evict(keep=year)
+        return store
+
+    def drop(self, year: int) -> Optional[SeasonStore]:
+        """메모리에서 제거 - 다음 get에서 파일(+저널)을 다시 읽음"""
+        return self._stores.pop(year, None)
+
+    def clear(self):
+        self._stores.clear()
+
+    def _evict(self, keep: int):
+        total = sum(len(store) for store in self._stores.values())
+        for year in list(self._stores):
+            if len(self._stores) <= self.max_seasons and total <= self.max_games:
+                break
+            store = self._stores[year]
+            if year == keep or store.dirty_dates:
+                continue
+            del self._stores[year]
+            total -= len(store)
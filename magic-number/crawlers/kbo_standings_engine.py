@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+KBO 순위/상대전적 증분 집계
+- 팀별 승/패/무, 홈/원정 승패, 득실점, 경기 결과 순서(연속 기록/최근 10경기), 10×10 상대전적을
+  data/{year}-standings-state.json에 보관
+- 크롤러 저장 단계의 변경분(갱신 전 기존 레코드, 추가/갱신 레코드)만 반영 - 경기 하나 바뀌면 그 경기만 다시 계산
+- 집계 기준은 02_season-data-processor.js와 동일 (페넌트레이스 '종료' 경기, 취소/올스타 제외)
+- 상태 파일은 반영한 시즌 파일의 sha256을 기록 - 다르면 저장소에서 전체 재계산
+
+사용법:
+  python3 magic-number/crawlers/kbo_standings_engine.py [--year 2025]     # 순위표 출력 (상태가 오래됐으면 재계산)
+  python3 magic-number/crawlers/kbo_standings_engine.py --verify          # 저장된 증분 상태 == 전체 재계산 확인
+  python3 magic-number/crawlers/kbo_standings_engine.py --check-js        # calc-standings/calc-head-to-head.json과 비교
+"""
+
+import argparse
+import json
+import re
+import sys
+from bisect import bisect_left, insort
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from kbo_metrics import KST
+from kbo_season_snapshot import file_sha256
+from kbo_season_store import GameRecord, SeasonStore, atomic_write_text, latest_season, season_file_name
+
+STATE_VERSION = 1
+TEAMS = ('한화', 'LG', '롯데', 'SSG', 'KT', 'KIA', '삼성', 'NC', '두산', '키움')
+SCORE_PATTERN = re.compile(r'^(\d+):(\d+)$')
+
+TEAM_FIELDS = ('games', 'wins', 'losses', 'draws', 'homeWins', 'homeLosses', 'homeDraws',
+               'awayWins', 'awayLosses', 'awayDraws', 'runsScored', 'runsAllowed')
+H2H_FIELDS = ('wins', 'losses', 'draws', 'homeWins', 'homeLosses', 'homeDraws',
+              'awayWins', 'awayLosses', 'awayDraws')
+WIN, LOSS, DRAW = '승', '패', '무'
+
+
+def standings_state_path(data_dir: Path, year: int) -> Path:
+    return Path(data_dir) / f'{year}-standings-state.json'
+
+
+def counted_score(record: GameRecord) -> Optional[Tuple[int, int]]:
+    """순위에 반영되는 경기면 (원정 점수, 홈 점수), 아니면 None - 02_season-data-processor.js processRecordParts 기준"""
+    if record.score == '취소' or '취소' in record.state or '연기' in record.state:
+        return None
+    if '페넌트레이스' not in record.sort or record.state != '종료':
+        return None
+    if record.home_team not in TEAMS or record.away_team not in TEAMS:
+        return None
+    match = SCORE_PATTERN.match(record.score)
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def game_id(date: str, time: str, home_team: str, away_team: str) -> str:
+    """상태 파일의 경기 키 (JSON 객체 키로 쓰기 위해 문자열)"""
+    return f"{date} {time} {home_team} {away_team}"
+
+
+def win_rate(wins: int, losses: int) -> float:
+    return wins / (wins + losses) if wins + losses else 0.0
+
+
+def rank_standings(rows: List[Dict]) -> List[Dict]:
+    """승률 → 승 → 패 순으로 정렬하고 rank/gamesBehind 기록 (표시 승률이 같으면 공동 순위, 1위 기준 게임차)"""
+    rows.sort(key=lambda row: (-row['winRate'], -row['wins'], row['losses']))
+    rank, previous = 1, None
+    for idx, row in enumerate(rows):
+        displayed = round(row['winRate'], 3)
+        if previous is not None and displayed != previous:
+            rank = idx + 1
+        row['rank'] = rank
+        previous = displayed
+        first = rows[0]
+        row['gamesBehind'] = (first['wins'] - row['wins'] + row['losses'] - first['losses']) / 2
+    return rows
+
+
+class StandingsEngine:
+    """한 시즌의 누적 순위 상태 - add/remove는 경기 하나당 상수 시간 (결과 순서 목록만 이분 탐색)"""
+
+    def __init__(self, year: int):
+        self.year = year
+        self.teams: Dict[str, Dict[str, int]] = {team: dict.fromkeys(TEAM_FIELDS, 0) for team in TEAMS}
+        self.head_to_head: Dict[str, Dict[str, Dict[str, int]]] = {
+            team: {opponent: dict.fromkeys(H2H_FIELDS, 0) for opponent in TEAMS if opponent != team}
+            for team in TEAMS
+        }
+        # 팀별 (날짜, 시간, 결과) - 날짜/시간 순 정렬 유지
+        self.results: Dict[str, List[Tuple[str, str, str]]] = {team: [] for team in TEAMS}
+        # 반영된 경기 → [원정 점수, 홈 점수] (갱신 시 이전 기여분을 빼는 데 사용)
+        self.games: Dict[str, List[int]] = {}
+        self.source_sha256: Optional[str] = None
+        self.updated_at: Optional[str] = None
+        self.dirty = False
+
+    # ---- 경기 단위 반영 ----
+
+    def _apply(self, date: str, time: str, home: str, away: str, away_score: int, home_score: int, sign: int):
+        home_stats, away_stats = self.teams[home], self.teams[away]
+        home_vs, away_vs = self.head_to_head[home][away], self.head_to_head[away][home]
+        home_stats['games'] += sign
+        away_stats['games'] += sign
+        home_stats['runsScored'] += sign * home_score
+        home_stats['runsAllowed'] += sign * away_score
+        away_stats['runsScored'] += sign * away_score
+        away_stats['runsAllowed'] += sign * home_score
+
+        if home_score == away_score:
+            home_result, away_result = DRAW, DRAW
+            for stats, vs in ((home_stats, home_vs), (away_stats, away_vs)):
+                stats['draws'] += sign
+                vs['draws'] += sign
+            home_stats['homeDraws'] += sign
+            away_stats['awayDraws'] += sign
+            home_vs['homeDraws'] += sign
+            away_vs['awayDraws'] += sign
+        elif home_score > away_score:
+            home_result, away_result = WIN, LOSS
+            home_stats['wins'] += sign
+            away_stats['losses'] += sign
+            home_stats['homeWins'] += sign
+            away_stats['awayLosses'] += sign
+            home_vs['wins'] += sign
+            away_vs['losses'] += sign
+            home_vs['homeWins'] += sign
+            away_vs['awayLosses'] += sign
+        else:
+            home_result, away_result = LOSS, WIN
+            away_stats['wins'] += sign
+            home_stats['losses'] += sign
+            away_stats['awayWins'] += sign
+            home_stats['homeLosses'] += sign
+            away_vs['wins'] += sign
+            home_vs['losses'] += sign
+            away_vs['awayWins'] += sign
+            home_vs['homeLosses'] += sign
+
+        for team, result in ((home, home_result), (away, away_result)):
+            results = self.results[team]
+            if sign > 0:
+                insort(results, (date, time, result))
+            else:
+                idx = bisect_left(results, (date, time))
+                if idx < len(results) and results[idx][:2] == (date, time):
+                    del results[idx]
+        self.dirty = True
+
+    def remove(self, record: GameRecord) -> bool:
+        """레코드의 기여분 제거 - 반영된 적 없는 경기면 False"""
+        scores = self.games.pop(game_id(*record.key), None)
+        if scores is None:
+            return False
+        self._apply(record.date, record.time, record.home_team, record.away_team, scores[0], scores[1], -1)
+        return True
+
+    def add(self, record: GameRecord) -> bool:
+        """레코드 반영 (같은 경기가 이미 있으면 이전 점수를 빼고 교체) - 상태가 바뀌었으면 True"""
+        key = game_id(*record.key)
+        scores = counted_score(record)
+        previous = self.games.get(key)
+        if previous is not None and scores is not None and tuple(previous) == scores:
+            return False
+        changed = self.remove(record) if previous is not None else False
+        if scores is None:
+            return changed
+        self.games[key] = list(scores)
+        self._apply(record.date, record.time, record.home_team, record.away_team, scores[0], scores[1], 1)
+        return True
+
+    def apply(self, removed: Iterable[GameRecord], added: Iterable[GameRecord]) -> int:
+        """저장 단계 변경분 반영 - (갱신 전 기존 레코드, 추가/갱신 레코드) → 바뀐 경기 수"""
+        changed = sum(self.remove(record) for record in removed)
+        changed += sum(self.add(record) for record in added)
+        return changed
+
+    @classmethod
+    def rebuild(cls, store: SeasonStore) -> 'StandingsEngine':
+        """저장소 전체에서 다시 계산 (검증/상태 파일이 없거나 오래됐을 때)"""
+        engine = cls(store.year)
+        for record in store:
+            engine.add(record)
+        return engine
+
+    # ---- 조회 ----
+
+    def streak(self, team: str) -> Tuple[str, int]:
+        """현재 연속 기록 (무승부는 건너뜀) - ('승'|'패'|'', 경기 수)"""
+        kind, count = '', 0
+        for _, _, result in reversed(self.results[team]):
+            if result == DRAW:
+                continue
+            if not kind:
+                kind = result
+            elif result != kind:
+                break
+            count += 1
+        return kind, count
+
+    def recent(self, team: str, n: int = 10) -> str:
+        """최근 n경기 요약 (예: '6승1무3패')"""
+        last = [result for _, _, result in self.results[team][-n:]]
+        return f"{last.count(WIN)}승{last.count(DRAW)}무{last.count(LOSS)}패"
+
+    def standings(self) -> List[Dict]:
+        """순위표 - 정렬/공동 순위/게임차는 02_season-data-processor.js calculateStandings와 동일"""
+        rows = []
+        for team in TEAMS:
+            stats = self.teams[team]
+            kind, count = self.streak(team)
+            rows.append({
+                'team': team,
+                **{field: stats[field] for field in TEAM_FIELDS},
+                'winRate': win_rate(stats['wins'], stats['losses']),
+                'homeRecord': f"{stats['homeWins']}-{stats['homeLosses']}-{stats['homeDraws']}",
+                'awayRecord': f"{stats['awayWins']}-{stats['awayLosses']}-{stats['awayDraws']}",
+                'recent10': self.recent(team),
+                'streak': f"{count}{kind}" if count else '-',
+            })
+        return rank_standings(rows)
+
+    def last_date(self) -> Optional[str]:
+        return max((results[-1][0] for results in self.results.values() if results), default=None)
+
+    # ---- 저장/로드 ----
+
+    def to_dict(self) -> Dict:
+        return {
+            'version': STATE_VERSION,
+            'year': self.year,
+            'source_sha256': self.source_sha256,
+            'updated_at': self.updated_at,
+            'gameCount': len(self.games),
+            'lastDate': self.last_date(),
+            'teams': self.teams,
+            'headToHead': self.head_to_head,
+            'results': {team: [list(item) for item in results] for team, results in self.results.items()},
+            'games': self.games,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'StandingsEngine':
+        engine = cls(data['year'])
+        engine.teams = data['teams']
+        engine.head_to_head = data['headToHead']
+        engine.results = {team: [tuple(item) for item in results] for team, results in data['results'].items()}
+        engine.games = data['games']
+        engine.source_sha256 = data.get('source_sha256')
+        engine.updated_at = data.get('updated_at')
+        return engine
+
+    @classmethod
+    def load(cls, path: Path) -> Optional['StandingsEngine']:
+        """상태 파일 로드 - 없거나 손상됐거나 버전이 다르면 None"""
+        try:
+            data = json.loads(Path(path).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != STATE_VERSION or set(data.get('teams', {})) != set(TEAMS):
+            return None
+        return cls.from_dict(data)
+
+    @classmethod
+    def load_for(cls, store: SeasonStore, path: Path) -> 'StandingsEngine':
+        """저장소와 맞는 상태 - 상태 파일의 원본 sha256이 시즌 파일과 다르거나 저장소에 미저장 변경이 있으면 재계산
+
+        쓰는 중인 파일을 read()로 읽은 저장소(pending)는 파일 내용과 다를 수 있어 항상 재계산
+        """
+        engine = cls.load(path)
+        unsaved = bool(store.dirty_dates) or store.pending
+        if engine is None or unsaved or engine.source_sha256 != file_sha256(store.path):
+            engine = cls.rebuild(store)
+            engine.source_sha256 = file_sha256(store.path) if not unsaved else None
+            engine.dirty = True
+        return engine
+
+    def save(self, path: Path, source: Optional[Path] = None) -> Path:
+        """상태 파일 기록 (source가 있으면 그 파일의 sha256을 함께 기록)"""
+        if source is not None:
+            self.source_sha256 = file_sha256(source)
+        self.updated_at = datetime.now(KST).isoformat(timespec='seconds')
+        atomic_write_text(path, json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':')) + "\n")
+        self.dirty = False
+        return Path(path)
+
+    def differences(self, other: 'StandingsEngine') -> List[str]:
+        """두 상태의 차이 (검증용)"""
+        diffs = []
+        for team in TEAMS:
+            for field in TEAM_FIELDS:
+                if self.teams[team][field] != other.teams[team][field]:
+                    diffs.append(f"{team}.{field}: {self.teams[team][field]} != {other.teams[team][field]}")
+            for opponent, record in self.head_to_head[team].items():
+                for field in H2H_FIELDS:
+                    if record[field] != other.head_to_head[team][opponent][field]:
+                        diffs.append(f"{team} vs {opponent}.{field}: {record[field]} != "
+                                     f"{other.head_to_head[team][opponent][field]}")
+            if self.results[team] != other.results[team]:
+                diffs.append(f"{team}.results: {len(self.results[team])}경기 != {len(other.results[team])}경기 (순서/결과 불일치)")
+        extra = set(self.games) ^ set(other.games)
+        if extra:
+            diffs.append(f"반영 경기 불일치 {len(extra)}개: {sorted(extra)[:3]}")
+        return diffs
+
+
+def check_against_js(engine: StandingsEngine, data_dir: Path) -> List[str]:
+    """02_season-data-processor.js 출력(calc-standings.json, calc-head-to-head.json)과 비교"""
+    diffs = []
+    rankings_path, h2h_path = Path(data_dir) / 'calc-standings.json', Path(data_dir) / 'calc-head-to-head.json'
+    if rankings_path.exists():
+        rankings = {row['team']: row for row in json.loads(rankings_path.read_text(encoding='utf-8'))['rankings']}
+        for row in engine.standings():
+            js = rankings.get(row['team'])
+            if js is None:
+                diffs.append(f"{row['team']}: calc-standings.json에 없음")
+                continue
+            for field in ('rank', 'games', 'wins', 'losses', 'draws', 'gamesBehind', 'recent10', 'streak',
+                          'homeRecord', 'awayRecord'):
+                if row[field] != js.get(field):
+                    diffs.append(f"{row['team']}.{field}: {row[field]} != JS {js.get(field)}")
+    if h2h_path.exists():
+        total = json.loads(h2h_path.read_text(encoding='utf-8'))['totalData']
+        for team, opponents in engine.head_to_head.items():
+            for opponent, record in opponents.items():
+                js = total.get(team, {}).get(opponent, {})
+                for field in H2H_FIELDS:
+                    if record[field] != js.get(field):
+                        diffs.append(f"{team} vs {opponent}.{field}: {record[field]} != JS {js.get(field)}")
+    return diffs
+
+
+def check_js(engine: StandingsEngine, data_dir: Path) -> int:
+    diffs = check_against_js(engine, data_dir)
+    if diffs:
+        print(f"\n❌ JS 처리 결과와 다름 ({len(diffs)}건)")
+        for line in diffs[:20]:
+            print(f"   {line}")
+        return 1
+    print("\n✅ JS 처리 결과(calc-standings.json, calc-head-to-head.json)와 일치")
+    return 0
+
+
+def print_standings(engine: StandingsEngine):
+    print(f"\n{'순위':>4} {'팀':<4}{'경기':>5}{'승':>5}{'패':>5}{'무':>4}{'승률':>7}{'게임차':>7}  {'최근10':<9}{'연속':>4}")
+    for row in engine.standings():
+        print(f"{row['rank']:>4} {row['team']:<4}{row['games']:>5}{row['wins']:>5}{row['losses']:>5}{row['draws']:>4}"
+              f"{row['winRate']:>7.3f}{row['gamesBehind']:>7.1f}  {row['recent10']:<9}{row['streak']:>4}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='KBO 순위/상대전적 증분 상태')
+    parser.add_argument('--year', type=int, default=None, help='시즌 (기본: KBO_SEASON 또는 데이터가 있는 가장 최근 시즌)')
+    parser.add_argument('--data-dir', default=None, help='데이터 디렉토리 (기본: PathManager data_dir)')
+    parser.add_argument('--verify', action='store_true', help='저장된 증분 상태와 전체 재계산 결과 비교 (다르면 종료 코드 1)')
+    parser.add_argument('--rebuild', action='store_true', help='전체 재계산 후 상태 파일 다시 기록')
+    parser.add_argument('--check-js', action='store_true', help='JS 처리 결과(calc-*.json)와 비교')
+    args = parser.parse_args(argv)
+
+    if args.data_dir:
+        data_dir = Path(args.data_dir)
+    else:
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'config'))
+        from paths import get_path_manager
+        data_dir = Path(get_path_manager().data_dir)
+    args.year = args.year or latest_season(data_dir)
+
+    season_file = data_dir / season_file_name(args.year)
+    state_path = standings_state_path(data_dir, args.year)
+    if not season_file.exists():
+        print(f"❌ 시즌 파일 없음: {season_file} (--year 또는 KBO_SEASON 확인)")
+        return 1
+    store = SeasonStore.read(season_file, year=args.year)
+    rebuilt = StandingsEngine.rebuild(store)
+
+    if args.verify:
+        saved = StandingsEngine.load(state_path)
+        if saved is None:
+            print(f"❌ 상태 파일 없음: {state_path}")
+            return 1
+        if saved.source_sha256 != file_sha256(season_file):
+            print(f"⚠️ 상태 파일이 현재 시즌 파일 이후로 갱신되지 않음 (sha256 불일치)")
+        diffs = saved.differences(rebuilt)
+        if diffs:
+            print(f"❌ 증분 상태와 전체 재계산 결과가 다름 ({len(diffs)}건)")
+            for line in diffs[:20]:
+                print(f"   {line}")
+            return 1
+        print(f"✅ 증분 상태 == 전체 재계산 ({len(saved.games)}경기, 최신 {saved.last_date()})")
+        return check_js(saved, data_dir) if args.check_js else 0
+
+    if args.rebuild:
+        engine = rebuilt
+        engine.save(state_path, source=season_file)
+        print(f"💾 전체 재계산 후 상태 기록: {state_path}")
+    else:
+        engine = StandingsEngine.load_for(store, state_path)
+        if engine.dirty:
+            engine.save(state_path, source=season_file)
+            print(f"💾 상태가 없거나 오래되어 다시 계산: {state_path}")
+
+    print(f"📊 {args.year} 시즌 {len(engine.games)}경기 반영 (최신 {engine.last_date()})")
+    print_standings(engine)
+
+    return check_js(engine, data_dir) if args.check_js else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
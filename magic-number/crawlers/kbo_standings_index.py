@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+KBO 날짜 기준("as of") 순위 조회 - 날짜별 누적합 배열
+- 경기가 있었던 날짜마다 팀별 승/패/무/득점/실점과 10×10 상대전적의 누적값을 한 번만 계산
+- 임의 날짜까지의 순위/승률/게임차/순위, 두 날짜 사이 성적은 누적 배열 두 행의 차이
+  (날짜 이분 탐색 + 팀 수만큼의 연산) - 주차/월별 스냅샷을 미리 만들어 둘 필요 없음
+- 집계 기준은 kbo_standings_engine과 동일 (증분 상태 파일이 시즌 파일과 맞으면 그대로 사용)
+
+사용법:
+  python3 magic-number/crawlers/kbo_standings_index.py --date 2025-06-30
+  python3 magic-number/crawlers/kbo_standings_index.py --from 2025-08-01 --date 2025-08-31 --json
+  python3 magic-number/crawlers/kbo_standings_index.py --team LG --vs 한화 --date 2025-07-15
+  python3 magic-number/crawlers/kbo_standings_index.py --verify    # 모든 날짜를 순차 누적 결과와 비교
+"""
+
+import argparse
+import json
+import sys
+import time
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from kbo_season_store import SeasonStore, latest_season, season_file_name
+from kbo_standings_engine import (TEAMS, StandingsEngine, counted_score, rank_standings, standings_state_path,
+                                  win_rate)
+
+RECORD_FIELDS = ('wins', 'losses', 'draws', 'runsScored', 'runsAllowed')
+H2H_RESULTS = ('wins', 'losses', 'draws')
+WINS, LOSSES, DRAWS, RUNS_SCORED, RUNS_ALLOWED = range(len(RECORD_FIELDS))
+
+Game = Tuple[str, str, str, int, int]  # (date, home_team, away_team, away_score, home_score)
+
+
+class StandingsIndex:
+    """날짜별 누적 배열
+
+    - dates: 경기가 있었던 날짜 (정렬)
+    - records[i]: dates[i - 1]까지(포함)의 팀별 누적 (팀, RECORD_FIELDS) - records[0]은 시즌 시작 전 (모두 0)
+    - head_to_head[i]: 같은 시점의 상대전적 (팀, 상대, 승/패/무)
+    """
+
+    def __init__(self, year: int, dates: List[str], records: np.ndarray, head_to_head: np.ndarray,
+                 teams: Tuple[str, ...] = TEAMS):
+        self.year = year
+        self.teams = teams
+        self.team_index = {team: idx for idx, team in enumerate(teams)}
+        self.dates = dates
+        self.records = records
+        self.head_to_head = head_to_head
+
+    @classmethod
+    def from_games(cls, year: int, games: Iterable[Game], teams: Tuple[str, ...] = TEAMS) -> 'StandingsIndex':
+        """경기 목록에서 날짜별 증가분을 채운 뒤 날짜 축으로 누적합"""
+        games = sorted(games)
+        team_index = {team: idx for idx, team in enumerate(teams)}
+        dates = sorted({game[0] for game in games})
+        date_index = {date: idx + 1 for idx, date in enumerate(dates)}
+        n = len(teams)
+        records = np.zeros((len(dates) + 1, n, len(RECORD_FIELDS)), dtype=np.int32)
+        head_to_head = np.zeros((len(dates) + 1, n, n, len(H2H_RESULTS)), dtype=np.int16)
+
+        for date, home_team, away_team, away_score, home_score in games:
+            row, home, away = date_index[date], team_index[home_team], team_index[away_team]
+            records[row, home, RUNS_SCORED] += home_score
+            records[row, home, RUNS_ALLOWED] += away_score
+            records[row, away, RUNS_SCORED] += away_score
+            records[row, away, RUNS_ALLOWED] += home_score
+            if home_score == away_score:
+                home_result, away_result = DRAWS, DRAWS
+            elif home_score > away_score:
+                home_result, away_result = WINS, LOSSES
+            else:
+                home_result, away_result = LOSSES, WINS
+            records[row, home, home_result] += 1
+            records[row, away, away_result] += 1
+            head_to_head[row, home, away, home_result] += 1
+            head_to_head[row, away, home, away_result] += 1
+
+        np.cumsum(records, axis=0, out=records)
+        np.cumsum(head_to_head, axis=0, out=head_to_head)
+        return cls(year, dates, records, head_to_head, teams)
+
+    @classmethod
+    def from_engine(cls, engine: StandingsEngine) -> 'StandingsIndex':
+        """증분 상태의 반영 경기 목록으로 생성 (시즌 파일 재파싱 없음)"""
+        games = []
+        for key, (away_score, home_score) in engine.games.items():
+            date, _, home_team, away_team = key.split(' ')
+            games.append((date, home_team, away_team, away_score, home_score))
+        return cls.from_games(engine.year, games)
+
+    @classmethod
+    def from_store(cls, store: SeasonStore) -> 'StandingsIndex':
+        games = []
+        for record in store:
+            scores = counted_score(record)
+            if scores is not None:
+                games.append((record.date, record.home_team, record.away_team, scores[0], scores[1]))
+        return cls.from_games(store.year, games)
+
+    @classmethod
+    def load(cls, data_dir: Path, year: int) -> 'StandingsIndex':
+        """시즌 파일 + 증분 상태 파일로 생성 (상태가 오래됐으면 저장소에서 다시 계산)"""
+        store = SeasonStore.read(Path(data_dir) / season_file_name(year), year=year)
+        return cls.from_engine(StandingsEngine.load_for(store, standings_state_path(data_dir, year)))
+
+    # ---- 구간 ----
+
+    def position(self, as_of: Optional[str] = None) -> int:
+        """as_of(포함)까지의 누적 행 번호 - None이면 마지막 경기일"""
+        return len(self.dates) if as_of is None else bisect_right(self.dates, as_of)
+
+    def window(self, as_of: Optional[str] = None, since: Optional[str] = None) -> Tuple[int, int]:
+        """[since, as_of] 구간의 (시작 행, 끝 행) - 구간 성적은 누적[끝] - 누적[시작]"""
+        start = 0 if since is None else bisect_left(self.dates, since)
+        return start, max(start, self.position(as_of))
+
+    def last_game_date(self, as_of: Optional[str] = None) -> Optional[str]:
+        end = self.position(as_of)
+        return self.dates[end - 1] if end else None
+
+    # ---- 조회 ----
+
+    def totals(self, as_of: Optional[str] = None, since: Optional[str] = None) -> np.ndarray:
+        """(팀, RECORD_FIELDS) 구간 누적"""
+        start, end = self.window(as_of, since)
+        return self.records[end] - self.records[start]
+
+    def record(self, team: str, as_of: Optional[str] = None, since: Optional[str] = None) -> Dict:
+        start, end = self.window(as_of, since)
+        values = self.records[end, self.team_index[team]] - self.records[start, self.team_index[team]]
+        return self._record_dict(team, values)
+
+    def standings(self, as_of: Optional[str] = None, since: Optional[str] = None) -> List[Dict]:
+        """구간 순위표 - rank/gamesBehind는 02_season-data-processor.js와 같은 규칙"""
+        totals = self.totals(as_of, since)
+        return rank_standings([self._record_dict(team, totals[idx]) for idx, team in enumerate(self.teams)])
+
+    def head_to_head_record(self, team: str, opponent: str, as_of: Optional[str] = None,
+                            since: Optional[str] = None) -> Dict:
+        """team 기준 opponent 상대 승/패/무"""
+        start, end = self.window(as_of, since)
+        i, j = self.team_index[team], self.team_index[opponent]
+        values = self.head_to_head[end, i, j] - self.head_to_head[start, i, j]
+        return {'team': team, 'opponent': opponent, **{field: int(values[k]) for k, field in enumerate(H2H_RESULTS)}}
+
+    def rank_history(self, team: str, since: Optional[str] = None, as_of: Optional[str] = None) -> List[Dict]:
+        """경기일마다의 시즌 누적 순위 (차트용) - 날짜당 O(팀)"""
+        start, end = self.window(as_of, since)
+        history = []
+        for row in range(start + 1, end + 1):
+            for entry in self.standings(as_of=self.dates[row - 1]):
+                if entry['team'] == team:
+                    history.append({'date': self.dates[row - 1], 'rank': entry['rank'],
+                                    'winRate': round(entry['winRate'], 3), 'gamesBehind': entry['gamesBehind']})
+                    break
+        return history
+
+    @staticmethod
+    def _record_dict(team: str, values) -> Dict:
+        wins, losses, draws, runs_scored, runs_allowed = (int(value) for value in values)
+        return {
+            'team': team,
+            'games': wins + losses + draws,
+            'wins': wins,
+            'losses': losses,
+            'draws': draws,
+            'winRate': win_rate(wins, losses),
+            'runsScored': runs_scored,
+            'runsAllowed': runs_allowed,
+        }
+
+
+def sequential_standings(games: Iterable[Game], teams: Tuple[str, ...] = TEAMS) -> Dict[str, Dict[str, Tuple[int, int, int]]]:
+    """검증용 - 날짜 순으로 경기를 하나씩 누적한 날짜별 (승, 패, 무) (02의 generateChaseData와 같은 방식)"""
+    totals = {team: [0, 0, 0] for team in teams}
+    by_date = {}
+    for date, home_team, away_team, away_score, home_score in sorted(games):
+        if home_score == away_score:
+            totals[home_team][2] += 1
+            totals[away_team][2] += 1
+        else:
+            winner, loser = (home_team, away_team) if home_score > away_score else (away_team, home_team)
+            totals[winner][0] += 1
+            totals[loser][1] += 1
+        by_date[date] = {team: tuple(values) for team, values in totals.items()}
+    return by_date
+
+
+def verify(index: StandingsIndex, engine: StandingsEngine) -> List[str]:
+    """모든 경기일의 누적 조회를 순차 누적 결과와, 마지막 날을 증분 상태와 비교"""
+    games = []
+    for key, (away_score, home_score) in engine.games.items():
+        date, _, home_team, away_team = key.split(' ')
+        games.append((date, home_team, away_team, away_score, home_score))
+
+    diffs = []
+    for date, expected in sequential_standings(games).items():
+        for row in index.standings(as_of=date):
+            actual = (row['wins'], row['losses'], row['draws'])
+            if actual != expected[row['team']]:
+                diffs.append(f"{date} {row['team']}: {actual} != {expected[row['team']]}")
+    final = {row['team']: row for row in index.standings()}
+    for team in TEAMS:
+        for field in ('wins', 'losses', 'draws', 'runsScored', 'runsAllowed'):
+            if final[team][field] != engine.teams[team][field]:
+                diffs.append(f"최종 {team}.{field}: {final[team][field]} != 상태 {engine.teams[team][field]}")
+        for opponent in TEAMS:
+            if opponent == team:
+                continue
+            record = index.head_to_head_record(team, opponent)
+            for field in H2H_RESULTS:
+                if record[field] != engine.head_to_head[team][opponent][field]:
+                    diffs.append(f"최종 {team} vs {opponent}.{field}: {record[field]} != 상태 "
+                                 f"{engine.head_to_head[team][opponent][field]}")
+    return diffs
+
+
+def print_standings(rows: List[Dict]):
+    print(f"{'순위':>4} {'팀':<4}{'경기':>5}{'승':>5}{'패':>5}{'무':>4}{'승률':>7}{'게임차':>7}{'득점':>6}{'실점':>6}")
+    for row in rows:
+        print(f"{row['rank']:>4} {row['team']:<4}{row['games']:>5}{row['wins']:>5}{row['losses']:>5}{row['draws']:>4}"
+              f"{row['winRate']:>7.3f}{row['gamesBehind']:>7.1f}{row['runsScored']:>6}{row['runsAllowed']:>6}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='KBO 날짜 기준 순위 조회')
+    parser.add_argument('--year', type=int, default=None, help='시즌 (기본: KBO_SEASON 또는 데이터가 있는 가장 최근 시즌)')
+    parser.add_argument('--data-dir', default=None, help='데이터 디렉토리 (기본: PathManager data_dir)')
+    parser.add_argument('--date', default=None, help='이 날짜(포함)까지 - 기본: 마지막 경기일')
+    parser.add_argument('--from', dest='since', default=None, help='이 날짜(포함)부터의 구간 성적')
+    parser.add_argument('--team', default=None, help='팀 성적/순위 변화만 출력')
+    parser.add_argument('--vs', default=None, help='--team의 상대전적 상대 팀')
+    parser.add_argument('--json', action='store_true', help='JSON으로 출력')
+    parser.add_argument('--verify', action='store_true', help='모든 경기일을 순차 누적/증분 상태와 비교 (다르면 종료 코드 1)')
+    args = parser.parse_args(argv)
+
+    if args.data_dir:
+        data_dir = Path(args.data_dir)
+    else:
+        sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'config'))
+        from paths import get_path_manager
+        data_dir = Path(get_path_manager().data_dir)
+    args.year = args.year or latest_season(data_dir)
+
+    season_file = data_dir / season_file_name(args.year)
+    if not season_file.exists():
+        print(f"❌ 시즌 파일 없음: {season_file} (--year 또는 KBO_SEASON 확인)")
+        return 1
+
+    started = time.perf_counter()
+    store = SeasonStore.read(season_file, year=args.year)
+    engine = StandingsEngine.load_for(store, standings_state_path(data_dir, args.year))
+    index = StandingsIndex.from_engine(engine)
+    built_ms = (time.perf_counter() - started) * 1000
+
+    if args.verify:
+        diffs = verify(index, engine)
+        if diffs:
+            print(f"❌ 누적 조회 결과가 순차 누적과 다름 ({len(diffs)}건)")
+            for line in diffs[:20]:
+                print(f"   {line}")
+            return 1
+        started = time.perf_counter()
+        for date in index.dates:
+            index.standings(as_of=date)
+        per_query_us = (time.perf_counter() - started) / max(1, len(index.dates)) * 1e6
+        print(f"✅ {len(index.dates)}개 경기일 누적 조회 == 순차 누적 (생성 {built_ms:.1f}ms, 조회 {per_query_us:.0f}µs/회)")
+        return 0
+
+    if args.team and args.vs:
+        result = index.head_to_head_record(args.team, args.vs, as_of=args.date, since=args.since)
+    elif args.team:
+        result = {'record': index.record(args.team, as_of=args.date, since=args.since),
+                  'history': index.rank_history(args.team, since=args.since, as_of=args.date)}
+    else:
+        result = index.standings(as_of=args.date, since=args.since)
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False))
+        return 0
+
+    period = f"{args.since or '개막'} ~ {index.last_game_date(args.date) or '-'}"
+    print(f"📊 {args.year} 시즌 {period} (누적 배열 {len(index.dates)}일, 생성 {built_ms:.1f}ms)")
+    if isinstance(result, list):
+        print_standings(result)
+    elif 'opponent' in result:
+        print(f"{result['team']} vs {result['opponent']}: {result['wins']}승 {result['losses']}패 {result['draws']}무")
+    else:
+        record = result['record']
+        print(f"{record['team']}: {record['games']}경기 {record['wins']}승 {record['losses']}패 {record['draws']}무 "
+              f"(승률 {record['winRate']:.3f}, 득실 {record['runsScored']}/{record['runsAllowed']})")
+        for entry in result['history'][-10:]:
+            print(f"   {entry['date']}  {entry['rank']}위  {entry['winRate']:.3f}  {entry['gamesBehind']:.1f}G")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""월별 변경 감지 기록 테스트 (python3 -m pytest magic-number/crawlers/tests)"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from kbo_metrics import KST
+from kbo_month_fingerprints import MonthFingerprints, plan_months
+from kbo_season_store import SeasonStore
+
+
+def test_unchanged_check_does_not_rewrite_committed_file(tmp_path):
+    path, checks = tmp_path / '2025-month-fingerprints.json', tmp_path / 'logs' / '2025-month-checks.json'
+    checks.parent.mkdir()
+    first = datetime(2025, 9, 1, 9, 0, tzinfo=KST)
+
+    fingerprints = MonthFingerprints(path, checks_path=checks)
+    fingerprints.record(2025, 5, fingerprint='abc', rows=120, etag='"v1"', now=first)
+    fingerprints.save()
+    committed = path.read_text(encoding='utf-8')
+    assert 'checked_at' not in committed
+
+    # 다음 실행: 변경 없음 → 확인 시각만 갱신, 커밋 파일은 그대로
+    later = first + timedelta(hours=1)
+    fingerprints = MonthFingerprints(path, checks_path=checks)
+    mtime = path.stat().st_mtime_ns
+    fingerprints.record(2025, 5, now=later)
+    fingerprints.record(2025, 5, fingerprint='abc', rows=120, now=later)
+    fingerprints.save()
+    assert path.read_text(encoding='utf-8') == committed
+    assert path.stat().st_mtime_ns == mtime
+    assert MonthFingerprints(path, checks_path=checks).checked_at(2025, 5) == later
+
+    # 오래되지 않은 cold 월은 건너뜀
+    to_fetch, skipped = plan_months([5], 2025, SeasonStore(2025), fingerprints,
+                                    now=later + timedelta(hours=1), cold_ttl_hours=12)
+    assert (to_fetch, skipped) == ([], [5])
+
+
+def test_legacy_checked_at_moves_out_of_committed_file(tmp_path):
+    path, checks = tmp_path / '2025-month-fingerprints.json', tmp_path / 'checks.json'
+    path.write_text('{"202505": {"rows_sha256": "abc", "rows": 1, "checked_at": "2025-09-01T09:00:00+09:00"}}',
+                    encoding='utf-8')
+
+    fingerprints = MonthFingerprints(path, checks_path=checks)
+    assert fingerprints.checked_at(2025, 5) == datetime(2025, 9, 1, 9, 0, tzinfo=KST)
+    fingerprints.save()
+    assert 'checked_at' not in path.read_text(encoding='utf-8')
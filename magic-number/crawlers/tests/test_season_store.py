@@ -0,0 +1,118 @@
+"""SeasonStore 증분 저장 회귀 테스트 (python3 -m pytest magic-number/crawlers/tests)"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from kbo_season_store import DATE_LINE, GameRecord, SeasonStore, latest_season, season_file_name
+
+
+def game(date, time, home, away, state='종료', score='3:2'):
+    return GameRecord(date, time, state, '잠실', home, away, score, 'SPO-T', '페넌트레이스')
+
+
+def seed(path):
+    store = SeasonStore(2025, path)
+    store.add(game('2025-04-01', '18:30', 'LG', '두산'))
+    store.add(game('2025-04-02', '18:30', 'KT', '한화'))
+    store.write()
+    return path.read_text(encoding='utf-8')
+
+
+def full_write(store, path):
+    """같은 내용을 전체 쓰기로 만든 파일 텍스트"""
+    return store.write(path).read_text(encoding='utf-8')
+
+
+def date_headers(text):
+    return [line.split()[0] for line in text.splitlines() if DATE_LINE.match(line)]
+
+
+def test_game_on_last_date_rewrites_instead_of_appending(tmp_path):
+    path = tmp_path / '2025-season-data-clean.txt'
+    seed(path)
+
+    store = SeasonStore.load(path)
+    store.add(game('2025-04-02', '14:00', 'SSG', '삼성'))
+    assert store.save() == 'rewrite'
+
+    text = path.read_text(encoding='utf-8')
+    headers = date_headers(text)
+    assert len(headers) == len(set(headers))
+
+    reloaded = SeasonStore.load(path)
+    assert len(reloaded) == 3
+    assert text == full_write(reloaded, tmp_path / 'full.txt')
+
+
+def test_new_date_after_last_date_appends(tmp_path):
+    path = tmp_path / '2025-season-data-clean.txt'
+    seed(path)
+
+    store = SeasonStore.load(path)
+    store.add(game('2025-04-03', '18:30', 'NC', 'KIA'))
+    assert store.save() == 'append'
+    # 방금 append한 날짜에 경기가 더 붙어도 다시 append하지 않음
+    store.add(game('2025-04-03', '14:00', '롯데', '키움'))
+    assert store.save() == 'rewrite'
+
+    text = path.read_text(encoding='utf-8')
+    reloaded = SeasonStore.load(path)
+    assert len(reloaded) == 4
+    assert text == full_write(reloaded, tmp_path / 'full.txt')
+
+
+def test_identical_update_is_a_noop(tmp_path):
+    path = tmp_path / '2025-season-data-clean.txt'
+    seed(path)
+    store = SeasonStore.load(path)
+    pending = game('2025-04-01', '18:30', 'LG', '두산')
+
+    assert store.is_stored(pending)
+    assert not store.add(pending)
+    assert store.save() is None
+
+    finished = game('2025-04-01', '18:30', 'LG', '두산', score='5:4')
+    assert not store.is_stored(finished)
+
+
+def test_read_has_no_side_effects_during_pending_append(tmp_path):
+    path = tmp_path / '2025-season-data-clean.txt'
+    committed = seed(path)
+
+    # 크롤러가 append를 저널에 기록하고 파일에 붙인 뒤 commit 전인 상태 (+ 다른 쓰기의 임시 파일)
+    store = SeasonStore.load(path)
+    tmp_file = path.with_name(f".{path.name}.tmp")
+    tmp_file.write_text('in-flight rewrite', encoding='utf-8')
+    store.journal.append({'type': 'write', 'seq': 1, 'run_id': None, 'month': 4, 'mode': 'append',
+                          'base_size': path.stat().st_size, 'removed': [], 'added': []})
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write("\n\n2025-04-03 (목)\n" + game('2025-04-03', '18:30', 'NC', 'KIA').line + "\n")
+    on_disk = path.read_bytes()
+    journal = store.journal.path.read_bytes()
+
+    reader = SeasonStore.read(path)
+    assert reader.pending
+    assert reader.render() == committed
+    assert tmp_file.exists()
+    assert path.read_bytes() == on_disk
+    assert store.journal.path.read_bytes() == journal
+
+    store.journal.append({'type': 'commit', 'seq': 1})
+    reader = SeasonStore.read(path)
+    assert not reader.pending
+    assert len(reader) == 3
+
+
+def test_latest_season_defaults_to_newest_season_with_data(tmp_path, monkeypatch):
+    monkeypatch.delenv('KBO_SEASON', raising=False)
+    monkeypatch.setattr('kbo_season_store.current_season', lambda: 2026)
+    assert latest_season(tmp_path) == 2026
+
+    for year in (2024, 2025, 2027):
+        (tmp_path / season_file_name(year)).write_text('', encoding='utf-8')
+    assert latest_season(tmp_path) == 2025
+
+    # KBO_SEASON은 파일이 없어도 그대로 사용
+    monkeypatch.setenv('KBO_SEASON', '2026')
+    assert latest_season(tmp_path) == 2026
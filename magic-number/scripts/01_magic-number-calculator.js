@@ -1,5 +1,6 @@
 const fs = require('fs');
 const path = require('path');
+const { writeJson } = require('../config/json-writer');
 
 const MAGIC_NUMBER_DIR = path.resolve(__dirname, '..');
 const DATA_DIR = path.join(MAGIC_NUMBER_DIR, 'data');
@@ -338,7 +339,7 @@ function calculateMagicNumbers(serviceData) {
     };
     
     const outputPath = path.join(DATA_DIR, 'calc-magic-numbers.json');
-    fs.writeFileSync(outputPath, JSON.stringify(matrixData, null, 2), 'utf8');
+    writeJson(outputPath, matrixData);
     console.log(`✅ 매직넘버 매트릭스 데이터 저장: ${outputPath}`);
     
     console.log('✅ 매직넘버 계산 완료!');
@@ -356,4 +357,4 @@ if (require.main === module) {
     main();
 }
 
-module.exports = { calculateMagicNumbers };
\ No newline at end of file
+module.exports = { calculateMagicNumbers, main };
\ No newline at end of file
@@ -8,6 +8,9 @@
 const fs = require('fs');
 const path = require('path');
 const pathManager = require('../../config/paths');
+const { loadSeasonSnapshot, snapshotPathFor } = require('../config/season-snapshot');
+const { loadStandingsState, standingsStatePathFor } = require('../config/standings-state');
+const { writeJson } = require('../config/json-writer');
 
 class KBODataProcessor {
     constructor() {
@@ -28,6 +31,9 @@ class KBODataProcessor {
         this.standings = [];
         this.magicNumbers = {};
         this.remainingGames = {};
+
+        // 크롤러가 유지하는 순위/상대전적 증분 상태 (시즌 파일과 일치할 때만 사용)
+        this.standingsState = null;
     }
 
     // 1. 경기 데이터 파싱
@@ -43,12 +49,35 @@ class KBODataProcessor {
             }
             
             console.log(`📁 데이터 파일: ${dataFile}`);
-            const data = fs.readFileSync(dataFile, 'utf8');
-            const lines = data.trim().split('\n');
-            
+            this.standingsState = loadStandingsState(dataFile);
+            if (this.standingsState) {
+                console.log(`⚡ 순위 상태 사용: ${standingsStatePathFor(dataFile)} (${this.standingsState.gameCount}경기)`);
+            }
+
             let currentDate = '';
             let gameCount = 0;
-            
+
+            // 크롤러가 남긴 컬럼형 스냅샷이 원본과 같으면 텍스트 파싱 생략
+            const snapshot = loadSeasonSnapshot(dataFile);
+            if (snapshot) {
+                console.log(`⚡ 스냅샷 사용: ${snapshotPathFor(dataFile)} (${snapshot.rows}행)`);
+                for (const { date, parts } of snapshot.entries()) {
+                    currentDate = date;
+                    const result = this.processRecordParts(parts, currentDate);
+                    if (result === 'game') {
+                        gameCount++;
+                    } else if (result === null) {
+                        console.log(`  ⚠️ 인식되지 않는 라인 형식: ${parts.join(' ')}`);
+                    }
+                }
+                console.log(`✅ 파싱 완료: ${gameCount}경기, 최신 날짜: ${currentDate}`);
+                this.checkStandingsState();
+                return { gameCount, lastDate: currentDate };
+            }
+
+            const data = fs.readFileSync(dataFile, 'utf8');
+            const lines = data.trim().split('\n');
+
             for (const line of lines) {
                 const trimmedLine = line.trim();
                 if (!trimmedLine) continue;
@@ -60,44 +89,13 @@ class KBODataProcessor {
                 }
 
                 // 새로운 형식 파싱: "시간 상태 구장 홈팀 어웨이팀 점수 방송사 구분"
-                // 더 유연한 패턴 사용 - 공백으로 구분된 8개 필드
-                const newFormatParts = trimmedLine.split(/\s+/);
-                if (newFormatParts.length >= 8) {
-                    const [time, state, stadium, homeTeam, awayTeam, scoreOrStatus, broadcast, ...categoryParts] = newFormatParts;
-                    const category = categoryParts.join(' ');
-
-                    // 취소 경기는 제외
-                    if (scoreOrStatus === '취소' || state.includes('취소') || state.includes('연기')) {
-                        console.log(`  ❌ 취소/연기 경기 제외: ${homeTeam} vs ${awayTeam} [${state}]`);
-                        continue;
-                    }
-
-                    // 페넌트레이스 게임이면서 완료된 경기만 처리 (종료된 경기만)
-                    if (!category.includes('페넌트레이스') || state !== '종료') {
-                        if (!category.includes('페넌트레이스')) {
-                            console.log(`  ⚠️ 페넌트레이스 외 경기 제외: ${homeTeam} vs ${awayTeam} [${category}]`);
-                        }
-                        if (state !== '종료') {
-                            console.log(`  ⚠️ 비완료 경기 제외: ${homeTeam} vs ${awayTeam} [${state}]`);
-                        }
-                        continue;
-                    }
-
-                    // 점수 파싱 (away:home 형식)
-                    const scoreMatch = scoreOrStatus.match(/^(\d+):(\d+)$/);
-                    if (scoreMatch) {
-                        const [, awayScore, homeScore] = scoreMatch;
-                        const team1 = awayTeam;
-                        const team2Raw = homeTeam;
-                        const score1 = parseInt(awayScore);
-                        const score2 = parseInt(homeScore);
-                        const homeMarker = '(H)'; // 새 형식에서는 항상 홈/어웨이 구분됨
-
-                        // 새 형식 처리
-                        this.processGame(team1, score1, score2, team2Raw, homeMarker, currentDate);
-                        gameCount++;
-                        continue;
-                    }
+                const result = this.processRecordParts(trimmedLine.split(/\s+/), currentDate);
+                if (result === 'game') {
+                    gameCount++;
+                    continue;
+                }
+                if (result === 'skipped') {
+                    continue;
                 }
 
                 // 기존 형식 파싱 (팀1 점수:점수 팀2(H) 또는 팀1 점수:점수 팀2)
@@ -113,6 +111,7 @@ class KBODataProcessor {
             }
 
             console.log(`✅ 파싱 완료: ${gameCount}경기, 최신 날짜: ${currentDate}`);
+            this.checkStandingsState();
             return { gameCount, lastDate: currentDate };
 
         } catch (error) {
@@ -121,6 +120,53 @@ class KBODataProcessor {
         }
     }
 
+    // 순위 상태의 경기 수가 파싱 결과와 다르면(집계 기준 불일치) 사용하지 않고 전체 계산
+    checkStandingsState() {
+        if (this.standingsState && this.standingsState.gameCount !== this.games.length) {
+            console.log(`  ⚠️ 순위 상태 경기 수 불일치 (${this.standingsState.gameCount} != ${this.games.length}) - 전체 계산`);
+            this.standingsState = null;
+        }
+    }
+
+    // 새 형식 경기 줄(공백으로 나눈 토큰) 처리 - 'game'(반영) / 'skipped'(제외) / null(새 형식 아님)
+    processRecordParts(parts, currentDate) {
+        // 더 유연한 패턴 사용 - 공백으로 구분된 8개 필드
+        if (parts.length < 8) {
+            return null;
+        }
+        const [time, state, stadium, homeTeam, awayTeam, scoreOrStatus, broadcast, ...categoryParts] = parts;
+        const category = categoryParts.join(' ');
+
+        // 취소 경기는 제외
+        if (scoreOrStatus === '취소' || state.includes('취소') || state.includes('연기')) {
+            console.log(`  ❌ 취소/연기 경기 제외: ${homeTeam} vs ${awayTeam} [${state}]`);
+            return 'skipped';
+        }
+
+        // 페넌트레이스 게임이면서 완료된 경기만 처리 (종료된 경기만)
+        if (!category.includes('페넌트레이스') || state !== '종료') {
+            if (!category.includes('페넌트레이스')) {
+                console.log(`  ⚠️ 페넌트레이스 외 경기 제외: ${homeTeam} vs ${awayTeam} [${category}]`);
+            }
+            if (state !== '종료') {
+                console.log(`  ⚠️ 비완료 경기 제외: ${homeTeam} vs ${awayTeam} [${state}]`);
+            }
+            return 'skipped';
+        }
+
+        // 점수 파싱 (away:home 형식)
+        const scoreMatch = scoreOrStatus.match(/^(\d+):(\d+)$/);
+        if (!scoreMatch) {
+            return null;
+        }
+        const [, awayScore, homeScore] = scoreMatch;
+        const homeMarker = '(H)'; // 새 형식에서는 항상 홈/어웨이 구분됨
+
+        // 새 형식 처리
+        this.processGame(awayTeam, parseInt(awayScore), parseInt(homeScore), homeTeam, homeMarker, currentDate);
+        return 'game';
+    }
+
     // 게임 처리 메서드
     processGame(team1, score1, score2, team2Raw, homeMarker, currentDate) {
         // 올스타 경기 제외
@@ -170,7 +216,32 @@ class KBODataProcessor {
     calculateTeamStats() {
         console.log('📊 팀별 통계 계산 중...');
         console.log(`  🎮 처리할 경기 수: ${this.games.length}`);
-        
+
+        if (this.standingsState) {
+            this.loadTeamStatsFromState();
+        } else {
+            this.accumulateTeamStats();
+        }
+        this.finalizeTeamStats();
+    }
+
+    // 증분 상태에서 팀별 누적 기록 복사 (경기 순회 없음)
+    loadTeamStatsFromState() {
+        const { teams, results } = this.standingsState;
+        this.teams.forEach(team => {
+            const { games, wins, losses, draws, homeWins, homeLosses, homeDraws, awayWins, awayLosses, awayDraws } = teams[team];
+            this.teamStats[team] = {
+                games, wins, losses, draws,
+                homeWins, homeLosses, homeDraws,
+                awayWins, awayLosses, awayDraws,
+                recent10: results[team].slice(-20).map(([, , result]) => result),
+                currentStreak: { type: '', count: 0 }
+            };
+        });
+    }
+
+    // 전체 경기 순회로 팀별 누적 기록 계산
+    accumulateTeamStats() {
         // 초기화
         this.teams.forEach(team => {
             this.teamStats[team] = {
@@ -241,8 +312,10 @@ class KBODataProcessor {
                 this.teamStats[loser].recent10.push('패');
             }
         }
-        
-        // 후처리: 승률, 최근 10경기, 연속 기록 계산
+    }
+
+    // 후처리: 승률, 최근 10경기, 연속 기록 계산
+    finalizeTeamStats() {
         this.teams.forEach(team => {
             const stats = this.teamStats[team];
             
@@ -268,7 +341,32 @@ class KBODataProcessor {
     // 3. 상대전적 계산
     calculateHeadToHead() {
         console.log('⚔️ 상대전적 계산 중...');
-        
+
+        if (this.standingsState) {
+            // 증분 상태의 상대전적 매트릭스 사용 (경기 순회 없음)
+            this.teams.forEach(team1 => {
+                this.headToHead[team1] = {};
+                this.teams.forEach(team2 => {
+                    if (team1 !== team2) {
+                        this.headToHead[team1][team2] = { ...this.standingsState.headToHead[team1][team2] };
+                    }
+                });
+            });
+        } else {
+            this.accumulateHeadToHead();
+        }
+
+        // 상대전적 요약 출력
+        console.log('  ⚔️ 상대전적 매트릭스 완성');
+        this.teams.forEach(team => {
+            const totalGames = Object.values(this.headToHead[team])
+                .reduce((sum, record) => sum + record.wins + record.losses + record.draws, 0);
+            console.log(`    ${team}: 총 ${totalGames}경기`);
+        });
+    }
+
+    // 전체 경기 순회로 상대전적 계산
+    accumulateHeadToHead() {
         // 초기화
         this.teams.forEach(team1 => {
             this.headToHead[team1] = {};
@@ -312,14 +410,6 @@ class KBODataProcessor {
                 }
             }
         }
-        
-        // 상대전적 요약 출력
-        console.log('  ⚔️ 상대전적 매트릭스 완성');
-        this.teams.forEach(team => {
-            const totalGames = Object.values(this.headToHead[team])
-                .reduce((sum, record) => sum + record.wins + record.losses + record.draws, 0);
-            console.log(`    ${team}: 총 ${totalGames}경기`);
-        });
     }
 
     // 4. 잔여경기 계산
@@ -730,7 +820,7 @@ class KBODataProcessor {
             
             // 3. PathManager를 사용한 안전한 경로로 웹서비스 파일들 생성
             const rankingsPath = pathManager.getDataFile('calc-standings.json');
-            fs.writeFileSync(rankingsPath, JSON.stringify(rankingsData, null, 2));
+            writeJson(rankingsPath, rankingsData);
             
             // 상대전적 데이터도 업데이트
             const recordsData = {
@@ -743,7 +833,7 @@ class KBODataProcessor {
             };
             
             const recordsPath = pathManager.getDataFile('calc-head-to-head.json');
-            fs.writeFileSync(recordsPath, JSON.stringify(recordsData, null, 2));
+            writeJson(recordsPath, recordsData);
             
             // api-data.json은 이미 위에서 저장됨
             
@@ -1,14 +1,21 @@
 const fs = require('fs');
 const path = require('path');
+const pathManager = require('../../config/paths');
+const { loadSeasonSnapshot } = require('../config/season-snapshot');
+const { writeJson } = require('../config/json-writer');
+
+// 시즌 파일의 경기 줄을 { date, parts }로 - 원본과 같은 스냅샷(.snap)이 있으면 텍스트 파싱 생략
+function* readSeasonEntries(dataPath) {
+    const snapshot = loadSeasonSnapshot(dataPath);
+    if (snapshot) {
+        yield* snapshot.entries();
+        return;
+    }
 
-function parseSeasonData() {
-    const dataPath = path.join(__dirname, '../data/2025-season-data-clean.txt');
     const data = fs.readFileSync(dataPath, 'utf-8');
     const lines = data.split('\n').filter(line => line.trim());
-    
-    const games = [];
     let currentDate = null;
-    
+
     for (const line of lines) {
         const trimmed = line.trim();
         
@@ -18,61 +25,70 @@ function parseSeasonData() {
         }
         // 새로운 형식 패턴: "시간 상태 구장 홈팀 어웨이팀 점수 방송사 구분"
         else if (trimmed && currentDate) {
-            const parts = trimmed.split(/\s+/);
-            if (parts.length >= 7) {  // 7개로 변경 (페넌트레이스 없는 경우도 처리)
-                const [time, state, stadium, homeTeam, awayTeam, scoreOrStatus, broadcast, ...categoryParts] = parts;
-                const category = categoryParts.join(' ') || '';  // 빈 문자열 기본값
+            yield { date: currentDate, parts: trimmed.split(/\s+/) };
+        }
+    }
+}
+
+function parseSeasonData() {
+    const dataPath = pathManager.getSeasonDataFile('season-data-clean.txt');
+    
+    const games = [];
+    
+    for (const { date: currentDate, parts } of readSeasonEntries(dataPath)) {
+        if (parts.length >= 7) {  // 7개로 변경 (페넌트레이스 없는 경우도 처리)
+            const [time, state, stadium, homeTeam, awayTeam, scoreOrStatus, broadcast, ...categoryParts] = parts;
+            const category = categoryParts.join(' ') || '';  // 빈 문자열 기본값
 
-                // 페넌트레이스 게임 처리 (종료, 취소 모두 포함)
-                // 페넌트레이스가 명시되어 있거나, 취소/종료 경기는 모두 포함
-                if (category.includes('페넌트레이스') || state === '경기취소' || state === '종료') {
-                    if (state === '종료') {
-                        // 완료된 경기 - 점수 파싱
-                        const scoreMatch = scoreOrStatus.match(/^(\d+):(\d+)$/);
-                        if (scoreMatch) {
-                            const [, awayScore, homeScore] = scoreMatch;
-                            const away_score = parseInt(awayScore);
-                            const home_score = parseInt(homeScore);
+            // 페넌트레이스 게임 처리 (종료, 취소 모두 포함)
+            // 페넌트레이스가 명시되어 있거나, 취소/종료 경기는 모두 포함
+            if (category.includes('페넌트레이스') || state === '경기취소' || state === '종료') {
+                if (state === '종료') {
+                    // 완료된 경기 - 점수 파싱
+                    const scoreMatch = scoreOrStatus.match(/^(\d+):(\d+)$/);
+                    if (scoreMatch) {
+                        const [, awayScore, homeScore] = scoreMatch;
+                        const away_score = parseInt(awayScore);
+                        const home_score = parseInt(homeScore);
 
-                            games.push({
-                                date: currentDate,
-                                time: time,
-                                stadium: stadium,
-                                away_team: awayTeam,
-                                home_team: homeTeam,
-                                away_score: away_score,
-                                home_score: home_score,
-                                winner: away_score > home_score ? awayTeam :
-                                       (away_score < home_score ? homeTeam : 'draw'),
-                                broadcast: broadcast,
-                                category: category,
-                                state: state
-                            });
-                        }
-                    } else if (state === '경기취소' || scoreOrStatus === '취소') {
-                        // 취소된 경기
                         games.push({
                             date: currentDate,
                             time: time,
                             stadium: stadium,
                             away_team: awayTeam,
                             home_team: homeTeam,
-                            away_score: 0,
-                            home_score: 0,
-                            winner: null,
+                            away_score: away_score,
+                            home_score: home_score,
+                            winner: away_score > home_score ? awayTeam :
+                                   (away_score < home_score ? homeTeam : 'draw'),
                             broadcast: broadcast,
                             category: category,
-                            state: '경기취소'
+                            state: state
                         });
                     }
+                } else if (state === '경기취소' || scoreOrStatus === '취소') {
+                    // 취소된 경기
+                    games.push({
+                        date: currentDate,
+                        time: time,
+                        stadium: stadium,
+                        away_team: awayTeam,
+                        home_team: homeTeam,
+                        away_score: 0,
+                        home_score: 0,
+                        winner: null,
+                        broadcast: broadcast,
+                        category: category,
+                        state: '경기취소'
+                    });
                 }
             }
         }
     }
     
     // JSON 파일로 저장
-    const outputPath = path.join(__dirname, '../data/2025-season-games.json');
-    fs.writeFileSync(outputPath, JSON.stringify(games, null, 2), 'utf-8');
+    const outputPath = pathManager.getSeasonDataFile('season-games.json');
+    writeJson(outputPath, games);
     
     console.log(`✅ ${games.length}개의 경기 데이터를 파싱했습니다.`);
     console.log(`📁 저장 위치: ${outputPath}`);
@@ -135,8 +151,8 @@ function parseSeasonData() {
     });
     
     // 팀 통계 저장
-    const statsPath = path.join(__dirname, '../data/2025-team-stats.json');
-    fs.writeFileSync(statsPath, JSON.stringify(teamStats, null, 2), 'utf-8');
+    const statsPath = pathManager.getSeasonDataFile('team-stats.json');
+    writeJson(statsPath, teamStats);
     console.log(`📊 팀별 통계 저장: ${statsPath}`);
     
     return { games, teamStats };
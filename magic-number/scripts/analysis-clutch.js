@@ -6,6 +6,7 @@
 const fs = require('fs');
 const path = require('path');
 const CommonUtils = require('../config/common-utils');
+const { writeJson } = require('../config/json-writer');
 
 class ClutchAnalyzer {
     constructor() {
@@ -198,7 +199,7 @@ class ClutchAnalyzer {
         };
 
         const outputPath = path.join(__dirname, '../data/analysis-clutch.json');
-        fs.writeFileSync(outputPath, JSON.stringify(result, null, 2), 'utf8');
+        writeJson(outputPath, result);
         console.log('✅ 클러치 분석 결과 저장 완료:', outputPath);
     }
 
@@ -7,6 +7,7 @@ const fs = require('fs');
 const path = require('path');
 const { StadiumHelper } = require('../config/stadium-mapping');
 const CommonUtils = require('../config/common-utils');
+const { writeJson } = require('../config/json-writer');
 
 class HomeAwayAnalyzer {
     constructor() {
@@ -225,7 +226,7 @@ class HomeAwayAnalyzer {
         };
 
         const outputPath = path.join(__dirname, '../data/analysis-home-away.json');
-        fs.writeFileSync(outputPath, JSON.stringify(result, null, 2), 'utf8');
+        writeJson(outputPath, result);
         console.log('✅ 홈/원정 분석 결과 저장 완료:', outputPath);
     }
 
@@ -1,15 +1,17 @@
 const fs = require('fs');
 const path = require('path');
+const pathManager = require('../../config/paths');
 const CommonUtils = require('../config/common-utils');
+const { writeJson } = require('../config/json-writer');
 
 function generateMonthlyRecords() {
     console.log('📅 월별 기록 분석 시작...');
     
     try {
         // 게임 데이터 로드
-        const gamesPath = path.join(__dirname, '../data/2025-season-games.json');
+        const gamesPath = pathManager.getSeasonDataFile('season-games.json');
         if (!fs.existsSync(gamesPath)) {
-            console.error('❌ 2025-season-games.json 파일을 찾을 수 없습니다.');
+            console.error(`❌ ${path.basename(gamesPath)} 파일을 찾을 수 없습니다.`);
             return;
         }
         
@@ -109,7 +111,7 @@ function generateMonthlyRecords() {
         
         // JSON 파일로 저장
         const outputPath = path.join(__dirname, '../data/analysis-monthly.json');
-        fs.writeFileSync(outputPath, JSON.stringify(result, null, 2));
+        writeJson(outputPath, result);
         
         console.log(`✅ 월별 기록 분석 완료: ${outputPath}`);
         console.log(`📊 처리된 경기 수: ${games.length}개`);
@@ -6,6 +6,7 @@
 const fs = require('fs');
 const path = require('path');
 const CommonUtils = require('../config/common-utils');
+const { writeJson } = require('../config/json-writer');
 
 class SeriesAnalyzer {
     constructor() {
@@ -470,7 +471,7 @@ class SeriesAnalyzer {
 
         // 결과 저장
         const outputPath = path.join(__dirname, '../data/analysis-series.json');
-        fs.writeFileSync(outputPath, JSON.stringify(analysisResult, null, 2), 'utf8');
+        writeJson(outputPath, analysisResult);
 
         console.log('✅ 시리즈 분석 완료!');
         console.log(`📊 분석 결과: ${outputPath}`);
@@ -6,6 +6,7 @@
 const fs = require('fs');
 const path = require('path');
 const CommonUtils = require('../config/common-utils');
+const { writeJson } = require('../config/json-writer');
 
 class WeeklyAnalyzer {
     constructor() {
@@ -364,7 +365,7 @@ class WeeklyAnalyzer {
         };
 
         const outputPath = path.join(__dirname, '../data/analysis-weekly.json');
-        fs.writeFileSync(outputPath, JSON.stringify(result, null, 2), 'utf8');
+        writeJson(outputPath, result);
         console.log('✅ 주차별 분석 결과 저장 완료:', outputPath);
     }
 
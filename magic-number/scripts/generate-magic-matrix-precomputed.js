@@ -7,6 +7,7 @@
 
 const fs = require('fs');
 const path = require('path');
+const { writeJson } = require('../config/json-writer');
 
 // 기존 매직넘버 데이터 로드
 function loadMagicNumberData() {
@@ -364,7 +365,7 @@ function generateMagicMatrixPrecomputed() {
 
     // 파일 저장
     const outputPath = 'magic-number/data/ui-magic-matrix-precomputed.json';
-    fs.writeFileSync(outputPath, JSON.stringify(result, null, 2));
+    writeJson(outputPath, result);
 
     console.log('✅ 매직넘버 매트릭스 사전 계산 완료');
     console.log(`📁 저장 위치: ${outputPath}`);
@@ -1,11 +1,13 @@
 #!/usr/bin/env node
 /**
  * raw-game-records.json 생성기
- * 2025-season-games.json에서 루트 index.html이 필요로 하는 형태로 변환
+ * {시즌}-season-games.json에서 루트 index.html이 필요로 하는 형태로 변환
  */
 
 const fs = require('fs');
 const path = require('path');
+const pathManager = require('../../config/paths');
+const { writeJson } = require('../config/json-writer');
 
 class RawGameRecordsGenerator {
     constructor() {
@@ -72,10 +74,10 @@ class RawGameRecordsGenerator {
 
     generateRawGameRecords() {
         try {
-            // 2025-season-data-clean.txt 파일에서 직접 파싱
-            const cleanDataPath = path.join(__dirname, '../data/2025-season-data-clean.txt');
+            // {시즌}-season-data-clean.txt 파일에서 직접 파싱
+            const cleanDataPath = pathManager.getSeasonDataFile('season-data-clean.txt');
             if (!fs.existsSync(cleanDataPath)) {
-                console.error('❌ 2025-season-data-clean.txt 파일을 찾을 수 없습니다.');
+                console.error(`❌ ${path.basename(cleanDataPath)} 파일을 찾을 수 없습니다.`);
                 return;
             }
 
@@ -190,7 +192,7 @@ class RawGameRecordsGenerator {
 
             // JSON 파일로 저장
             const outputPath = path.join(__dirname, '../data/raw-game-records.json');
-            fs.writeFileSync(outputPath, JSON.stringify(teamGameRecords, null, 2));
+            writeJson(outputPath, teamGameRecords);
             
             console.log(`✅ raw-game-records.json 생성 완료: ${outputPath}`);
             
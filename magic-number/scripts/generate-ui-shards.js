@@ -0,0 +1,120 @@
+#!/usr/bin/env node
+
+/**
+ * UI 데이터 분할(shard) 생성 스크립트
+ * - 통합 파일에서 첫 화면에 필요한 부분만 공통(common) 파일로 잘라 data/shards/에 저장
+ *   (stats-comprehensive.json → stats/common.json: 순위표 등 리그 전체 표만, 팀별 맵 제외)
+ * - 읽는 화면이 있는 분할 파일만 생성 - 매직넘버 매트릭스/주차별 화면은 모든 팀 데이터를 한 번에 쓰므로 통합 파일 사용
+ * - shards/manifest.json에 파일별 해시와 크기를 기록 - UI는 ?v=해시로 요청해 바뀌지 않은 파일은 캐시 사용
+ */
+
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
+const { writeJson, compactPathFor } = require('../config/json-writer');
+
+const DATA_DIR = path.join(__dirname, '../data');
+const SHARD_DIR = path.join(DATA_DIR, 'shards');
+// 2: 팀별/월별 분할 파일 제거
+const MANIFEST_VERSION = 2;
+
+const TEAMS = ['한화', 'LG', '롯데', 'SSG', 'KT', 'KIA', '삼성', 'NC', '두산', '키움'];
+
+/**
+ * { 팀: 값 } 형태의 객체인지 - 키가 모두 팀 이름
+ */
+function isTeamMap(value) {
+    if (!value || typeof value !== 'object' || Array.isArray(value)) return false;
+    const keys = Object.keys(value);
+    return keys.length > 0 && keys.every(key => TEAMS.includes(key));
+}
+
+/**
+ * stats-comprehensive.json → 시각 + 리그 전체 표(순위 등)
+ * 팀별 맵(월별/요일별/구장별/시리즈/상대전적)과 순위 행의 최근 경기 목록(recentGames)은 제외
+ */
+function statsCommon(stats) {
+    const common = {};
+    for (const [key, value] of Object.entries(stats)) {
+        if (isTeamMap(value)) continue;
+        common[key] = key === 'standings' && Array.isArray(value)
+            ? value.map(({ recentGames, ...row }) => row)
+            : value;
+    }
+    return common;
+}
+
+const SOURCES = [
+    { name: 'stats', file: 'stats-comprehensive.json', common: statsCommon }
+];
+
+/**
+ * 분할 파일 저장 후 매니페스트 항목 { sha256, bytes } 반환
+ */
+function writeShard(relativePath, data) {
+    const filePath = path.join(SHARD_DIR, relativePath);
+    writeJson(filePath, data);
+    const buffer = fs.readFileSync(filePath);
+    return {
+        sha256: crypto.createHash('sha256').update(buffer).digest('hex').slice(0, 16),
+        bytes: buffer.length
+    };
+}
+
+/**
+ * 이번 실행에서 만들지 않은 분할 파일(이전 버전의 팀별/월별 파일, 이전 압축본) 삭제
+ */
+function removeStaleShards(keep, dir = SHARD_DIR) {
+    if (!fs.existsSync(dir)) return 0;
+    let removed = 0;
+    for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+        const entryPath = path.join(dir, entry.name);
+        if (entry.isDirectory()) {
+            removed += removeStaleShards(keep, entryPath);
+            if (fs.readdirSync(entryPath).length === 0) fs.rmdirSync(entryPath);
+        } else if (/\.json(\.gz|\.br)?$/.test(entry.name) && !keep.has(entryPath)) {
+            fs.unlinkSync(entryPath);
+            removed++;
+        }
+    }
+    return removed;
+}
+
+function generateUiShards() {
+    const manifest = { version: MANIFEST_VERSION, sources: {}, files: {} };
+
+    for (const source of SOURCES) {
+        const sourcePath = path.join(DATA_DIR, source.file);
+        if (!fs.existsSync(sourcePath)) {
+            console.log(`⚠️ ${source.file} 없음 - 건너뜀`);
+            continue;
+        }
+        const entry = { source: source.file, common: `${source.name}/common.json` };
+        manifest.files[entry.common] = writeShard(entry.common, source.common(JSON.parse(fs.readFileSync(sourcePath, 'utf8'))));
+        manifest.sources[source.name] = entry;
+    }
+
+    const manifestPath = path.join(SHARD_DIR, 'manifest.json');
+    writeJson(manifestPath, manifest);
+
+    const keep = new Set();
+    for (const file of [...Object.keys(manifest.files).map(file => path.join(SHARD_DIR, file)), manifestPath]) {
+        for (const base of [file, compactPathFor(file)]) {
+            keep.add(base).add(`${base}.gz`).add(`${base}.br`);
+        }
+    }
+    const removed = removeStaleShards(keep);
+
+    const totalBytes = Object.values(manifest.files).reduce((sum, file) => sum + file.bytes, 0);
+    console.log('✅ UI 분할 데이터 생성 완료');
+    console.log(`📁 저장 위치: ${SHARD_DIR}`);
+    console.log(`📊 분할 파일 ${Object.keys(manifest.files).length}개 (${(totalBytes / 1024).toFixed(1)}KB), 삭제 ${removed}개`);
+    return manifest;
+}
+
+// 실행
+if (require.main === module) {
+    generateUiShards();
+}
+
+module.exports = { generateUiShards };
@@ -1,8 +1,9 @@
 const fs = require('fs');
 const path = require('path');
+const pathManager = require('../../config/paths');
 
 function removeDuplicates() {
-    const dataPath = path.join(__dirname, '../data/2025-season-data-clean.txt');
+    const dataPath = pathManager.getSeasonDataFile('season-data-clean.txt');
     const data = fs.readFileSync(dataPath, 'utf-8');
     const lines = data.split('\n');
 
@@ -1,21 +1,22 @@
 #!/usr/bin/env node
 
 /**
- * 2025-season-data-clean.txt 파일을 날짜순으로 정렬
+ * {시즌}-season-data-clean.txt 파일을 날짜순으로 정렬
  * 완료 경기와 취소 경기를 날짜별로 통합
  */
 
 const fs = require('fs');
 const path = require('path');
+const pathManager = require('../../config/paths');
 
 function sortSeasonData() {
-    const dataPath = path.join(__dirname, '../data/2025-season-data-clean.txt');
-    const backupPath = path.join(__dirname, '../data/2025-season-data-clean.txt.backup');
+    const dataPath = pathManager.getSeasonDataFile('season-data-clean.txt');
+    const backupPath = pathManager.getSeasonDataFile('season-data-clean.txt.backup');
     
     // 백업 생성
     const data = fs.readFileSync(dataPath, 'utf-8');
     fs.writeFileSync(backupPath, data, 'utf-8');
-    console.log('📁 백업 파일 생성: 2025-season-data-clean.txt.backup');
+    console.log(`📁 백업 파일 생성: ${path.basename(backupPath)}`);
     
     const lines = data.split('\n');
     const gamesByDate = {};
@@ -1,7 +1,9 @@
 const fs = require('fs');
 const path = require('path');
+const pathManager = require('../../config/paths');
 const { StadiumHelper } = require('../config/stadium-mapping');
 const CommonUtils = require('../config/common-utils');
+const { writeJson } = require('../config/json-writer');
 
 class EnhancedDashboardGenerator {
     constructor() {
@@ -11,8 +13,8 @@ class EnhancedDashboardGenerator {
 
     async loadGames() {
         try {
-            // 2025-season-games.json 파일 로드
-            const gamesPath = path.join(__dirname, '../data/2025-season-games.json');
+            // {시즌}-season-games.json 파일 로드
+            const gamesPath = pathManager.getSeasonDataFile('season-games.json');
             if (!fs.existsSync(gamesPath)) {
                 // 파일이 없으면 season-data-parser로 생성
                 const { parseSeasonData } = require('./03_season-data-parser');
@@ -96,7 +98,7 @@ class EnhancedDashboardGenerator {
         
         // JSON 파일로 저장
         const outputPath = path.join(__dirname, '../data/stats-comprehensive.json');
-        fs.writeFileSync(outputPath, JSON.stringify(dashboard, null, 2));
+        writeJson(outputPath, dashboard);
         console.log(`📊 Enhanced 대시보드 데이터 생성: ${outputPath}`);
         
         return dashboard;
@@ -758,7 +760,7 @@ class EnhancedDashboardGenerator {
 
     getRunAnalysis() {
         try {
-            const statsPath = path.join(__dirname, '../data/2025-team-stats.json');
+            const statsPath = pathManager.getSeasonDataFile('team-stats.json');
             if (fs.existsSync(statsPath)) {
                 const stats = JSON.parse(fs.readFileSync(statsPath, 'utf8'));
                 return Object.values(stats)
@@ -780,9 +782,9 @@ class EnhancedDashboardGenerator {
     }
 
     getVsLevelAnalysis() {
-        // 2025-team-stats.json에서 가져오기
+        // {시즌}-team-stats.json에서 가져오기
         try {
-            const statsPath = path.join(__dirname, '../data/2025-team-stats.json');
+            const statsPath = pathManager.getSeasonDataFile('team-stats.json');
             if (fs.existsSync(statsPath)) {
                 const stats = JSON.parse(fs.readFileSync(statsPath, 'utf8'));
                 return Object.values(stats).map(team => ({
@@ -803,7 +805,7 @@ class EnhancedDashboardGenerator {
 
     getSpecialSituations() {
         try {
-            const statsPath = path.join(__dirname, '../data/2025-team-stats.json');
+            const statsPath = pathManager.getSeasonDataFile('team-stats.json');
             if (fs.existsSync(statsPath)) {
                 const stats = JSON.parse(fs.readFileSync(statsPath, 'utf8'));
                 return Object.values(stats).map(team => ({
@@ -839,7 +841,7 @@ class EnhancedDashboardGenerator {
 
     getTeamSummaries() {
         try {
-            const statsPath = path.join(__dirname, '../data/2025-team-stats.json');
+            const statsPath = pathManager.getSeasonDataFile('team-stats.json');
             if (fs.existsSync(statsPath)) {
                 const teams = JSON.parse(fs.readFileSync(statsPath, 'utf8'));
                 const sortedTeams = Object.values(teams).sort((a, b) => parseFloat(b.win_rate) - parseFloat(a.win_rate));
@@ -925,4 +927,4 @@ if (require.main === module) {
     main();
 }
 
-module.exports = { EnhancedDashboardGenerator };
+module.exports = { EnhancedDashboardGenerator, main };
@@ -140,7 +140,7 @@ class PathValidator {
             'calc-standings.json',
             'calc-head-to-head.json',
             'calc-magic-numbers.json',
-            '2025-season-data-clean.txt'
+            path.basename(pathManager.getSeasonDataFile('season-data-clean.txt'))
         ];
 
         dataFiles.forEach(filename => {
@@ -437,97 +437,105 @@ const kboTeams = {
             }
         }
 
+        // 순위표 데이터 요청 - 분할 데이터(stats/common: 순위표 등 리그 전체 표만)가 있으면 우선 사용
+        async function fetchStatsData(dataUrl) {
+            const shard = window.KBOShards ? await window.KBOShards.load('stats') : null;
+            if (shard) {
+                return shard;
+            }
+
+            const response = await fetch(dataUrl, {
+                cache: 'no-cache',
+                headers: {
+                    'Cache-Control': 'no-cache, no-store, must-revalidate',
+                    'Pragma': 'no-cache',
+                    'Expires': '0'
+                }
+            });
+            if (!response.ok) {
+                logger.error('❌ 응답 실패:', response.status, response.statusText);
+                throw new Error(`데이터 로딩 실패: ${response.status} ${response.statusText}`);
+            }
+            return response.json();
+        }
+
         // 데이터 로딩 함수
         async function loadKBOData() {
             try {
                 const dataUrl = `data/stats-comprehensive.json?v=${Date.now()}`;
-                // 통합된 stats-comprehensive.json 사용
-                const response = await fetch(dataUrl, {
-                    cache: 'no-cache',
-                    headers: {
-                        'Cache-Control': 'no-cache, no-store, must-revalidate',
-                        'Pragma': 'no-cache',
-                        'Expires': '0'
-                    }
-                });
-                
-                if (response.ok) {
-                    const data = await response.json();
-                    
-                    // 승률 및 KBO 타이브레이커 규정 기반 정렬
-                    const tieNotes = await sortStandingsByWinRateAndHeadToHead(data.standings || []);
-                    
-                    // JSON 데이터 구조를 JavaScript 코드가 기대하는 형태로 변환
-                    const orderedStandings = data.standings || [];
-                    const rankedEntries = [];
-                    let nextRank = 1;
-                    let pointer = 0;
-
-                    while (pointer < orderedStandings.length) {
-                        const baseTeam = orderedStandings[pointer];
-                        const baseWinPct = parseFloat(baseTeam.winRate || baseTeam.winPct || 0);
-                        let groupEnd = pointer + 1;
-
-                        while (groupEnd < orderedStandings.length) {
-                            const compareTeam = orderedStandings[groupEnd];
-                            const compareWinPct = parseFloat(compareTeam.winRate || compareTeam.winPct || 0);
-                            if (!nearlyEqual(baseWinPct, compareWinPct)) {
-                                break;
-                            }
-                            groupEnd += 1;
+                // 분할 데이터가 없으면 통합된 stats-comprehensive.json 사용
+                const data = await fetchStatsData(dataUrl);
+                
+                // 승률 및 KBO 타이브레이커 규정 기반 정렬
+                const tieNotes = await sortStandingsByWinRateAndHeadToHead(data.standings || []);
+                
+                // JSON 데이터 구조를 JavaScript 코드가 기대하는 형태로 변환
+                const orderedStandings = data.standings || [];
+                const rankedEntries = [];
+                let nextRank = 1;
+                let pointer = 0;
+
+                while (pointer < orderedStandings.length) {
+                    const baseTeam = orderedStandings[pointer];
+                    const baseWinPct = parseFloat(baseTeam.winRate || baseTeam.winPct || 0);
+                    let groupEnd = pointer + 1;
+
+                    while (groupEnd < orderedStandings.length) {
+                        const compareTeam = orderedStandings[groupEnd];
+                        const compareWinPct = parseFloat(compareTeam.winRate || compareTeam.winPct || 0);
+                        if (!nearlyEqual(baseWinPct, compareWinPct)) {
+                            break;
                         }
+                        groupEnd += 1;
+                    }
 
-                        const group = orderedStandings.slice(pointer, groupEnd);
-                        const requiresPlayoff = group.some(team => team._tieBreakerMode === 'TIEBREAK_GAME');
+                    const group = orderedStandings.slice(pointer, groupEnd);
+                    const requiresPlayoff = group.some(team => team._tieBreakerMode === 'TIEBREAK_GAME');
 
-                        group.forEach((team, offset) => {
-                            rankedEntries.push({
-                                team,
-                                displayRank: requiresPlayoff ? nextRank : nextRank + offset
-                            });
+                    group.forEach((team, offset) => {
+                        rankedEntries.push({
+                            team,
+                            displayRank: requiresPlayoff ? nextRank : nextRank + offset
                         });
-
-                        nextRank += group.length;
-                        pointer = groupEnd;
-                    }
-
-                    currentStandings = rankedEntries.map(({ team, displayRank }) => {
-                        const winPct = team.winRate || team.winPct || 0;
-                        const tieBreakerNote = tieNotes?.get?.(team.team) ?? null;
-
-                        return {
-                            ...team,
-                            winPct,
-                            displayRank,
-                            recent10: team.recent10 || "5승 0무 5패",
-                            streak: team.streak || "1승",
-                            homeAway: {
-                                home: team.homeRecord || "0-0-0",
-                                away: team.awayRecord || "0-0-0"
-                            },
-                            tieBreakerNote,
-                            tieBreakerMode: team._tieBreakerMode || null
-                        };
                     });
 
-                    orderedStandings.forEach(team => {
-                        delete team._tieBreakerMode;
-                    });
-                    
-                    // currentKBOData에 전체 데이터 저장
-                    currentKBOData = data;
-                    
-                    // 수집된 데이터를 기반으로 잔여경기 일정 업데이트 (레거시 - 사용 안함)
-                    // remainingSchedule = getFilteredRemainingSchedule(data);
-                    
-                    // 데이터 로딩 시간 업데이트
-                    updateLoadingTime(data);
-                    
-                    return data;
-                } else {
-                    logger.error('❌ 응답 실패:', response.status, response.statusText);
-                    throw new Error(`데이터 로딩 실패: ${response.status} ${response.statusText}`);
+                    nextRank += group.length;
+                    pointer = groupEnd;
                 }
+
+                currentStandings = rankedEntries.map(({ team, displayRank }) => {
+                    const winPct = team.winRate || team.winPct || 0;
+                    const tieBreakerNote = tieNotes?.get?.(team.team) ?? null;
+
+                    return {
+                        ...team,
+                        winPct,
+                        displayRank,
+                        recent10: team.recent10 || "5승 0무 5패",
+                        streak: team.streak || "1승",
+                        homeAway: {
+                            home: team.homeRecord || "0-0-0",
+                            away: team.awayRecord || "0-0-0"
+                        },
+                        tieBreakerNote,
+                        tieBreakerMode: team._tieBreakerMode || null
+                    };
+                });
+
+                orderedStandings.forEach(team => {
+                    delete team._tieBreakerMode;
+                });
+                
+                // currentKBOData에 전체 데이터 저장
+                currentKBOData = data;
+                
+                // 수집된 데이터를 기반으로 잔여경기 일정 업데이트 (레거시 - 사용 안함)
+                // remainingSchedule = getFilteredRemainingSchedule(data);
+                
+                // 데이터 로딩 시간 업데이트
+                updateLoadingTime(data);
+                
+                return data;
             } catch (error) {
                 logger.error('❌ loadKBOData 에러 상세:', error);
                 
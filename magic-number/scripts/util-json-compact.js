@@ -0,0 +1,125 @@
+/**
+ * KBO 데이터 JSON 스키마 압축 인코딩 (kbo-compact/1)
+ * - 키 구성이 같은 객체 배열 → { $c: [키...], $r: [[값...]...] } 컬럼 테이블
+ * - 테이블 컬럼 값이 모두 팀 이름이면 팀 번호(teams 인덱스)로 바꾸고 $t에 컬럼 번호 기록
+ * - 결과는 { $schema, teams, data } 봉투 - decode로 원래 JSON과 같은 값으로 복원
+ * Node(json-writer.js)와 브라우저(window.KBOJsonCompact) 양쪽에서 사용
+ */
+
+(function (root, factory) {
+    const codec = factory();
+    if (typeof module === 'object' && module.exports) {
+        module.exports = codec;
+    } else {
+        root.KBOJsonCompact = codec;
+    }
+})(typeof self !== 'undefined' ? self : this, function () {
+    const SCHEMA = 'kbo-compact/1';
+    const TEAMS = ['한화', 'LG', '롯데', 'SSG', 'KT', 'KIA', '삼성', 'NC', '두산', '키움'];
+    // 이보다 짧은 배열은 키 목록이 오히려 더 큼
+    const MIN_TABLE_ROWS = 2;
+
+    function isPlainObject(value) {
+        return value !== null && typeof value === 'object' && !Array.isArray(value);
+    }
+
+    /**
+     * 모든 원소가 같은 순서의 같은 키를 가진 객체면 그 키 목록, 아니면 null
+     */
+    function tableKeys(array) {
+        if (array.length < MIN_TABLE_ROWS || !array.every(isPlainObject)) {
+            return null;
+        }
+        const keys = Object.keys(array[0]);
+        if (keys.length === 0) {
+            return null;
+        }
+        for (const row of array) {
+            const rowKeys = Object.keys(row);
+            if (rowKeys.length !== keys.length || rowKeys.some((key, index) => key !== keys[index])) {
+                return null;
+            }
+        }
+        return keys;
+    }
+
+    function encodeValue(value, teamIds) {
+        if (Array.isArray(value)) {
+            const keys = tableKeys(value);
+            if (!keys) {
+                return value.map(item => encodeValue(item, teamIds));
+            }
+            const teamColumns = keys
+                .map((key, index) => index)
+                .filter(index => value.every(row => teamIds.has(row[keys[index]])));
+            const teamSet = new Set(teamColumns);
+            const table = {
+                $c: keys,
+                $r: value.map(row => keys.map((key, index) => (
+                    teamSet.has(index) ? teamIds.get(row[key]) : encodeValue(row[key], teamIds)
+                )))
+            };
+            if (teamColumns.length > 0) {
+                table.$t = teamColumns;
+            }
+            return table;
+        }
+        if (isPlainObject(value)) {
+            const encoded = {};
+            for (const [key, item] of Object.entries(value)) {
+                encoded[key] = encodeValue(item, teamIds);
+            }
+            return encoded;
+        }
+        return value;
+    }
+
+    function decodeValue(value, teams) {
+        if (Array.isArray(value)) {
+            return value.map(item => decodeValue(item, teams));
+        }
+        if (!isPlainObject(value)) {
+            return value;
+        }
+        if (Array.isArray(value.$c) && Array.isArray(value.$r)) {
+            const keys = value.$c;
+            const teamSet = new Set(value.$t || []);
+            return value.$r.map(cells => {
+                const row = {};
+                keys.forEach((key, index) => {
+                    row[key] = teamSet.has(index) ? teams[cells[index]] : decodeValue(cells[index], teams);
+                });
+                return row;
+            });
+        }
+        const decoded = {};
+        for (const [key, item] of Object.entries(value)) {
+            decoded[key] = decodeValue(item, teams);
+        }
+        return decoded;
+    }
+
+    /**
+     * 일반 JSON 값 → kbo-compact/1 봉투
+     */
+    function encode(data, teams = TEAMS) {
+        const teamIds = new Map(teams.map((team, index) => [team, index]));
+        return { $schema: SCHEMA, teams: teams, data: encodeValue(data, teamIds) };
+    }
+
+    /**
+     * kbo-compact/1 봉투 → 원래 값 (봉투가 아니면 그대로 반환)
+     */
+    function decode(payload) {
+        if (!isCompact(payload)) {
+            return payload;
+        }
+        return decodeValue(payload.data, payload.teams);
+    }
+
+    function isCompact(payload) {
+        return isPlainObject(payload) && payload.$schema === SCHEMA;
+    }
+
+    return { SCHEMA, TEAMS, encode, decode, isCompact };
+});
@@ -0,0 +1,446 @@
+#!/usr/bin/env node
+
+/**
+ * KBO 후처리 파이프라인 오케스트레이터
+ * - 단계마다 입력/출력 파일을 선언하고, 출력 → 입력 관계로 실행 순서(DAG)를 구성
+ * - 서로 의존하지 않는 단계는 worker_threads 풀에서 한 프로세스 안에서 병렬 실행
+ * - 입력 파일 내용 + 스크립트 코드의 해시를 매니페스트(pipeline-manifest.json)에 기록하고,
+ *   해시가 같고 출력도 그대로인 단계는 실행하지 않음 - 출력 파일의 mtime도 유지 (--force로 전체 실행)
+ *
+ * 사용법: node magic-number/scripts/util-pipeline.js [--force] [--workers N] [--list]
+ */
+
+const crypto = require('crypto');
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const util = require('util');
+const { Worker, isMainThread, parentPort } = require('worker_threads');
+const environment = require('../../config/environment');
+const pathManager = require('../../config/paths');
+
+// 시즌: KBO_SEASON 또는 KST 기준 올해 - 워커도 같은 시즌을 쓰도록 메인 스레드에서 고정
+const SEASON = environment.getSeason();
+if (isMainThread) process.env.KBO_SEASON = String(SEASON);
+
+// 모든 경로는 프로젝트 루트 기준 (일부 스크립트가 루트 기준 상대 경로를 사용)
+const data = file => `magic-number/data/${file}`;
+const seasonData = file => data(`${SEASON}-${file}`);
+const script = file => `magic-number/scripts/${file}`;
+const SEASON_FILE = seasonData('season-data-clean.txt');
+const MANIFEST_FILE = data('pipeline-manifest.json');
+// 해시 계산 방식이 바뀌면 올려서 기존 캐시를 무효화
+const CACHE_VERSION = 1;
+const COMMON_UTILS = 'magic-number/config/common-utils.js';
+const STADIUM_MAPPING = 'magic-number/config/stadium-mapping.js';
+const SEASON_SNAPSHOT = 'magic-number/config/season-snapshot.js';
+const STANDINGS_STATE = 'magic-number/config/standings-state.js';
+// 모든 단계가 출력 저장에 사용하는 공용 JSON 저장기 (+ 스키마 압축 인코더)
+const JSON_WRITER = ['magic-number/config/json-writer.js', script('util-json-compact.js')];
+// 출력 형식을 바꾸는 환경 변수 - 값이 바뀌면 캐시 키도 달라짐
+const OUTPUT_ENV = ['KBO_JSON_DEBUG', 'KBO_JSON_PRECOMPRESS', 'KBO_JSON_COMPACT'];
+
+const STEPS = [
+    {
+        name: 'process',
+        script: script('02_season-data-processor.js'),
+        code: [...JSON_WRITER, SEASON_SNAPSHOT, STANDINGS_STATE],
+        inputs: [SEASON_FILE],
+        outputs: [data('calc-standings.json'), data('calc-head-to-head.json')],
+        run: KBODataProcessor => new KBODataProcessor().run()
+    },
+    {
+        name: 'parse-season-data',
+        script: script('03_season-data-parser.js'),
+        code: [...JSON_WRITER, SEASON_SNAPSHOT],
+        inputs: [SEASON_FILE],
+        outputs: [seasonData('season-games.json'), seasonData('team-stats.json')],
+        run: ({ parseSeasonData }) => parseSeasonData()
+    },
+    {
+        name: 'generate-raw-records',
+        script: script('generate-raw-game-records.js'),
+        code: [...JSON_WRITER],
+        inputs: [SEASON_FILE],
+        outputs: [data('raw-game-records.json')],
+        run: ({ RawGameRecordsGenerator }) => new RawGameRecordsGenerator().generateRawGameRecords()
+    },
+    {
+        name: 'weekly-analysis',
+        script: script('analysis-weekly.js'),
+        code: [...JSON_WRITER, COMMON_UTILS],
+        inputs: [data('raw-game-records.json')],
+        outputs: [data('analysis-weekly.json')],
+        run: WeeklyAnalyzer => new WeeklyAnalyzer().analyze()
+    },
+    {
+        name: 'clutch-analysis',
+        script: script('analysis-clutch.js'),
+        code: [...JSON_WRITER, COMMON_UTILS],
+        inputs: [data('raw-game-records.json')],
+        outputs: [data('analysis-clutch.json')],
+        run: ClutchAnalyzer => new ClutchAnalyzer().analyze()
+    },
+    {
+        name: 'home-away-analysis',
+        script: script('analysis-home-away.js'),
+        code: [...JSON_WRITER, COMMON_UTILS, STADIUM_MAPPING],
+        inputs: [data('raw-game-records.json')],
+        outputs: [data('analysis-home-away.json')],
+        run: HomeAwayAnalyzer => new HomeAwayAnalyzer().analyze()
+    },
+    {
+        name: 'series-analysis',
+        script: script('analysis-series.js'),
+        code: [...JSON_WRITER, COMMON_UTILS],
+        inputs: [data('raw-game-records.json')],
+        outputs: [data('analysis-series.json')],
+        run: SeriesAnalyzer => new SeriesAnalyzer().analyze()
+    },
+    {
+        name: 'monthly-analysis',
+        script: script('analysis-monthly.js'),
+        code: [...JSON_WRITER, COMMON_UTILS],
+        inputs: [seasonData('season-games.json')],
+        outputs: [data('analysis-monthly.json')],
+        run: ({ generateMonthlyRecords }) => generateMonthlyRecords()
+    },
+    {
+        name: 'weekday-analysis',
+        script: script('analysis-weekday.js'),
+        code: [...JSON_WRITER, COMMON_UTILS],
+        inputs: [seasonData('season-games.json')],
+        outputs: [data('analysis-weekday.json')],
+        run: ({ generateWeekdayRecords }) => generateWeekdayRecords()
+    },
+    {
+        name: 'enhanced-dashboard',
+        script: script('stats-comprehensive-generator.js'),
+        code: [...JSON_WRITER, COMMON_UTILS, STADIUM_MAPPING, script('03_season-data-parser.js'), SEASON_SNAPSHOT],
+        inputs: [seasonData('season-games.json'), seasonData('team-stats.json'), data('raw-game-records.json'), data('analysis-series.json')],
+        outputs: [data('stats-comprehensive.json')],
+        run: ({ main }) => main()
+    },
+    {
+        name: 'rank-matrix',
+        script: script('01_magic-number-calculator.js'),
+        code: [...JSON_WRITER],
+        inputs: [data('stats-comprehensive.json')],
+        outputs: [data('calc-magic-numbers.json')],
+        run: ({ main }) => main()
+    },
+    {
+        name: 'precompute-matrix',
+        script: script('generate-magic-matrix-precomputed.js'),
+        code: [...JSON_WRITER],
+        inputs: [data('calc-magic-numbers.json')],
+        outputs: [data('ui-magic-matrix-precomputed.json')],
+        run: ({ generateMagicMatrixPrecomputed }) => generateMagicMatrixPrecomputed()
+    },
+    {
+        name: 'precompute-ui',
+        script: 'scripts/generate-ui-precomputed-data.js',
+        code: [...JSON_WRITER],
+        inputs: [data('raw-game-records.json'), data('calc-standings.json'), seasonData('season-games.json')],
+        outputs: ['data/ui-precomputed-data.json'],
+        run: ({ generatePrecomputedData }) => generatePrecomputedData()
+    },
+    {
+        name: 'shard-ui',
+        script: script('generate-ui-shards.js'),
+        code: [...JSON_WRITER],
+        inputs: [data('stats-comprehensive.json')],
+        outputs: [data('shards/manifest.json')],
+        // 분할 파일 목록은 매니페스트에 기록 - 적힌 파일도 출력으로 확인
+        listOutputs: () => manifestFiles(data('shards/manifest.json'), file => data(`shards/${file}`)),
+        run: ({ generateUiShards }) => generateUiShards()
+    }
+];
+
+/**
+ * 단계별 선행 단계 목록 - 다른 단계의 출력을 입력으로 쓰면 그 단계에 의존
+ */
+function buildGraph(steps = STEPS) {
+    const producers = {};
+    for (const step of steps) {
+        for (const output of step.outputs) {
+            if (producers[output]) {
+                throw new Error(`출력 파일이 두 단계에서 생성됨: ${output} (${producers[output]}, ${step.name})`);
+            }
+            producers[output] = step.name;
+        }
+    }
+
+    const deps = {};
+    for (const step of steps) {
+        deps[step.name] = [...new Set(step.inputs.map(input => producers[input]).filter(Boolean))];
+    }
+
+    // 순환 검사
+    const state = {};
+    const visit = name => {
+        if (state[name] === 'done') return;
+        if (state[name] === 'visiting') throw new Error(`파이프라인 순환 의존: ${name}`);
+        state[name] = 'visiting';
+        deps[name].forEach(visit);
+        state[name] = 'done';
+    };
+    steps.forEach(step => visit(step.name));
+    return deps;
+}
+
+function hashFile(file) {
+    try {
+        return crypto.createHash('sha256').update(fs.readFileSync(path.resolve(pathManager.projectRoot, file))).digest('hex');
+    } catch (error) {
+        return null;
+    }
+}
+
+/**
+ * 캐시 키 - 입력 파일과 단계 코드(스크립트 + 공용 모듈)의 내용 해시 + 출력 형식 환경 변수
+ * 입력이나 코드 파일이 없으면 null (항상 실행)
+ */
+function stepKey(step) {
+    const files = [...step.inputs, step.script, ...(step.code || [])];
+    const hashes = files.map(hashFile);
+    if (hashes.some(hash => hash === null)) return null;
+    const outputEnv = OUTPUT_ENV.map(name => process.env[name] || '');
+    const payload = JSON.stringify([CACHE_VERSION, step.name, files, hashes, outputEnv]);
+    return crypto.createHash('sha256').update(payload).digest('hex');
+}
+
+/**
+ * 매니페스트(files 키)에 적힌 파일 경로 목록 - 매니페스트가 없거나 손상되면 빈 목록
+ */
+function manifestFiles(manifestPath, toPath) {
+    try {
+        const manifest = JSON.parse(fs.readFileSync(path.resolve(pathManager.projectRoot, manifestPath), 'utf8'));
+        return Object.keys(manifest.files || {}).map(toPath);
+    } catch (error) {
+        return [];
+    }
+}
+
+/**
+ * 선언된 출력 + listOutputs가 돌려주는 출력(실행마다 달라지는 파일 목록)
+ */
+function stepOutputs(step) {
+    return [...step.outputs, ...(step.listOutputs ? step.listOutputs() : [])];
+}
+
+function outputHashes(step) {
+    const hashes = {};
+    stepOutputs(step).forEach(output => { hashes[output] = hashFile(output); });
+    return hashes;
+}
+
+function loadManifest() {
+    try {
+        const manifest = JSON.parse(fs.readFileSync(path.resolve(pathManager.projectRoot, MANIFEST_FILE), 'utf8'));
+        if (manifest.version === CACHE_VERSION && manifest.steps) return manifest;
+    } catch (error) {
+        // 없거나 손상된 매니페스트는 빈 캐시로 시작
+    }
+    return { version: CACHE_VERSION, steps: {} };
+}
+
+/**
+ * 매니페스트 저장 - 내용이 같으면 쓰지 않음 (mtime/커밋 변화 없음)
+ */
+function saveManifest(manifest) {
+    const target = path.resolve(pathManager.projectRoot, MANIFEST_FILE);
+    const steps = {};
+    Object.keys(manifest.steps).sort().forEach(name => { steps[name] = manifest.steps[name]; });
+    const content = JSON.stringify({ version: CACHE_VERSION, steps }, null, 2) + '\n';
+    if (fs.existsSync(target) && fs.readFileSync(target, 'utf8') === content) return false;
+    const tmp = path.join(path.dirname(target), `.${path.basename(target)}.tmp`);
+    fs.writeFileSync(tmp, content, 'utf8');
+    fs.renameSync(tmp, target);
+    return true;
+}
+
+/**
+ * 키가 매니페스트와 같고 출력 파일도 기록된 내용 그대로면 true
+ * (기록된 출력과 현재 출력 목록 중 하나라도 없거나 바뀌었으면 false)
+ */
+function isCached(step, key, manifest) {
+    const entry = manifest.steps[step.name];
+    if (!key || !entry || entry.key !== key) return false;
+    const current = outputHashes(step);
+    const outputs = new Set([...Object.keys(entry.outputs), ...Object.keys(current)]);
+    return [...outputs].every(output => current[output] && current[output] === entry.outputs[output]);
+}
+
+/**
+ * 워커 스레드 - 단계 이름을 받아 해당 스크립트를 require 하고 실행
+ */
+function runWorker() {
+    let current = null;
+    // 병렬 실행 중 섞이는 출력을 구분할 수 있도록 모든 줄에 단계 이름 표시
+    for (const level of ['log', 'info', 'warn', 'error']) {
+        const original = console[level].bind(console);
+        console[level] = (...args) => original(util.format(...args).split('\n').map(line => `[${current}] ${line}`).join('\n'));
+    }
+
+    parentPort.on('message', async name => {
+        current = name;
+        const step = STEPS.find(item => item.name === name);
+        const started = Date.now();
+        try {
+            const mod = require(path.resolve(pathManager.projectRoot, step.script));
+            await step.run(mod);
+            parentPort.postMessage({ name, ok: true, ms: Date.now() - started });
+        } catch (error) {
+            parentPort.postMessage({ name, ok: false, error: error.stack || String(error), ms: Date.now() - started });
+        }
+    });
+}
+
+/**
+ * DAG 실행 - 의존 단계가 끝난 단계부터 워커 풀에 배정
+ * @returns {Promise<Object>} 단계별 { status: 'ran' | 'skipped' | 'failed' | 'blocked', ms }
+ */
+async function runPipeline({ force = false, workers } = {}) {
+    const deps = buildGraph();
+    const poolSize = Math.max(1, workers || Number(process.env.KBO_PIPELINE_WORKERS) || Math.min(4, os.cpus().length));
+    process.chdir(pathManager.projectRoot);
+
+    const manifest = loadManifest();
+    const keys = {};
+    const results = {};
+    const pending = new Set(STEPS.map(step => step.name));
+    const idle = [];
+    const allWorkers = [];
+    let running = 0;
+
+    console.log(`🧩 후처리 파이프라인: ${SEASON} 시즌 ${STEPS.length}단계, 워커 ${poolSize}개${force ? ' (강제 실행)' : ''}`);
+
+    return new Promise(resolve => {
+        const finish = () => {
+            allWorkers.forEach(worker => worker.terminate());
+            saveManifest(manifest);
+            resolve(results);
+        };
+
+        const createWorker = () => {
+            const worker = new Worker(__filename);
+            worker.currentStep = null;
+            worker.on('message', message => {
+                worker.currentStep = null;
+                complete(message.name, message.ok ? 'ran' : 'failed', message.ms, message.error);
+                idle.push(worker);
+                schedule();
+            });
+            worker.on('exit', code => {
+                // 스크립트가 process.exit()로 워커를 끝낸 경우
+                allWorkers.splice(allWorkers.indexOf(worker), 1);
+                const idleIndex = idle.indexOf(worker);
+                if (idleIndex !== -1) idle.splice(idleIndex, 1);
+                if (worker.currentStep) {
+                    const name = worker.currentStep;
+                    worker.currentStep = null;
+                    complete(name, code === 0 ? 'ran' : 'failed', null, `워커 종료 코드 ${code}`);
+                    schedule();
+                }
+            });
+            allWorkers.push(worker);
+            return worker;
+        };
+
+        const complete = (name, status, ms, error) => {
+            running--;
+            results[name] = { status, ms };
+            const step = STEPS.find(item => item.name === name);
+            if (status === 'ran' && keys[name]) {
+                manifest.steps[name] = { key: keys[name], outputs: outputHashes(step) };
+            } else {
+                delete manifest.steps[name];
+            }
+            if (status === 'failed') {
+                console.error(`❌ ${name} 실패${error ? `:\n${error}` : ''}`);
+            } else {
+                console.log(`✅ ${name} 완료 (${ms}ms)`);
+            }
+        };
+
+        const schedule = () => {
+            let progressed = true;
+            while (progressed) {
+                progressed = false;
+                for (const name of [...pending]) {
+                    const depStatus = deps[name].map(dep => results[dep] && results[dep].status);
+                    if (depStatus.some(status => status === 'failed' || status === 'blocked')) {
+                        pending.delete(name);
+                        results[name] = { status: 'blocked', ms: 0 };
+                        console.log(`⛔ ${name} 건너뜀 - 선행 단계 실패`);
+                        progressed = true;
+                        continue;
+                    }
+                    if (depStatus.some(status => status === undefined)) continue;
+
+                    const step = STEPS.find(item => item.name === name);
+                    // 선행 단계가 모두 끝난 뒤의 입력으로 키 계산
+                    if (!(name in keys)) keys[name] = stepKey(step);
+                    if (!force && isCached(step, keys[name], manifest)) {
+                        pending.delete(name);
+                        results[name] = { status: 'skipped', ms: 0 };
+                        console.log(`⏭️ ${name} 입력/코드 변경 없음 - 건너뜀`);
+                        progressed = true;
+                        continue;
+                    }
+
+                    if (running >= poolSize) continue;
+                    const worker = idle.pop() || createWorker();
+                    pending.delete(name);
+                    running++;
+                    worker.currentStep = name;
+                    console.log(`▶️ ${name} 시작`);
+                    worker.postMessage(name);
+                    progressed = true;
+                }
+            }
+            if (pending.size === 0 && running === 0) {
+                finish();
+            }
+        };
+
+        schedule();
+    });
+}
+
+function printSummary(results, elapsedMs) {
+    const counts = { ran: 0, skipped: 0, failed: 0, blocked: 0 };
+    Object.values(results).forEach(result => counts[result.status]++);
+    console.log(`\n📋 파이프라인 완료 (${elapsedMs}ms): 실행 ${counts.ran} / 건너뜀 ${counts.skipped} / 실패 ${counts.failed} / 차단 ${counts.blocked}`);
+}
+
+async function main(argv = process.argv.slice(2)) {
+    const force = argv.includes('--force');
+    const workersIndex = argv.indexOf('--workers');
+    const workers = workersIndex !== -1 ? Number(argv[workersIndex + 1]) : undefined;
+
+    if (argv.includes('--list')) {
+        const deps = buildGraph();
+        STEPS.forEach(step => console.log(`${step.name} ← ${deps[step.name].join(', ') || '(시즌 데이터)'}`));
+        return 0;
+    }
+
+    if (!fs.existsSync(path.resolve(pathManager.projectRoot, SEASON_FILE))) {
+        console.error(`❌ 시즌 파일 없음: ${SEASON_FILE} (KBO_SEASON 확인 또는 먼저 크롤링)`);
+        return 1;
+    }
+
+    const started = Date.now();
+    const results = await runPipeline({ force, workers });
+    printSummary(results, Date.now() - started);
+    return Object.values(results).some(result => result.status !== 'ran' && result.status !== 'skipped') ? 1 : 0;
+}
+
+if (!isMainThread) {
+    runWorker();
+} else if (require.main === module) {
+    main().then(code => process.exit(code));
+}
+
+module.exports = { STEPS, buildGraph, stepKey, isCached, loadManifest, runPipeline };
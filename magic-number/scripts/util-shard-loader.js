@@ -0,0 +1,45 @@
+/**
+ * UI 분할 데이터(shard) 로더
+ * - data/shards/manifest.json을 한 번 받아(재검증) 필요한 분할 파일만 ?v=해시로 요청
+ * - 내용이 바뀌지 않은 분할 파일은 URL이 같아 브라우저 캐시를 그대로 사용
+ * - 매니페스트나 분할 파일이 없으면 null → 호출 쪽에서 통합 파일로 대체
+ *
+ * 사용: await KBOShards.load('stats') - stats-comprehensive.json의 공통(common) 분할 파일
+ */
+
+const KBOShards = (() => {
+    const BASE_URL = 'data/shards/';
+    let manifestPromise = null;
+    const shardPromises = new Map();
+
+    function loadManifest() {
+        if (!manifestPromise) {
+            manifestPromise = fetch(`${BASE_URL}manifest.json`, { cache: 'no-cache' })
+                .then(response => (response.ok ? response.json() : null))
+                .catch(() => null);
+        }
+        return manifestPromise;
+    }
+
+    async function load(source) {
+        const manifest = await loadManifest();
+        const entry = manifest && manifest.sources && manifest.sources[source];
+        const file = entry && entry.common;
+        const info = file && manifest.files[file];
+        if (!info) return null;
+
+        const url = `${BASE_URL}${file}?v=${info.sha256}`;
+        if (!shardPromises.has(url)) {
+            shardPromises.set(url, fetch(url)
+                .then(response => (response.ok ? response.json() : null))
+                .catch(() => null));
+        }
+        const data = await shardPromises.get(url);
+        if (data === null) shardPromises.delete(url);
+        return data;
+    }
+
+    return { load, loadManifest };
+})();
+
+window.KBOShards = KBOShards;
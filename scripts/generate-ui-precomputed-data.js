@@ -7,13 +7,15 @@
 
 const fs = require('fs');
 const path = require('path');
+const pathManager = require('../config/paths');
+const { writeJson } = require('../magic-number/config/json-writer');
 
 // 기존 데이터 파일들 읽기
 function loadExistingData() {
     try {
         const gameRecords = JSON.parse(fs.readFileSync('magic-number/data/raw-game-records.json', 'utf8'));
         const standings = JSON.parse(fs.readFileSync('magic-number/data/calc-standings.json', 'utf8'));
-        const seasonGames = JSON.parse(fs.readFileSync('magic-number/data/2025-season-games.json', 'utf8'));
+        const seasonGames = JSON.parse(fs.readFileSync(pathManager.getSeasonDataFile('season-games.json'), 'utf8'));
         
         return { gameRecords, standings, seasonGames };
     } catch (error) {
@@ -238,7 +240,7 @@ function generatePrecomputedData() {
 
     // 파일 저장
     const outputPath = 'data/ui-precomputed-data.json';
-    fs.writeFileSync(outputPath, JSON.stringify(result, null, 2));
+    writeJson(outputPath, result);
 
     console.log('✅ UI 사전 계산 데이터 생성 완료');
     console.log(`📁 저장 위치: ${outputPath}`);